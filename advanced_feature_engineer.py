@@ -1,14 +1,30 @@
 import pandas as pd
 import numpy as np
 from src.logger import logger
+from src.config import APPROVED_STATUSES
+from src.oof_aggregates import OutOfFoldAggregator
 
 class AdvancedFeatureEngineering:
     """Advanced feature engineering for better predictions"""
     
-    def __init__(self, df):
+    def __init__(self, df, train_index=None):
         self.df = df.copy()
+        self.train_index = train_index
         self.engineered_features = {}
     
+    def _approval_rate(self, key):
+        """Approval rate by group without a row's own label: out-of-fold on training rows, train-only elsewhere"""
+        approved = self.df['visa_status'].isin(APPROVED_STATUSES).to_numpy(dtype=np.float64)
+        aggregator = OutOfFoldAggregator()
+        if self.train_index is None:
+            return aggregator.fit_transform(self.df[key], approved)
+        
+        train = self.df.index.isin(self.train_index)
+        rate = np.empty(len(self.df))
+        rate[train] = aggregator.fit_transform(self.df.loc[train, key], approved[train])
+        rate[~train] = aggregator.transform(self.df.loc[~train, key])
+        return rate
+    
     def create_seasonal_features(self):
         """Create seasonal features from application date"""
         logger.info("\n[FEATURE 1] Creating seasonal features...")
@@ -55,11 +71,8 @@ class AdvancedFeatureEngineering:
         
         # Approval rate by nationality
         if 'visa_status' in self.df.columns:
-            nat_approval = self.df.groupby('nationality')['visa_status'].apply(
-                lambda x: (x == 'Approved').sum() / len(x)
-            )
-            self.df['nationality_approval_rate'] = self.df['nationality'].map(nat_approval)
-            logger.info("  ✓ Created: nationality_approval_rate")
+            self.df['nationality_approval_rate'] = self._approval_rate('nationality')
+            logger.info("  ✓ Created: nationality_approval_rate (out-of-fold)")
         
         # Application count by nationality (popularity)
         nat_count = self.df['nationality'].value_counts()
@@ -87,11 +100,8 @@ class AdvancedFeatureEngineering:
         
         # Approval rate by industry
         if 'visa_status' in self.df.columns:
-            ind_approval = self.df.groupby('naics_title')['visa_status'].apply(
-                lambda x: (x == 'Approved').sum() / len(x)
-            )
-            self.df['industry_approval_rate'] = self.df['naics_title'].map(ind_approval)
-            logger.info("  ✓ Created: industry_approval_rate")
+            self.df['industry_approval_rate'] = self._approval_rate('naics_title')
+            logger.info("  ✓ Created: industry_approval_rate (out-of-fold)")
         
         # Application count by industry
         ind_count = self.df['naics_title'].value_counts()
@@ -185,11 +195,8 @@ class AdvancedFeatureEngineering:
         
         # Processing center approval rate
         if 'visa_status' in self.df.columns:
-            center_approval = self.df.groupby('processing_center')['visa_status'].apply(
-                lambda x: (x == 'Approved').sum() / len(x)
-            )
-            self.df['center_approval_rate'] = self.df['processing_center'].map(center_approval)
-            logger.info("  ✓ Created: center_approval_rate")
+            self.df['center_approval_rate'] = self._approval_rate('processing_center')
+            logger.info("  ✓ Created: center_approval_rate (out-of-fold)")
         
         # Processing center workload
         center_count = self.df['processing_center'].value_counts()
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import APPROVED_STATUSES, CUBE_DIMENSIONS, CUBE_BIN_DAYS, CUBE_MAX_DAYS
+
+UNKNOWN = 'UNKNOWN'
+
+
+class AggregationCube:
+    """Additive groupby cube (counts, approvals, salary, processing-time histogram) over categorical dimensions"""
+
+    # Each cell is one (dimensions, histogram bin) pair; bin -1 holds rows without a processing time.
+    # 'approved' is only kept when the frame has a visa_status
+    MEASURES = ['count', 'approved', 'time_sum', 'time_min', 'time_max']
+
+    def __init__(self, cells=None, dimensions=CUBE_DIMENSIONS, bin_days=CUBE_BIN_DAYS, max_days=CUBE_MAX_DAYS):
+        self.dimensions = list(dimensions)
+        self.bin_days = bin_days
+        self.max_days = max_days
+        self.n_bins = max_days // bin_days + 1
+        if cells is None:
+            cells = pd.DataFrame(columns=self.dimensions + ['bin'] + self.MEASURES)
+        self.cells = cells
+
+    @staticmethod
+    def month_key(dates):
+        """Application month as YYYY-MM"""
+        return pd.to_datetime(dates, errors='coerce').dt.strftime('%Y-%m').fillna(UNKNOWN)
+
+    def _dimension_values(self, df, dim):
+        if dim == 'month' and dim not in df.columns and 'application_date' in df.columns:
+            return self.month_key(df['application_date'])
+        if dim not in df.columns:
+            return pd.Series(UNKNOWN, index=df.index)
+        return df[dim]
+
+    @staticmethod
+    def _factorize(values):
+        """Integer codes with missing values mapped to a trailing UNKNOWN (or NaN for numeric keys)"""
+        codes, uniques = pd.factorize(values)
+        missing = np.nan if pd.api.types.is_numeric_dtype(values) else UNKNOWN
+        uniques = np.append(np.asarray(uniques, dtype=object), missing)
+        codes = np.where(codes < 0, len(uniques) - 1, codes)
+        return codes, uniques
+
+    @classmethod
+    def from_dataframe(cls, df, **kwargs):
+        """Aggregate rows into cube cells in one grouped pass over the combined factorized key"""
+        cube = cls(**kwargs)
+
+        if 'processing_time_days' in df.columns:
+            time = pd.to_numeric(df['processing_time_days'], errors='coerce').to_numpy(dtype=float)
+        else:
+            time = np.full(len(df), np.nan)
+        bins = np.floor(time / cube.bin_days).clip(0, cube.n_bins - 1)
+        bins = np.where(np.isnan(bins), -1, bins).astype(np.int64)
+
+        factorized = [cube._factorize(cube._dimension_values(df, dim)) for dim in cube.dimensions]
+        factorized.append((bins + 1, np.arange(-1, cube.n_bins)))
+        shape = tuple(len(uniques) for _, uniques in factorized)
+        key = np.ravel_multi_index(tuple(codes for codes, _ in factorized), shape)
+
+        measures = pd.DataFrame({'time': time})
+        aggregations = dict(
+            count=('time', 'size'),
+            time_sum=('time', 'sum'),
+            time_min=('time', 'min'),
+            time_max=('time', 'max')
+        )
+        if 'visa_status' in df.columns:
+            measures['approved'] = df['visa_status'].isin(APPROVED_STATUSES).to_numpy(dtype=np.int64)
+            aggregations.update(approved=('approved', 'sum'))
+        if 'annual_income_usd' in df.columns:
+            measures['salary'] = pd.to_numeric(df['annual_income_usd'], errors='coerce').to_numpy(dtype=float)
+            aggregations.update(salary_sum=('salary', 'sum'), salary_count=('salary', 'count'))
+
+        cells = measures.groupby(key, sort=False).agg(**aggregations)
+
+        # Decode the combined key back into dimension values
+        positions = np.unravel_index(cells.index.to_numpy(), shape)
+        decoded = {dim: uniques[pos] for dim, (_, uniques), pos in zip(cube.dimensions + ['bin'], factorized, positions)}
+        cube.cells = pd.concat([pd.DataFrame(decoded).infer_objects(), cells.reset_index(drop=True)], axis=1)
+        cube.cells['bin'] = cube.cells['bin'].astype(np.int64)
+        return cube
+
+    @classmethod
+    def concat(cls, cubes, **kwargs):
+        """Combine cubes over disjoint rows (e.g. monthly partitions)"""
+        cube = cls(**kwargs)
+        frames = [c.cells for c in cubes if len(c.cells)]
+        if frames:
+            cube.cells = pd.concat(frames, ignore_index=True)
+        return cube
+
+    def rollup(self, dims, quantiles=(0.1, 0.5, 0.9)):
+        """Counts, approval rate, means and approximate processing-time percentiles per group"""
+        dims = list(dims)
+        cells = self.cells
+        if not dims:
+            cells = cells.assign(total=0)
+            dims = ['total']
+
+        timed = cells[cells['bin'] >= 0]
+        measures = dict(applications=('count', 'sum'))
+        if 'approved' in cells.columns:
+            measures.update(approved=('approved', 'sum'))
+        if 'salary_sum' in cells.columns:
+            measures.update(salary_sum=('salary_sum', 'sum'), salary_count=('salary_count', 'sum'))
+
+        result = cells.groupby(dims, observed=True, dropna=False).agg(**measures)
+        result = result.join(timed.groupby(dims, observed=True, dropna=False).agg(
+            timed=('count', 'sum'),
+            time_sum=('time_sum', 'sum'),
+            min_time=('time_min', 'min'),
+            max_time=('time_max', 'max')
+        ), how='left')
+        if 'approved' in result.columns:
+            result['approval_rate'] = result['approved'] / result['applications'] * 100
+        result['avg_time'] = result['time_sum'] / result['timed']
+        if 'salary_sum' in result.columns:
+            result['avg_salary'] = result['salary_sum'] / result['salary_count']
+            result = result.drop(columns=['salary_sum', 'salary_count'])
+
+        for q in quantiles:
+            # Interpolated bin positions never leave the observed range
+            values = self._histogram_quantile(timed, dims, q).reindex(result.index)
+            result[f'p{int(round(q * 100))}'] = values.clip(lower=result['min_time'], upper=result['max_time'])
+
+        result = result.drop(columns=['time_sum', 'timed'])
+        return result.sort_values('applications', ascending=False)
+
+    def _histogram_quantile(self, timed, dims, q):
+        """Linear interpolation inside the histogram bin that holds the q-th observation"""
+        hist = timed.groupby(dims + ['bin'], observed=True, dropna=False)['count'].sum().reset_index()
+
+        groups = hist.groupby(dims, observed=True, sort=False, dropna=False)
+        cum = groups['count'].cumsum()
+        target = q * groups['count'].transform('sum')
+        hit = hist[cum >= target].groupby(dims, observed=True, sort=False, dropna=False).head(1).index
+
+        frac = ((target[hit] - (cum - hist['count'])[hit]) / hist['count'][hit]).clip(0, 1)
+        values = (hist.loc[hit, 'bin'] + frac) * self.bin_days
+        return pd.Series(values.to_numpy(), index=pd.MultiIndex.from_frame(hist.loc[hit, dims])
+                         if len(dims) > 1 else pd.Index(hist.loc[hit, dims[0]], name=dims[0]))
+
+    def time_histogram(self):
+        """Processing-time histogram (counts, bin edges) over the whole cube"""
+        timed = self.cells[self.cells['bin'] >= 0]
+        counts = np.bincount(timed['bin'].to_numpy(dtype=np.int64), weights=timed['count'].to_numpy(dtype=float),
+                             minlength=self.n_bins)
+        last = int(np.flatnonzero(counts).max()) + 1 if counts.any() else 0
+        return counts[:last], np.arange(last + 1) * self.bin_days
+
+    def log_summary(self):
+        """Log cube size"""
+        total = int(self.cells['count'].sum()) if len(self.cells) else 0
+        logger.info(f"  ✓ Aggregation cube: {len(self.cells)} cells covering {total} applications")
\ No newline at end of file
@@ -0,0 +1,151 @@
+import calendar
+import json
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import (
+    ANALYTICS_EXPORT_DIR, CUBE_DIR, ANALYTICS_TOP_N, CUBE_DIMENSIONS, CUBE_BIN_DAYS, CUBE_MAX_DAYS, APPROVED_STATUSES
+)
+from src.aggregation_cube import AggregationCube
+
+
+class AnalyticsExporter:
+    """Refresh the aggregation cube per month and publish compact JSON rollups for the web app"""
+
+    def __init__(self, cube_dir=CUBE_DIR, export_dir=ANALYTICS_EXPORT_DIR, top_n=ANALYTICS_TOP_N):
+        self.cube_dir = cube_dir
+        self.export_dir = export_dir
+        self.top_n = top_n
+        self.manifest_file = cube_dir / 'manifest.json'
+        # Partitions built under other settings hold cells (and bin indices) the current cube cannot read
+        self.settings = {
+            'dimensions': list(CUBE_DIMENSIONS),
+            'bin_days': CUBE_BIN_DAYS,
+            'max_days': CUBE_MAX_DAYS,
+            'approved_statuses': list(APPROVED_STATUSES)
+        }
+        self.cube = None
+
+    def _load_manifest(self):
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _partition_file(self, month):
+        return self.cube_dir / f'month={month}.pkl'
+
+    @staticmethod
+    def _row_hashes(df):
+        """Per-row content hashes, summed (mod 2**64) per month into an order-independent fingerprint"""
+        return pd.Series(pd.util.hash_pandas_object(df, index=False).to_numpy(), index=df.index)
+
+    def refresh(self, df):
+        """Rebuild only the monthly partitions whose rows changed (all of them when the cube settings did)"""
+        self.cube_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+        previous = manifest.get('partitions', {})
+        reusable = previous if manifest.get('settings') == self.settings else {}
+        if previous and not reusable:
+            logger.info("  Cube settings changed: rebuilding every partition")
+
+        months = AggregationCube.month_key(df['application_date'])
+        hashes = self._row_hashes(df).groupby(months).agg(lambda h: int(h.to_numpy().sum(dtype=np.uint64)))
+        sizes = months.value_counts()
+        fingerprints = {month: f"{hashes[month]:016x}-{sizes[month]}" for month in hashes.index}
+
+        stale = [month for month, fp in fingerprints.items()
+                 if reusable.get(month) != fp or not self._partition_file(month).exists()]
+        removed = [month for month in previous if month not in fingerprints]
+
+        if stale:
+            changed = AggregationCube.from_dataframe(df[months.isin(stale)])
+            for month, cells in changed.cells.groupby('month', observed=True):
+                cells.reset_index(drop=True).to_pickle(self._partition_file(month))
+        for month in removed:
+            self._partition_file(month).unlink(missing_ok=True)
+
+        logger.info(f"  ✓ Cube partitions: {len(stale)} rebuilt, {len(fingerprints) - len(stale)} reused, "
+                    f"{len(removed)} removed")
+
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump({'settings': self.settings, 'partitions': fingerprints}, f, indent=2, sort_keys=True)
+
+        self.cube = AggregationCube.concat([
+            AggregationCube(pd.read_pickle(self._partition_file(month))) for month in sorted(fingerprints)
+        ])
+        self.cube.log_summary()
+        return self.cube
+
+    @staticmethod
+    def _records(frame, label, columns):
+        """Rename the index to the chart's key and round to keep the files small"""
+        frame = frame.reset_index().rename(columns={frame.index.name: label, **columns})
+        frame = frame[[label] + list(columns.values())]
+        return json.loads(frame.round(1).to_json(orient='records'))
+
+    def _write(self, name, payload):
+        with open(self.export_dir / f'{name}.json', 'w', encoding='utf-8') as f:
+            json.dump(payload, f, separators=(',', ':'))
+        logger.info(f"  ✓ Exported: {name}.json")
+
+    def export(self, cube=None):
+        """Write the rollups the dashboard and analytics pages load"""
+        cube = cube or self.cube
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+
+        columns = {
+            'applications': 'applications',
+            'approval_rate': 'approvalRate',
+            'avg_time': 'avgTime',
+            'p10': 'p10',
+            'p50': 'p50',
+            'p90': 'p90'
+        }
+
+        nationality = cube.rollup(['nationality']).head(self.top_n)
+        self._write('nationality', self._records(nationality, 'country', columns))
+
+        centers = cube.rollup(['processing_center']).head(self.top_n)
+        self._write('centers', self._records(centers, 'center', columns))
+
+        industries = cube.rollup(['naics_title']).head(self.top_n)
+        self._write('industries', self._records(industries, 'industry', columns))
+
+        # Calendar-month trend: p10/p90 band around the mean
+        cells = cube.cells[cube.cells['month'] != 'UNKNOWN']
+        by_month = AggregationCube(cells.assign(month=cells['month'].str[5:7].astype(int))).rollup(['month'])
+        by_month = by_month.sort_index()
+        by_month.index = [calendar.month_abbr[m] for m in by_month.index]
+        by_month.index.name = 'month'
+        self._write('monthly', self._records(by_month, 'month', {
+            **columns, 'p10': 'minTime', 'p90': 'maxTime'
+        }))
+
+        overall = cube.rollup([]).iloc[0]
+        summary = {
+            'applications': int(overall['applications']),
+            'approvalRate': round(float(overall['approval_rate']), 1),
+            'avgTime': round(float(overall['avg_time']), 1),
+            'medianTime': round(float(overall['p50']), 1),
+            'peakMonth': by_month['avg_time'].idxmax(),
+            'peakMonthTime': round(float(by_month['avg_time'].max()), 1),
+            'fastestMonth': by_month['avg_time'].idxmin(),
+            'fastestMonthTime': round(float(by_month['avg_time'].min()), 1),
+            'busiestCenter': centers.index[0],
+            'generated': datetime.now().isoformat(timespec='seconds')
+        }
+        self._write('summary', summary)
+        return summary
+
+    def run(self, df):
+        """Refresh the cube and export"""
+        logger.info("\n" + "="*70)
+        logger.info("ANALYTICS EXPORT")
+        logger.info("="*70)
+        self.refresh(df)
+        return self.export()
\ No newline at end of file
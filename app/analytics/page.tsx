@@ -14,73 +14,110 @@ import {
   Globe, 
   Calendar, 
   MapPin,
-  ArrowUp,
-  ArrowDown,
   Minus,
   Filter
 } from "lucide-react"
 import { useState } from "react"
+import { useAnalytics } from "@/hooks/use-analytics"
 
-const quickStats = [
-  { 
-    label: "Global Average", 
-    value: "47.5 days", 
-    change: -3.2, 
-    trend: "down",
-    period: "vs last quarter"
-  },
-  { 
-    label: "Peak Month", 
-    value: "April", 
-    change: null, 
-    trend: "neutral",
-    period: "Spring rush"
-  },
-  { 
-    label: "Fastest Visa", 
-    value: "O-1 (38d)", 
-    change: -5.1, 
-    trend: "down",
-    period: "vs last year"
-  },
-  { 
-    label: "Busiest Center", 
-    value: "California SC", 
-    change: 12.4, 
-    trend: "up",
-    period: "volume increase"
-  },
+// Rollups exported by run_analytics_export.py; the samples show until an export is published
+type Summary = {
+  applications: number
+  approvalRate: number
+  avgTime: number
+  medianTime: number
+  peakMonth: string
+  peakMonthTime: number
+  fastestMonth: string
+  fastestMonthTime: number
+  busiestCenter: string
+}
+
+type GroupRow = { applications: number; approvalRate: number; avgTime: number }
+type CenterRow = GroupRow & { center: string }
+type IndustryRow = GroupRow & { industry: string }
+
+const sampleSummary: Summary = {
+  applications: 41000,
+  approvalRate: 90.2,
+  avgTime: 47.5,
+  medianTime: 45.0,
+  peakMonth: "Apr",
+  peakMonthTime: 58.0,
+  fastestMonth: "Sep",
+  fastestMonthTime: 41.0,
+  busiestCenter: "California SC",
+}
+
+const sampleCenters: CenterRow[] = [
+  { center: "California SC", applications: 9500, approvalRate: 90, avgTime: 45 },
+  { center: "Texas SC", applications: 7500, approvalRate: 88, avgTime: 38 },
 ]
 
-const insights = [
-  {
-    title: "Spring Processing Surge",
-    description: "Processing times increase by 22% during March-May due to H-1B filing season.",
-    type: "warning",
-    icon: Calendar
-  },
-  {
-    title: "Texas SC Efficiency",
-    description: "Texas Service Center shows 15% faster processing despite moderate volume.",
-    type: "positive",
-    icon: MapPin
-  },
-  {
-    title: "Income Correlation",
-    description: "Higher income applicants (>$100k) see 8% faster processing on average.",
-    type: "info",
-    icon: TrendingUp
-  },
-  {
-    title: "Education Impact",
-    description: "Advanced degree holders experience 12% shorter wait times.",
-    type: "positive",
-    icon: Globe
-  },
+const sampleIndustries: IndustryRow[] = [
+  { industry: "Computer Systems Design", applications: 6200, approvalRate: 91, avgTime: 52 },
 ]
 
+const percentDifference = (value: number, reference: number) => Math.round(((value - reference) / reference) * 100)
+
+function buildQuickStats(summary: Summary) {
+  return [
+    { label: "Global Average", value: `${summary.avgTime} days`, period: `${summary.applications.toLocaleString()} applications` },
+    { label: "Peak Month", value: summary.peakMonth, period: `${summary.peakMonthTime} days on average` },
+    { label: "Fastest Month", value: summary.fastestMonth, period: `${summary.fastestMonthTime} days on average` },
+    { label: "Busiest Center", value: summary.busiestCenter, period: "most applications" },
+  ]
+}
+
+function buildInsights(summary: Summary, centers: CenterRow[], industries: IndustryRow[]) {
+  const total = centers.reduce((sum, row) => sum + row.applications, 0)
+  // Centers with a real share of the volume, so a handful of applications cannot top the list
+  const fastestCenter = centers
+    .filter((row) => row.applications >= total * 0.05)
+    .reduce((a, b) => (b.avgTime < a.avgTime ? b : a), centers[0])
+  const slowestIndustry = industries.reduce((a, b) => (b.avgTime > a.avgTime ? b : a), industries[0])
+
+  return [
+    {
+      title: `${summary.peakMonth} Processing Peak`,
+      description: `Applications filed in ${summary.peakMonth} average ${summary.peakMonthTime} days, ` +
+        `${percentDifference(summary.peakMonthTime, summary.fastestMonthTime)}% longer than in ` +
+        `${summary.fastestMonth} (${summary.fastestMonthTime} days).`,
+      type: "warning",
+      icon: Calendar
+    },
+    {
+      title: `${fastestCenter.center} Efficiency`,
+      description: `${fastestCenter.center} averages ${fastestCenter.avgTime} days, ` +
+        `${-percentDifference(fastestCenter.avgTime, summary.avgTime)}% faster than the ` +
+        `${summary.avgTime}-day overall average.`,
+      type: "positive",
+      icon: MapPin
+    },
+    {
+      title: "Slowest Industry",
+      description: `${slowestIndustry.industry} averages ${slowestIndustry.avgTime} days across ` +
+        `${slowestIndustry.applications.toLocaleString()} applications, the longest of the top industries.`,
+      type: "info",
+      icon: TrendingUp
+    },
+    {
+      title: "Approval Rate",
+      description: `${summary.approvalRate}% of ${summary.applications.toLocaleString()} applications were ` +
+        `certified, with a median wait of ${summary.medianTime} days.`,
+      type: "positive",
+      icon: Globe
+    },
+  ]
+}
+
 export default function AnalyticsPage() {
   const [timeRange, setTimeRange] = useState("12m")
+  const summary = useAnalytics<Summary>("summary", sampleSummary)
+  const centers = useAnalytics<CenterRow[]>("centers", sampleCenters)
+  const industries = useAnalytics<IndustryRow[]>("industries", sampleIndustries)
+  const quickStats = buildQuickStats(summary)
+  const insights = buildInsights(summary, centers, industries)
 
   return (
     <main className="min-h-screen">
@@ -136,27 +173,8 @@ export default function AnalyticsPage() {
                   <p className="text-xs text-muted-foreground mb-1">{stat.label}</p>
                   <p className="text-2xl font-bold text-foreground mb-2">{stat.value}</p>
                   <div className="flex items-center gap-1 text-xs">
-                    {stat.trend === "up" && (
-                      <>
-                        <ArrowUp className="h-3 w-3 text-amber-400" />
-                        <span className="text-amber-400">+{stat.change}%</span>
-                      </>
-                    )}
-                    {stat.trend === "down" && (
-                      <>
-                        <ArrowDown className="h-3 w-3 text-emerald-400" />
-                        <span className="text-emerald-400">{stat.change}%</span>
-                      </>
-                    )}
-                    {stat.trend === "neutral" && (
-                      <>
-                        <Minus className="h-3 w-3 text-muted-foreground" />
-                        <span className="text-muted-foreground">{stat.period}</span>
-                      </>
-                    )}
-                    {stat.trend !== "neutral" && (
-                      <span className="text-muted-foreground ml-1">{stat.period}</span>
-                    )}
+                    <Minus className="h-3 w-3 text-muted-foreground" />
+                    <span className="text-muted-foreground">{stat.period}</span>
                   </div>
                 </CardContent>
               </Card>
@@ -0,0 +1,202 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import (
+    BACKTEST_DATE_COLUMN, BACKTEST_INITIAL_MONTHS, BACKTEST_STEP_MONTHS, BACKTEST_HORIZON_MONTHS,
+    BACKTEST_WINDOW, BACKTEST_TRAIN_MONTHS, BACKTEST_MODELS, BACKTEST_DECAY_TOLERANCE,
+    BACKTEST_WORKERS, BACKTEST_CACHE_DIR, CANONICALIZE_JOB_TITLES, JOINT_EXCLUDE_COLUMNS, JOINT_STATUS_TARGET
+)
+from src.feature_store import FeatureStore
+from src.featurizer import Featurizer
+
+
+def build_model(name):
+    """Estimators with ModelTrainer's settings; one thread each, the worker pool supplies parallelism"""
+    if name == 'Linear Regression':
+        from sklearn.linear_model import LinearRegression
+        return LinearRegression()
+    if name == 'Random Forest':
+        from sklearn.ensemble import RandomForestRegressor
+        return RandomForestRegressor(n_estimators=100, max_depth=15, min_samples_split=5,
+                                     min_samples_leaf=2, random_state=42, n_jobs=1)
+    if name == 'Gradient Boosting':
+        from sklearn.ensemble import GradientBoostingRegressor
+        return GradientBoostingRegressor(n_estimators=100, learning_rate=0.1, max_depth=5,
+                                         min_samples_split=5, min_samples_leaf=2, random_state=42)
+    if name == 'SVR':
+        from sklearn.svm import SVR
+        return SVR(kernel='rbf', C=100, epsilon=0.1)
+    raise ValueError(f"Unknown model: {name}")
+
+
+def _month_label(month):
+    return f"{month // 12}-{month % 12 + 1:02d}"
+
+
+def _fit_window(cache_dir, name, train_start, train_end, test_end):
+    """Fit one model on a contiguous slice of the cached matrix and predict the months after it"""
+    X = np.load(cache_dir / 'X.npy', mmap_mode='r')
+    y = np.load(cache_dir / 'y.npy', mmap_mode='r')
+    model = build_model(name)
+    model.fit(X[train_start:train_end], y[train_start:train_end])
+    return model.predict(X[train_end:test_end])
+
+
+class Backtester:
+    """Rolling-origin backtest over application_date: train on the past at each origin, score the months after it"""
+
+    def __init__(self, df, models=BACKTEST_MODELS, window=BACKTEST_WINDOW, initial_months=BACKTEST_INITIAL_MONTHS,
+                 step_months=BACKTEST_STEP_MONTHS, horizon_months=BACKTEST_HORIZON_MONTHS,
+                 train_months=BACKTEST_TRAIN_MONTHS, workers=BACKTEST_WORKERS, cache_dir=BACKTEST_CACHE_DIR,
+                 features=None):
+        if window not in ('expanding', 'rolling'):
+            raise ValueError(f"Unknown window: {window}")
+        self.df = df
+        self.models = list(models)
+        self.window = window
+        self.initial_months = initial_months
+        self.step_months = step_months
+        self.horizon_months = horizon_months
+        self.train_months = train_months
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self.features = list(features) if features is not None else self._servable_features(df)
+        self.months = None
+        self.y = None
+
+    @staticmethod
+    def _servable_features(df):
+        """Without a feature schema: every column known when an application is filed"""
+        excluded = set(JOINT_EXCLUDE_COLUMNS) | {JOINT_STATUS_TARGET}
+        return [c for c in df.columns if c not in excluded and 'processing_time_days' not in c]
+
+    def _featurize(self):
+        """Featurize every row once, sorted by month, so each window is a zero-copy slice of one memory map"""
+        dates = pd.to_datetime(self.df[BACKTEST_DATE_COLUMN], errors='coerce')
+        df = self.df[dates.notna()]
+        if len(df) < len(self.df):
+            logger.info(f"  Dropped {len(self.df) - len(df)} rows without an application date")
+        dates = dates[dates.notna()]
+        months = (dates.dt.year * 12 + dates.dt.month - 1).to_numpy(dtype=np.int64)
+        order = np.argsort(months, kind='stable')
+
+        metadata_file = self.cache_dir / 'metadata.json'
+        columns = list(dict.fromkeys([BACKTEST_DATE_COLUMN, *self.features, 'processing_time_days']))
+        fingerprint = f"{FeatureStore.fingerprint(df[columns])}:{CANONICALIZE_JOB_TITLES}"
+        if metadata_file.exists():
+            with open(metadata_file, 'r', encoding='utf-8') as f:
+                if json.load(f).get('fingerprint') == fingerprint:
+                    logger.info(f"  ✓ Reusing featurized history: {self.cache_dir}")
+                    self.months = months[order]
+                    self.y = np.load(self.cache_dir / 'y.npy')
+                    return
+
+        # The featurizer learns vocabularies and column scales only, never labels
+        df = df.iloc[order]
+        X = Featurizer().fit_transform(df[self.features])
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        np.save(self.cache_dir / 'X.npy', X)
+        np.save(self.cache_dir / 'y.npy', df['processing_time_days'].to_numpy(dtype=np.float64))
+        with open(metadata_file, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'rows': len(df), 'columns': X.shape[1]}, f, indent=2)
+        logger.info(f"  ✓ Featurized {len(df):,} rows × {X.shape[1]} columns once: {self.cache_dir}")
+        self.months = months[order]
+        self.y = np.load(self.cache_dir / 'y.npy')
+
+    def splits(self):
+        """(origin month, train_start, train_end, test_end) row ranges; rows are sorted by month"""
+        first, last = int(self.months[0]), int(self.months[-1])
+        windows = []
+        for origin in range(first + self.initial_months, last + 1, self.step_months):
+            train_from = origin - self.train_months if self.window == 'rolling' else first
+            train_start, train_end, test_end = np.searchsorted(
+                self.months, [train_from, origin, origin + self.horizon_months]
+            )
+            if train_end > train_start and test_end > train_end:
+                windows.append((origin, int(train_start), int(train_end), int(test_end)))
+        return windows
+
+    def run(self):
+        """Fit every model once per origin (in parallel) and score it on each month of its horizon"""
+        logger.info("\n" + "="*70)
+        logger.info("ROLLING-ORIGIN BACKTEST")
+        logger.info("="*70)
+
+        self._featurize()
+        windows = self.splits()
+        logger.info(f"  {len(windows)} origins × {len(self.models)} models ({self.window} window, "
+                    f"step {self.step_months} months, horizon {self.horizon_months} months, {self.workers} workers)")
+
+        tasks = [(window, name) for window in windows for name in self.models]
+        args = [(self.cache_dir, name, start, end, stop) for (_, start, end, stop), name in tasks]
+        if self.workers <= 1:
+            predictions = [_fit_window(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(self.workers) as pool:
+                futures = [pool.submit(_fit_window, *a) for a in args]
+                predictions = [future.result() for future in futures]
+
+        frames = []
+        for ((origin, train_start, train_end, test_end), name), y_pred in zip(tasks, predictions):
+            frames.append(pd.DataFrame({
+                'origin': origin,
+                'model': name,
+                'train_rows': train_end - train_start,
+                'age': self.months[train_end:test_end] - origin + 1,
+                'y_true': self.y[train_end:test_end],
+                'y_pred': y_pred
+            }))
+        return pd.concat(frames, ignore_index=True)
+
+    @staticmethod
+    def _metrics(group):
+        error = group['y_pred'] - group['y_true']
+        return pd.Series({
+            'rows': len(group),
+            'MAE': error.abs().mean(),
+            'RMSE': np.sqrt((error ** 2).mean())
+        })
+
+    def summarize(self, predictions):
+        """Per-window, per-month metrics (the CSV) and the MAE-by-model-age decay curve"""
+        by_month = predictions.groupby(['origin', 'model', 'train_rows', 'age'])[['y_true', 'y_pred']].apply(
+            self._metrics
+        ).reset_index()
+        by_month['month'] = (by_month['origin'] + by_month['age'] - 1).map(_month_label)
+        by_month['origin'] = by_month['origin'].map(_month_label)
+        by_month = by_month[['origin', 'model', 'train_rows', 'month', 'age', 'rows', 'MAE', 'RMSE']].astype({'rows': int})
+        decay = predictions.groupby(['model', 'age'])[['y_true', 'y_pred']].apply(self._metrics).reset_index()
+        return by_month, decay.astype({'rows': int})
+
+    def report(self, predictions):
+        """Log per-window drift and how long each model stays within tolerance of its first month"""
+        by_month, decay = self.summarize(predictions)
+
+        logger.info("\nPer-window error (MAE first horizon month -> last, RMSE over the horizon):")
+        logger.info("-"*70)
+        logger.info(f"{'Origin':<9} {'Model':<20} {'Train':>7} {'MAE 1st':>8} {'MAE last':>9} {'Drift':>8} {'RMSE':>8}")
+        logger.info("-"*70)
+        for (origin, name), window in by_month.groupby(['origin', 'model'], sort=True):
+            first, final = window.iloc[0], window.iloc[-1]
+            rmse = np.sqrt((window['RMSE'] ** 2 * window['rows']).sum() / window['rows'].sum())
+            logger.info(f"{origin:<9} {name:<20} {int(first['train_rows']):>7,} {first['MAE']:>8.2f} "
+                        f"{final['MAE']:>9.2f} {final['MAE'] - first['MAE']:>+8.2f} {rmse:>8.2f}")
+
+        logger.info("\nAccuracy decay (MAE by months since training, pooled over origins):")
+        logger.info("-"*70)
+        cadence = {}
+        for name, curve in decay.groupby('model', sort=False):
+            baseline = curve['MAE'].iloc[0]
+            fresh = curve[curve['MAE'] <= baseline * (1 + BACKTEST_DECAY_TOLERANCE)]['age']
+            # Retrain before the first month that falls outside tolerance
+            stale = curve[~curve['age'].isin(fresh)]['age']
+            cadence[name] = int(stale.min()) - 1 if len(stale) else int(curve['age'].max())
+            logger.info(f"  {name:<20} " + "  ".join(f"{int(a)}m:{m:.1f}" for a, m in zip(curve['age'], curve['MAE'])))
+        logger.info("-"*70)
+        for name, months in cadence.items():
+            logger.info(f"  ✓ {name}: retrain at least every {months} month(s) "
+                        f"(MAE within {BACKTEST_DECAY_TOLERANCE:.0%} of the first month)")
+
+        return by_month, decay, cadence
\ No newline at end of file
@@ -0,0 +1,140 @@
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import pandas as pd
+from src.logger import logger
+from src.config import JOINT_MODEL_FILE, COMPRESSED_MODEL_FILE, BATCH_CHUNK_SIZE, BATCH_WORKERS, BATCH_ID_COLUMNS
+from src.predictor import TunedPredictor, StackedPredictor
+
+
+def load_model(kind):
+    """'joint' (application-time features), 'tuned' (the milestone 3 regressor), 'compressed' (its compact form)
+    or 'stacked' (the ensemble over the whole roster)"""
+    if kind == 'joint':
+        from src.joint_model import JointModel
+        model = JointModel.load(JOINT_MODEL_FILE)
+        estimators = [model.classifier, model.regressor]
+    elif kind == 'tuned':
+        model = TunedPredictor()
+        estimators = [model.model]
+    elif kind == 'compressed':
+        model = TunedPredictor(COMPRESSED_MODEL_FILE)
+        estimators = [model.model]
+    elif kind == 'stacked':
+        model = StackedPredictor()
+        # Worker processes supply the parallelism; base models run one after another inside each
+        model.model.workers = 1
+        estimators = list(model.model.models.values())
+    else:
+        raise ValueError(f"Unknown model: {kind}")
+
+    # The worker pool supplies the parallelism; estimator threads would oversubscribe it
+    for estimator in estimators:
+        if hasattr(estimator, 'n_jobs'):
+            estimator.n_jobs = 1
+    return model
+
+
+# Loaded once per worker process by the pool initializer
+_worker_model = None
+
+
+def _init_worker(kind):
+    global _worker_model
+    _worker_model = load_model(kind)
+
+
+def _score_chunk(chunk):
+    ids = chunk[[c for c in BATCH_ID_COLUMNS if c in chunk.columns]]
+    return pd.concat([ids, _worker_model.predict(chunk)], axis=1)
+
+
+def iter_chunks(path, chunk_size=BATCH_CHUNK_SIZE):
+    """Stream a CSV or Parquet file without loading it whole"""
+    path = Path(path)
+    if path.suffix == '.parquet':
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+class BatchScorer:
+    """Score large application files chunk by chunk on a process pool, writing results as they complete"""
+
+    def __init__(self, model='joint', chunk_size=BATCH_CHUNK_SIZE, workers=BATCH_WORKERS):
+        self.model = model
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self._parquet_writer = None
+        self._rows_written = 0
+
+    def _write(self, frame, output_path):
+        """Append one scored chunk (CSV header / Parquet schema come from the first)"""
+        if output_path.suffix == '.parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(output_path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            frame.to_csv(output_path, mode='a' if self._rows_written else 'w',
+                         header=not self._rows_written, index=False)
+        self._rows_written += len(frame)
+
+    def _report(self, start):
+        elapsed = time.perf_counter() - start
+        logger.info(f"  ✓ {self._rows_written:,} rows scored "
+                    f"({self._rows_written / max(elapsed, 1e-9):,.0f} rows/s)")
+
+    def score(self, input_path, output_path):
+        """Stream input -> predictions -> output; memory is bounded by the chunks in flight"""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._parquet_writer = None
+        self._rows_written = 0
+
+        logger.info("\n" + "="*70)
+        logger.info("BATCH SCORING")
+        logger.info("="*70)
+        logger.info(f"  Input: {input_path}")
+        logger.info(f"  Model: {self.model} | chunk size: {self.chunk_size:,} | workers: {self.workers}")
+
+        start = time.perf_counter()
+        chunks = iter_chunks(input_path, self.chunk_size)
+
+        if self.workers <= 1:
+            _init_worker(self.model)
+            for chunk in chunks:
+                self._write(_score_chunk(chunk), output_path)
+                self._report(start)
+        else:
+            # At most two chunks per worker are queued, so reading never runs far ahead of writing
+            pending = deque()
+            with ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.model,)) as pool:
+                for chunk in chunks:
+                    pending.append(pool.submit(_score_chunk, chunk))
+                    if len(pending) >= self.workers * 2:
+                        self._write(pending.popleft().result(), output_path)
+                        self._report(start)
+                while pending:
+                    self._write(pending.popleft().result(), output_path)
+                    self._report(start)
+
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+        elapsed = time.perf_counter() - start
+        summary = {
+            'rows': self._rows_written,
+            'seconds': round(elapsed, 2),
+            'rows_per_second': round(self._rows_written / max(elapsed, 1e-9)),
+            'output': str(output_path)
+        }
+        logger.info(f"\n✓ Scored {summary['rows']:,} rows in {summary['seconds']}s "
+                    f"({summary['rows_per_second']:,} rows/s)")
+        logger.info(f"  Output: {output_path}")
+        return summary
\ No newline at end of file
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+from src.config import (
+    CATEGORICAL_ENCODING, CATEGORICAL_MIN_FREQUENCY, CATEGORICAL_HASH_FEATURES, TARGET_ENCODING_FOLDS
+)
+
+
+def matrix_nbytes(matrix):
+    """Memory held by a dense array or a CSR matrix"""
+    if hasattr(matrix, 'indptr'):
+        return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    return np.asarray(matrix).nbytes
+
+
+class CategoricalEncoder:
+    """Categorical columns as sparse one-hot, hashed, out-of-fold target-encoded or ordinal features, beside scaled numerics"""
+
+    METHODS = ['onehot', 'hashing', 'target', 'label']
+
+    def __init__(self, method=CATEGORICAL_ENCODING, min_frequency=CATEGORICAL_MIN_FREQUENCY,
+                 hash_features=CATEGORICAL_HASH_FEATURES, target_folds=TARGET_ENCODING_FOLDS):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown categorical encoding: {method} (expected one of {self.METHODS})")
+        self.method = method
+        self.min_frequency = min_frequency
+        self.hash_features = hash_features
+        self.target_folds = target_folds
+        self.categorical_columns = []
+        self.numeric_columns = []
+        self.encoder = None
+        self.mean_ = None
+        self.scale_ = None
+
+    @property
+    def is_sparse(self):
+        return self.method in ('onehot', 'hashing')
+
+    def _hash(self, cats):
+        """Signed feature hashing of 'column=value' tokens, built straight into CSR"""
+        import scipy.sparse as sp
+        n_rows = len(cats)
+        rows, cols, signs = [], [], []
+        for col in cats.columns:
+            hashes = pd.util.hash_array((col + '=' + cats[col]).to_numpy(dtype=object))
+            rows.append(np.arange(n_rows))
+            cols.append((hashes % np.uint64(self.hash_features)).astype(np.int64))
+            signs.append(np.where(hashes >> np.uint64(63), -1.0, 1.0).astype(np.float32))
+        # Colliding tokens in one row are summed by the COO -> CSR conversion
+        return sp.csr_matrix(
+            (np.concatenate(signs), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n_rows, self.hash_features), dtype=np.float32
+        )
+
+    def _target_encode(self, cats, y):
+        """Out-of-fold smoothed target means for the training rows; new rows use the full-training fit"""
+        from sklearn.model_selection import KFold
+        from sklearn.preprocessing import TargetEncoder
+        self.encoder = TargetEncoder(target_type='continuous').fit(cats, y)
+        encoded = np.empty(cats.shape, dtype=np.float64)
+        for fit_rows, held_out in KFold(self.target_folds, shuffle=True, random_state=42).split(cats):
+            fold = TargetEncoder(target_type='continuous').fit(cats.iloc[fit_rows], y[fit_rows])
+            encoded[held_out] = fold.transform(cats.iloc[held_out])
+        return encoded
+
+    def _scale(self, values, fit=False):
+        """Standardize with NaN-aware statistics; missing values land on the training mean"""
+        if fit:
+            self.mean_ = np.nanmean(values, axis=0)
+            self.scale_ = np.nanstd(values, axis=0)
+            self.scale_[~(self.scale_ > 0)] = 1.0
+        return np.nan_to_num((values - self.mean_) / self.scale_, nan=0.0).astype(np.float32)
+
+    def _combine(self, X, encoded, fit=False):
+        numeric = X[self.numeric_columns].to_numpy(dtype=np.float64)
+        if self.is_sparse:
+            import scipy.sparse as sp
+            return sp.hstack([sp.csr_matrix(self._scale(numeric, fit)), encoded], format='csr', dtype=np.float32)
+        # Target means and ordinal codes are scaled with the numerics (kernel models are scale-sensitive)
+        return self._scale(np.hstack([numeric, encoded]), fit)
+
+    def fit_transform(self, X, y=None):
+        """Fit on the training rows and encode them (target encoding is cross-fitted, so no row sees its own label)"""
+        self.categorical_columns = [c for c in X.columns if not pd.api.types.is_numeric_dtype(X[c])]
+        self.numeric_columns = [c for c in X.columns if c not in self.categorical_columns]
+        cats = X[self.categorical_columns].astype(str)
+
+        if self.method == 'onehot':
+            from sklearn.preprocessing import OneHotEncoder
+            self.encoder = OneHotEncoder(handle_unknown='infrequent_if_exist', min_frequency=self.min_frequency,
+                                         dtype=np.float32)
+            encoded = self.encoder.fit_transform(cats)
+        elif self.method == 'hashing':
+            encoded = self._hash(cats)
+        elif self.method == 'target':
+            if y is None:
+                raise ValueError("Target encoding needs the training target")
+            encoded = self._target_encode(cats, np.asarray(y, dtype=np.float64))
+        else:
+            from sklearn.preprocessing import OrdinalEncoder
+            self.encoder = OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=-1)
+            encoded = self.encoder.fit_transform(cats)
+        return self._combine(X, encoded, fit=True)
+
+    def fit(self, X, y=None):
+        self.fit_transform(X, y)
+        return self
+
+    def transform(self, X):
+        """Encode new rows with the fitted vocabularies, hash space or full-training target means"""
+        cats = X[self.categorical_columns].astype(str)
+        encoded = self._hash(cats) if self.method == 'hashing' else self.encoder.transform(cats)
+        return self._combine(X, encoded)
+
+    def feature_names_out(self):
+        if self.method == 'onehot':
+            encoded = list(self.encoder.get_feature_names_out())
+        elif self.method == 'hashing':
+            encoded = [f'hash_{i}' for i in range(self.hash_features)]
+        else:
+            encoded = list(self.categorical_columns)
+        return list(self.numeric_columns) + encoded
\ No newline at end of file
@@ -0,0 +1,140 @@
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import RENDER_DPI, RENDER_WORKERS, SCATTER_POINT_THRESHOLD
+
+
+def dense_scatter(ax, x, y, threshold=SCATTER_POINT_THRESHOLD, gridsize=60, **kwargs):
+    """Scatter small samples; bin large ones into a hexbin so file size stays bounded"""
+    x, y = np.asarray(x), np.asarray(y)
+    if len(x) > threshold:
+        return ax.hexbin(x, y, gridsize=gridsize, mincnt=1, cmap='Blues', bins='log')
+    return ax.scatter(x, y, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _module_source(name):
+    """Source of an imported module, read once per process (its name when the source is unavailable)"""
+    try:
+        return inspect.getsource(sys.modules[name])
+    except (KeyError, OSError, TypeError):
+        return name
+
+
+def _hash_value(digest, value):
+    """Feed a plotting input into the content hash"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        labels = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        digest.update(repr(list(labels)).encode('utf-8'))
+    elif isinstance(value, np.ndarray):
+        digest.update(str(value.dtype).encode('utf-8'))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value, key=str):
+            digest.update(str(key).encode('utf-8'))
+            _hash_value(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _hash_value(digest, item)
+    else:
+        digest.update(repr(value).encode('utf-8'))
+
+
+class RenderJob:
+    """One figure: a module-level draw function, its inputs and the output file"""
+
+    def __init__(self, draw, output_path, inputs, style='whitegrid', **savefig_kwargs):
+        self.draw = draw
+        self.output_path = output_path
+        self.inputs = inputs
+        self.style = style
+        self.savefig_kwargs = savefig_kwargs
+
+    @property
+    def filename(self):
+        return os.path.basename(str(self.output_path))
+
+    def content_hash(self, dpi):
+        """Hash the draw code, inputs and output settings"""
+        digest = hashlib.sha1()
+        digest.update(f"{self.draw.__module__}.{self.draw.__qualname__}".encode('utf-8'))
+        # Whole modules, not just the draw function: helpers it calls (dense_scatter, ...) change the figure too
+        for name in dict.fromkeys([self.draw.__module__, __name__]):
+            digest.update(_module_source(name).encode('utf-8'))
+        _hash_value(digest, self.inputs)
+        _hash_value(digest, [self.style, dpi, self.savefig_kwargs, SCATTER_POINT_THRESHOLD])
+        return digest.hexdigest()
+
+
+def _init_worker():
+    """Force the non-interactive Agg backend in pool workers"""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _render_job(job, dpi):
+    """Draw and save one figure off-screen through the object-oriented Figure API"""
+    import seaborn as sns
+
+    with sns.axes_style(job.style):
+        fig = job.draw(**job.inputs)
+    fig.savefig(job.output_path, dpi=dpi, **job.savefig_kwargs)
+    return job.filename
+
+
+class ChartRenderer:
+    """Render figures in a process pool, skipping those whose inputs are unchanged"""
+
+    def __init__(self, output_dir, dpi=RENDER_DPI, max_workers=RENDER_WORKERS):
+        self.output_dir = output_dir
+        self.dpi = dpi
+        self.max_workers = max_workers
+        self.manifest_file = output_dir / '.render_cache.json'
+
+    def _load_manifest(self):
+        if not self.manifest_file.exists():
+            return {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest):
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    def render(self, jobs):
+        """Render every job whose content hash changed since the last run"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._load_manifest()
+        hashes = {job.filename: job.content_hash(self.dpi) for job in jobs}
+
+        pending = []
+        for job in jobs:
+            if manifest.get(job.filename) == hashes[job.filename] and os.path.exists(job.output_path):
+                logger.info(f"  ✓ Up to date: {job.filename}")
+            else:
+                pending.append(job)
+
+        workers = min(self.max_workers or os.cpu_count() or 1, len(pending))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                rendered = list(pool.map(_render_job, pending, [self.dpi] * len(pending)))
+        else:
+            rendered = [_render_job(job, self.dpi) for job in pending]
+
+        for filename in rendered:
+            manifest[filename] = hashes[filename]
+            logger.info(f"  ✓ Saved: {filename}")
+
+        self._save_manifest(manifest)
+        return rendered
\ No newline at end of file
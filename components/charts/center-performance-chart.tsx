@@ -2,29 +2,55 @@
 
 import { RadarChart, PolarGrid, PolarAngleAxis, PolarRadiusAxis, Radar, ResponsiveContainer, Tooltip } from "recharts"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
+import { useAnalytics } from "@/hooks/use-analytics"
 
-const centerData = [
-  { center: "California SC", speed: 85, volume: 95, efficiency: 82, accuracy: 90 },
-  { center: "Nebraska SC", speed: 78, volume: 85, efficiency: 88, accuracy: 92 },
-  { center: "Texas SC", speed: 92, volume: 75, efficiency: 85, accuracy: 88 },
-  { center: "Vermont SC", speed: 88, volume: 65, efficiency: 90, accuracy: 94 },
-  { center: "National BC", speed: 75, volume: 90, efficiency: 80, accuracy: 86 },
+const chartColors = ["hsl(var(--chart-1))", "hsl(var(--chart-2))", "hsl(var(--chart-3))"]
+
+// One row per processing center, as exported to centers.json by run_analytics_export.py
+type CenterRow = {
+  center: string
+  applications: number
+  approvalRate: number
+  avgTime: number
+  p10: number
+  p50: number
+  p90: number
+}
+
+const sampleCenterData: CenterRow[] = [
+  { center: "California SC", applications: 9500, approvalRate: 90, avgTime: 45, p10: 28, p50: 43, p90: 66 },
+  { center: "Nebraska SC", applications: 8500, approvalRate: 92, avgTime: 52, p10: 34, p50: 50, p90: 70 },
+  { center: "Texas SC", applications: 7500, approvalRate: 88, avgTime: 38, p10: 25, p50: 37, p90: 52 },
+  { center: "Vermont SC", applications: 6500, approvalRate: 94, avgTime: 42, p10: 30, p50: 41, p90: 55 },
+  { center: "National BC", applications: 9000, approvalRate: 86, avgTime: 55, p10: 35, p50: 53, p90: 78 },
 ]
 
-const radarData = [
-  { metric: "Speed", California: 85, Nebraska: 78, Texas: 92, Vermont: 88 },
-  { metric: "Volume", California: 95, Nebraska: 85, Texas: 75, Vermont: 65 },
-  { metric: "Efficiency", California: 82, Nebraska: 88, Texas: 85, Vermont: 90 },
-  { metric: "Accuracy", California: 90, Nebraska: 92, Texas: 88, Vermont: 94 },
+// Each axis scores a center 0-100 against the best center on it
+const metrics: { metric: string; score: (row: CenterRow, rows: CenterRow[]) => number }[] = [
+  { metric: "Speed", score: (row, rows) => (Math.min(...rows.map((r) => r.avgTime)) / row.avgTime) * 100 },
+  { metric: "Volume", score: (row, rows) => (row.applications / Math.max(...rows.map((r) => r.applications))) * 100 },
+  { metric: "Approval", score: (row) => row.approvalRate },
+  {
+    metric: "Consistency",
+    score: (row, rows) => (Math.min(...rows.map((r) => r.p90 - r.p10)) / Math.max(row.p90 - row.p10, 1)) * 100,
+  },
 ]
 
 export function CenterPerformanceChart() {
+  const centerData = useAnalytics<CenterRow[]>("centers", sampleCenterData)
+  const plotted = centerData.slice(0, chartColors.length)
+  const radarData = metrics.map(({ metric, score }) => ({
+    metric,
+    ...Object.fromEntries(plotted.map((row) => [row.center, Math.round(score(row, centerData))])),
+  }))
+  const totalApplications = centerData.reduce((sum, row) => sum + row.applications, 0)
+
   return (
     <Card className="glass-panel border-border/50">
       <CardHeader>
         <CardTitle className="text-lg text-foreground">Processing Center Performance</CardTitle>
         <CardDescription className="text-muted-foreground">
-          Multi-dimensional comparison of service centers
+          Multi-dimensional comparison of the busiest service centers
         </CardDescription>
       </CardHeader>
       <CardContent>
@@ -49,48 +75,29 @@ export function CenterPerformanceChart() {
                   color: "hsl(var(--foreground))"
                 }}
               />
-              <Radar 
-                name="California SC" 
-                dataKey="California" 
-                stroke="hsl(var(--chart-1))" 
-                fill="hsl(var(--chart-1))" 
-                fillOpacity={0.3}
-                strokeWidth={2}
-              />
-              <Radar 
-                name="Texas SC" 
-                dataKey="Texas" 
-                stroke="hsl(var(--chart-2))" 
-                fill="hsl(var(--chart-2))" 
-                fillOpacity={0.2}
-                strokeWidth={2}
-              />
-              <Radar 
-                name="Vermont SC" 
-                dataKey="Vermont" 
-                stroke="hsl(var(--chart-3))" 
-                fill="hsl(var(--chart-3))" 
-                fillOpacity={0.1}
-                strokeWidth={2}
-              />
+              {plotted.map((row, index) => (
+                <Radar
+                  key={row.center}
+                  name={row.center}
+                  dataKey={row.center}
+                  stroke={chartColors[index]}
+                  fill={chartColors[index]}
+                  fillOpacity={0.3 - index * 0.1}
+                  strokeWidth={2}
+                />
+              ))}
             </RadarChart>
           </ResponsiveContainer>
         </div>
         
         {/* Legend */}
         <div className="flex flex-wrap justify-center gap-6 mt-4 pt-4 border-t border-border/50">
-          <div className="flex items-center gap-2">
-            <div className="w-3 h-3 rounded-full" style={{ backgroundColor: "hsl(var(--chart-1))" }} />
-            <span className="text-xs text-muted-foreground">California SC</span>
-          </div>
-          <div className="flex items-center gap-2">
-            <div className="w-3 h-3 rounded-full" style={{ backgroundColor: "hsl(var(--chart-2))" }} />
-            <span className="text-xs text-muted-foreground">Texas SC</span>
-          </div>
-          <div className="flex items-center gap-2">
-            <div className="w-3 h-3 rounded-full" style={{ backgroundColor: "hsl(var(--chart-3))" }} />
-            <span className="text-xs text-muted-foreground">Vermont SC</span>
-          </div>
+          {plotted.map((row, index) => (
+            <div key={row.center} className="flex items-center gap-2">
+              <div className="w-3 h-3 rounded-full" style={{ backgroundColor: chartColors[index] }} />
+              <span className="text-xs text-muted-foreground">{row.center}</span>
+            </div>
+          ))}
         </div>
 
         {/* Center Stats Table */}
@@ -104,11 +111,13 @@ export function CenterPerformanceChart() {
               </tr>
             </thead>
             <tbody>
-              {centerData.map((center) => (
+              {centerData.slice(0, 5).map((center) => (
                 <tr key={center.center} className="border-b border-border/30">
                   <td className="py-2 text-foreground">{center.center}</td>
-                  <td className="text-center py-2 text-foreground font-mono">{Math.round(100 - center.speed + 30)}</td>
-                  <td className="text-center py-2 text-muted-foreground font-mono">{center.volume}%</td>
+                  <td className="text-center py-2 text-foreground font-mono">{Math.round(center.avgTime)}</td>
+                  <td className="text-center py-2 text-muted-foreground font-mono">
+                    {Math.round((center.applications / totalApplications) * 100)}%
+                  </td>
                 </tr>
               ))}
             </tbody>
@@ -2,9 +2,13 @@
 
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, Cell } from "recharts"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
+import { useAnalytics } from "@/hooks/use-analytics"
 
-// Feature importance based on the ML pipeline's feature engineering
-const featureData = [
+type FeatureRow = { name: string; importance: number; category: string }
+type ImportanceExport = { model: string; method: string; features: FeatureRow[] }
+
+// Sample shown until run_feature_importance.py publishes feature_importance.json
+const sampleFeatureData: FeatureRow[] = [
   { name: "center_avg_time", importance: 0.342, category: "location" },
   { name: "nationality_avg_time", importance: 0.218, category: "demographic" },
   { name: "visa_type", importance: 0.156, category: "application" },
@@ -17,6 +21,8 @@ const featureData = [
   { name: "is_management", importance: 0.008, category: "employment" },
 ]
 
+const sampleImportance: ImportanceExport = { model: "Gradient Boosting", method: "impurity", features: sampleFeatureData }
+
 const categoryColors: Record<string, string> = {
   location: "hsl(var(--chart-1))",
   demographic: "hsl(var(--chart-2))",
@@ -28,12 +34,14 @@ const categoryColors: Record<string, string> = {
 }
 
 export function FeatureImportanceChart() {
+  const { model, method, features: featureData } = useAnalytics<ImportanceExport>("feature_importance", sampleImportance)
+
   return (
     <Card className="glass-panel border-border/50">
       <CardHeader>
         <CardTitle className="text-lg text-foreground">Feature Importance</CardTitle>
         <CardDescription className="text-muted-foreground">
-          Top 10 features by importance score from Gradient Boosting model
+          Top {featureData.length} features by {method === "permutation" ? "permutation importance" : "importance score"} from {model} model
         </CardDescription>
       </CardHeader>
       <CardContent>
@@ -66,12 +74,12 @@ export function FeatureImportanceChart() {
                   borderRadius: "8px",
                   color: "hsl(var(--foreground))"
                 }}
-                formatter={(value: number) => [`${(value * 100).toFixed(1)}%`, "Importance"]}
+                formatter={(value: number) => [`${(value * 100).toFixed(1)}%`, method === "permutation" ? "Share of R² drop" : "Importance"]}
                 labelFormatter={(label) => `Feature: ${label}`}
               />
               <Bar dataKey="importance" radius={[0, 4, 4, 0]}>
                 {featureData.map((entry, index) => (
-                  <Cell key={`cell-${index}`} fill={categoryColors[entry.category]} />
+                  <Cell key={`cell-${index}`} fill={categoryColors[entry.category] ?? "hsl(var(--muted-foreground))"} />
                 ))}
               </Bar>
             </BarChart>
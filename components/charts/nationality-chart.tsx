@@ -2,8 +2,22 @@
 
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, Cell } from "recharts"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
+import { useAnalytics } from "@/hooks/use-analytics"
 
-const nationalityData = [
+const chartColors = [
+  "hsl(var(--chart-1))",
+  "hsl(var(--chart-2))",
+  "hsl(var(--chart-3))",
+  "hsl(var(--chart-4))",
+  "hsl(var(--chart-5))",
+  "hsl(var(--primary))",
+  "hsl(var(--accent))",
+  "hsl(var(--muted-foreground))",
+]
+
+type NationalityRow = { country: string; avgTime: number; applications: number; color?: string }
+
+const sampleNationalityData: NationalityRow[] = [
   { country: "India", avgTime: 58, applications: 12500, color: "hsl(var(--chart-1))" },
   { country: "China", avgTime: 52, applications: 8200, color: "hsl(var(--chart-2))" },
   { country: "Mexico", avgTime: 45, applications: 4100, color: "hsl(var(--chart-3))" },
@@ -15,6 +29,16 @@ const nationalityData = [
 ]
 
 export function NationalityChart() {
+  const rows = useAnalytics<NationalityRow[]>("nationality", sampleNationalityData)
+  const nationalityData = rows
+    .slice(0, chartColors.length)
+    .map((row, index) => ({ ...row, avgTime: Math.round(row.avgTime), color: row.color ?? chartColors[index] }))
+
+  const totalApplications = nationalityData.reduce((sum, row) => sum + row.applications, 0)
+  const globalAverage = nationalityData.reduce((sum, row) => sum + row.avgTime * row.applications, 0) / totalApplications
+  const slowest = nationalityData.reduce((a, b) => (b.avgTime > a.avgTime ? b : a))
+  const fastest = nationalityData.reduce((a, b) => (b.avgTime < a.avgTime ? b : a))
+
   return (
     <Card className="glass-panel border-border/50">
       <CardHeader>
@@ -66,15 +90,15 @@ export function NationalityChart() {
         {/* Summary Stats */}
         <div className="grid grid-cols-3 gap-4 mt-4 pt-4 border-t border-border/50">
           <div className="text-center">
-            <p className="text-2xl font-bold text-amber-400 font-mono">India</p>
+            <p className="text-2xl font-bold text-amber-400 font-mono">{slowest.country}</p>
             <p className="text-xs text-muted-foreground">Longest Wait</p>
           </div>
           <div className="text-center">
-            <p className="text-2xl font-bold text-foreground font-mono">45.3</p>
+            <p className="text-2xl font-bold text-foreground font-mono">{globalAverage.toFixed(1)}</p>
             <p className="text-xs text-muted-foreground">Global Average</p>
           </div>
           <div className="text-center">
-            <p className="text-2xl font-bold text-emerald-400 font-mono">Japan</p>
+            <p className="text-2xl font-bold text-emerald-400 font-mono">{fastest.country}</p>
             <p className="text-xs text-muted-foreground">Fastest Processing</p>
           </div>
         </div>
@@ -7,6 +7,7 @@ import { Input } from "@/components/ui/input"
 import { Label } from "@/components/ui/label"
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select"
 import { Loader2, Brain, Calendar, DollarSign, Briefcase, GraduationCap, Globe, MapPin } from "lucide-react"
+import { useAnalytics } from "@/hooks/use-analytics"
 
 // Options based on the feature engineering from the ML pipeline
 const visaTypes = [
@@ -32,6 +33,21 @@ const jobCategories = [
   "Researcher", "Teacher", "Marketing", "Finance", "Other"
 ]
 
+// Split-conformal residual quantiles per predicted-days bin, exported by run_joint_model.py
+interface IntervalTable {
+  levels: number[]
+  edges: number[]
+  halfWidths: number[][]
+}
+
+const fallbackIntervals: IntervalTable = { levels: [0.95], edges: [], halfWidths: [[15]] }
+
+function lookupInterval(table: IntervalTable, days: number, level = 0.95) {
+  const bin = table.edges.filter(edge => edge <= days).length
+  const half = Math.round(table.halfWidths[bin][Math.max(table.levels.indexOf(level), 0)])
+  return { lower: Math.max(days - half, 0), upper: days + half }
+}
+
 interface FormData {
   visaType: string
   nationality: string
@@ -44,6 +60,7 @@ interface FormData {
 
 export function PredictionForm({ onPredict }: { onPredict: (result: PredictionResult) => void }) {
   const [isLoading, setIsLoading] = useState(false)
+  const intervals = useAnalytics<IntervalTable>("intervals", fallbackIntervals)
   const [formData, setFormData] = useState<FormData>({
     visaType: "",
     nationality: "",
@@ -77,14 +94,27 @@ export function PredictionForm({ onPredict }: { onPredict: (result: PredictionRe
       varianceFactors.season + 
       Math.floor(Math.random() * 10)
 
-    const confidenceInterval = {
-      lower: Math.max(predictedDays - 12, 15),
-      upper: predictedDays + 15
-    }
+    const confidenceInterval = lookupInterval(intervals, predictedDays)
+
+    // Placeholder status probabilities: there is no backend route yet. Once one serves JointPredictor,
+    // its p_<status> / visa_status / approval_probability columns replace this block
+    const approvalProbability = Math.min(
+      0.97,
+      0.82 + (varianceFactors.income < 0 ? 0.06 : 0) + (varianceFactors.education < 0 ? 0.04 : 0)
+    )
+    const statusProbabilities = [
+      { status: "Certified", probability: approvalProbability * 0.6 },
+      { status: "Certified-Expired", probability: approvalProbability * 0.4 },
+      { status: "Withdrawn", probability: (1 - approvalProbability) * 0.6 },
+      { status: "Denied", probability: (1 - approvalProbability) * 0.4 }
+    ]
 
     const result: PredictionResult = {
       predictedDays,
       confidenceInterval,
+      predictedStatus: statusProbabilities.reduce((best, s) => s.probability > best.probability ? s : best).status,
+      approvalProbability,
+      statusProbabilities,
       confidence: 0.9847,
       modelUsed: "Gradient Boosting",
       factors: [
@@ -281,6 +311,12 @@ export interface PredictionResult {
     lower: number
     upper: number
   }
+  predictedStatus: string
+  approvalProbability: number
+  statusProbabilities: {
+    status: string
+    probability: number
+  }[]
   confidence: number
   modelUsed: string
   factors: {
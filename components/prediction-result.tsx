@@ -84,7 +84,7 @@ export function PredictionResultDisplay({ result }: PredictionResultDisplayProps
                 Confidence Interval
               </span>
               <span className="text-sm text-muted-foreground">
-                95% confidence range
+                95% prediction interval
               </span>
             </div>
             
@@ -128,6 +128,32 @@ export function PredictionResultDisplay({ result }: PredictionResultDisplayProps
             </div>
           </div>
 
+          {/* Decision Outlook */}
+          <div className="glass-panel rounded-xl p-6 mb-6">
+            <div className="flex items-center justify-between mb-4">
+              <span className="text-sm font-medium text-foreground flex items-center gap-2">
+                <CheckCircle className="h-4 w-4 text-primary" />
+                Decision Outlook
+              </span>
+              <Badge className="bg-emerald-500/20 text-emerald-400 border-emerald-500/30">
+                {(result.approvalProbability * 100).toFixed(1)}% likely approved
+              </Badge>
+            </div>
+            <div className="space-y-3">
+              {result.statusProbabilities.map((item) => (
+                <div key={item.status}>
+                  <div className="flex justify-between text-sm mb-1">
+                    <span className={item.status === result.predictedStatus ? "font-medium text-foreground" : "text-muted-foreground"}>
+                      {item.status}
+                    </span>
+                    <span className="font-mono text-muted-foreground">{(item.probability * 100).toFixed(1)}%</span>
+                  </div>
+                  <Progress value={item.probability * 100} className="h-2 bg-secondary/50" />
+                </div>
+              ))}
+            </div>
+          </div>
+
           {/* Impact Factors */}
           <div>
             <h4 className="text-sm font-semibold text-foreground mb-4 flex items-center gap-2">
@@ -0,0 +1,73 @@
+import json
+import numpy as np
+from src.logger import logger
+from src.config import CONFORMAL_LEVELS, CONFORMAL_COVERAGE, CONFORMAL_BINS, CONFORMAL_MIN_BIN_SIZE
+
+
+class ConformalCalibrator:
+    """Split-conformal prediction intervals: residual quantiles tabulated per predicted-value bin at train time"""
+
+    def __init__(self, levels=CONFORMAL_LEVELS, n_bins=CONFORMAL_BINS, min_bin_size=CONFORMAL_MIN_BIN_SIZE):
+        self.levels = list(levels)
+        self.n_bins = n_bins
+        self.min_bin_size = min_bin_size
+        self.edges = np.array([])
+        self.half_widths = None
+
+    @staticmethod
+    def _quantiles(residuals, levels):
+        """Finite-sample conformal quantile: the ceil((n+1)·level)-th smallest residual"""
+        n = len(residuals)
+        ranks = np.minimum(np.ceil((n + 1) * np.asarray(levels)) / n, 1.0)
+        return np.quantile(residuals, ranks, method='higher')
+
+    def fit(self, y_true, y_pred):
+        """Calibrate on predictions the model did not train on (held-out, out-of-fold or out-of-bag)"""
+        y_true = np.asarray(y_true, dtype=float)
+        y_pred = np.asarray(y_pred, dtype=float)
+        valid = ~np.isnan(y_pred)
+        residuals = np.abs(y_true[valid] - y_pred[valid])
+        y_pred = y_pred[valid]
+
+        # Error grows with the predicted duration, so bin by prediction (Mondrian conformal)
+        self.edges = np.unique(np.quantile(y_pred, np.arange(1, self.n_bins) / self.n_bins))
+        bins = np.searchsorted(self.edges, y_pred, side='right')
+        overall = self._quantiles(residuals, self.levels)
+
+        self.half_widths = np.empty((len(self.edges) + 1, len(self.levels)))
+        for b in range(len(self.edges) + 1):
+            in_bin = residuals[bins == b]
+            self.half_widths[b] = self._quantiles(in_bin, self.levels) if len(in_bin) >= self.min_bin_size else overall
+        return self
+
+    def interval(self, y_pred, level=CONFORMAL_COVERAGE):
+        """Vectorized lookup: (lower, upper) for each prediction"""
+        y_pred = np.asarray(y_pred, dtype=float)
+        half = self.half_widths[np.searchsorted(self.edges, y_pred, side='right'), self.levels.index(level)]
+        return np.maximum(y_pred - half, 0.0), y_pred + half
+
+    def coverage(self, y_true, y_pred):
+        """Empirical coverage and mean width at every calibrated level"""
+        y_true = np.asarray(y_true, dtype=float)
+        report = {}
+        for level in self.levels:
+            lower, upper = self.interval(y_pred, level)
+            report[level] = {
+                'coverage': float(np.mean((y_true >= lower) & (y_true <= upper))),
+                'width': float(np.mean(upper - lower))
+            }
+        return report
+
+    def to_dict(self):
+        return {
+            'levels': self.levels,
+            'edges': np.round(self.edges, 2).tolist(),
+            'halfWidths': np.round(self.half_widths, 2).tolist()
+        }
+
+    def export(self, path):
+        """Write the calibration table for the web app"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        logger.info(f"✓ Interval table saved: {path}")
\ No newline at end of file
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+from src.config import CORRELATION_SAMPLE_SIZE, CORRELATION_TOP_K
+
+
+class CorrelationEngine:
+    """Streaming Pearson (mergeable co-moments) and sampled Spearman correlations, chunk by chunk"""
+
+    def __init__(self, target=None, sample_size=CORRELATION_SAMPLE_SIZE, random_state=42):
+        self.target = target
+        self.sample_size = sample_size
+        self.columns = []
+        self.n = 0
+        self.mean = None
+        self.comoment = None
+        self.rows_seen = 0
+        self.rows_skipped = 0
+        self._reservoir = None
+        self._reservoir_rows = 0
+        self._rng = np.random.default_rng(random_state)
+
+    @classmethod
+    def from_dataframe(cls, df, chunk_size=None, **kwargs):
+        """Accumulate a dataframe, optionally walking it in row chunks"""
+        engine = cls(**kwargs)
+        if not chunk_size or len(df) <= chunk_size:
+            return engine.update(df)
+
+        for start in range(0, len(df), chunk_size):
+            engine.update(df.iloc[start:start + chunk_size])
+        return engine
+
+    def update(self, chunk):
+        """Fold one chunk into the co-moments and the reservoir sample"""
+        if not self.columns:
+            numeric = chunk.select_dtypes(include=[np.number]).columns
+            self.columns = [col for col in numeric if chunk[col].notna().any()]
+            k = len(self.columns)
+            self.mean = np.zeros(k)
+            self.comoment = np.zeros((k, k))
+            self._reservoir = np.empty((0, k))
+
+        values = chunk.reindex(columns=self.columns).to_numpy(dtype=float)
+        self.rows_seen += len(values)
+
+        # Co-moments need complete rows; incomplete ones are counted and skipped
+        complete = ~np.isnan(values).any(axis=1)
+        self.rows_skipped += int((~complete).sum())
+        values = values[complete]
+        if len(values) == 0:
+            return self
+
+        chunk_mean = values.mean(axis=0)
+        centered = values - chunk_mean
+        self._merge(len(values), chunk_mean, centered.T @ centered)
+        self._sample(values)
+        return self
+
+    def _merge(self, n_b, mean_b, comoment_b):
+        """Chan et al. pairwise update of count, mean and co-moment matrix"""
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        self.comoment += comoment_b + np.outer(delta, delta) * (n_a * n_b / n)
+        self.mean += delta * (n_b / n)
+        self.n = n
+
+    def merge(self, other):
+        """Combine with an engine fitted on disjoint rows over the same columns"""
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge correlation engines over different columns")
+        if other.n:
+            self._merge(other.n, other.mean, other.comoment)
+        self.rows_seen += other.rows_seen
+        self.rows_skipped += other.rows_skipped
+        return self
+
+    def _sample(self, values):
+        """Algorithm R reservoir sample, vectorized over the chunk"""
+        fill = min(self.sample_size - len(self._reservoir), len(values))
+        if fill > 0:
+            self._reservoir = np.vstack([self._reservoir, values[:fill]])
+            self._reservoir_rows += fill
+
+        rest = values[fill:]
+        if len(rest) == 0:
+            return
+        seen = self._reservoir_rows + np.arange(len(rest))
+        accept = self._rng.random(len(rest)) < self.sample_size / (seen + 1)
+        slots = self._rng.integers(0, self.sample_size, int(accept.sum()))
+        # Fancy assignment keeps the last write per slot, matching the sequential algorithm
+        self._reservoir[slots] = rest[accept]
+        self._reservoir_rows += len(rest)
+
+    @property
+    def sample(self):
+        """Reservoir sample as a dataframe"""
+        return pd.DataFrame(self._reservoir, columns=self.columns)
+
+    def pearson(self):
+        """Pearson correlation matrix from the streamed co-moments"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scale = np.sqrt(np.diag(self.comoment))
+            corr = self.comoment / np.outer(scale, scale)
+        return pd.DataFrame(np.clip(corr, -1, 1), index=self.columns, columns=self.columns)
+
+    def spearman(self):
+        """Spearman correlation matrix from the reservoir sample (Pearson on average ranks)"""
+        return self.sample.rank().corr()
+
+    def matrix(self, method='pearson'):
+        """Full correlation matrix for the given method"""
+        return self.spearman() if method == 'spearman' else self.pearson()
+
+    def target_correlations(self, method='pearson'):
+        """Correlation of every feature with the target"""
+        if self.target not in self.columns:
+            return pd.Series(dtype=float)
+        if method == 'spearman':
+            ranks = self.sample.rank()
+            corr = ranks.drop(columns=self.target).corrwith(ranks[self.target])
+        else:
+            corr = self.pearson()[self.target].drop(self.target)
+        return corr.dropna()
+
+    def top_k(self, k=CORRELATION_TOP_K, method='pearson'):
+        """Strongest correlations with the target, ordered by absolute value"""
+        corr = self.target_correlations(method)
+        return corr.reindex(corr.abs().sort_values(ascending=False).index).head(k)
\ No newline at end of file
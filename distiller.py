@@ -0,0 +1,144 @@
+import time
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import (
+    DISTILL_STUDENTS, DISTILL_SYNTHETIC_ROWS, DISTILL_SWAP_PROBABILITY, DISTILL_TREE_DEPTH,
+    DISTILL_LATENCY_TARGET_MS
+)
+
+
+def build_student(name):
+    """Small models whose single-row predict stays well under a millisecond"""
+    if name == 'tree':
+        from sklearn.tree import DecisionTreeRegressor
+        return DecisionTreeRegressor(max_depth=DISTILL_TREE_DEPTH, min_samples_leaf=5, random_state=42)
+    if name == 'gbm':
+        from sklearn.ensemble import GradientBoostingRegressor
+        return GradientBoostingRegressor(n_estimators=50, learning_rate=0.2, max_depth=3, random_state=42)
+    if name == 'linear':
+        # Degree-1 splines per feature: a piecewise-linear additive model
+        from sklearn.linear_model import Ridge
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import SplineTransformer
+        return make_pipeline(SplineTransformer(n_knots=8, degree=1), Ridge(alpha=1.0))
+    raise ValueError(f"Unknown student: {name}")
+
+
+def augment(X, n_rows, swap_probability=DISTILL_SWAP_PROBABILITY, seed=42):
+    """Synthetic rows near the data: real rows with some features swapped in from other real rows"""
+    rng = np.random.RandomState(seed)
+    X = np.asarray(X)
+    synthetic = X[rng.randint(len(X), size=n_rows)].copy()
+    swap = rng.random_sample(synthetic.shape) < swap_probability
+    donors = X[rng.randint(len(X), size=n_rows)]
+    synthetic[swap] = donors[swap]
+    return synthetic
+
+
+def _latency_ms(model, X, repeats):
+    """Median wall time of one predict call, in milliseconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict(X)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings)) * 1000
+
+
+class Distiller:
+    """Fits small students to the tuned model's predictions on real and synthetic rows and measures the gap"""
+
+    def __init__(self, teacher, X_train, X_test, y_test, students=DISTILL_STUDENTS,
+                 synthetic_rows=DISTILL_SYNTHETIC_ROWS, latency_target_ms=DISTILL_LATENCY_TARGET_MS):
+        self.teacher = teacher
+        self.X_train = np.asarray(X_train)
+        self.X_test = np.asarray(X_test)
+        self.y_test = np.asarray(y_test, dtype=np.float64)
+        self.students = list(students)
+        self.synthetic_rows = synthetic_rows
+        self.latency_target_ms = latency_target_ms
+        self.models = {}
+        self.rows = []
+
+    @classmethod
+    def from_feature_store(cls, teacher, store=None, **kwargs):
+        from src.feature_store import FeatureStore
+        store = store or FeatureStore()
+        X_train, X_test, _, y_test = store.open()
+        return cls(teacher, X_train, X_test, y_test, **kwargs)
+
+    def _score(self, name, model, teacher_pred):
+        y_pred = model.predict(self.X_test)
+        error = y_pred - self.y_test
+        ss_tot = np.sum((self.y_test - self.y_test.mean()) ** 2)
+        row = {
+            'model': name,
+            'row_ms': _latency_ms(model, self.X_test[:1], 200),
+            'batch_ms': _latency_ms(model, self.X_test, 3),
+            'MAE': float(np.abs(error).mean()),
+            'R2': float(1 - np.sum(error ** 2) / ss_tot),
+            # Fidelity: how far the student strays from the teacher it replaces
+            'fidelity_RMSE': float(np.sqrt(np.mean((y_pred - teacher_pred) ** 2))),
+            'fidelity_R2': float(1 - np.sum((y_pred - teacher_pred) ** 2)
+                                 / np.sum((teacher_pred - teacher_pred.mean()) ** 2))
+        }
+        self.rows.append(row)
+        return row
+
+    def distill(self):
+        """Fit every student on the teacher's labels; return the most accurate one within the latency target"""
+        logger.info("\n" + "="*70)
+        logger.info("KNOWLEDGE DISTILLATION")
+        logger.info("="*70)
+
+        # Single-row timings on one thread, as an interactive request runs
+        n_jobs = getattr(self.teacher, 'n_jobs', None)
+        if n_jobs is not None:
+            self.teacher.n_jobs = 1
+
+        try:
+            transfer = np.vstack([self.X_train, augment(self.X_train, self.synthetic_rows)])
+            logger.info(f"  Labelling {len(self.X_train):,} real + {self.synthetic_rows:,} synthetic rows "
+                        f"with the teacher ({type(self.teacher).__name__})...")
+            soft_labels = self.teacher.predict(transfer)
+            teacher_pred = self.teacher.predict(self.X_test)
+            self._score('teacher', self.teacher, teacher_pred)
+        finally:
+            if n_jobs is not None:
+                self.teacher.n_jobs = n_jobs
+
+        for name in self.students:
+            model = build_student(name)
+            model.fit(transfer, soft_labels)
+            self.models[name] = model
+            row = self._score(name, model, teacher_pred)
+            logger.info(f"  ✓ {name}: fidelity R² {row['fidelity_R2']:.4f}, {row['row_ms']:.3f} ms/row")
+
+        fast = [row for row in self.rows[1:] if row['row_ms'] <= self.latency_target_ms]
+        if fast:
+            best = max(fast, key=lambda row: row['R2'])
+        else:
+            logger.warning(f"  ✗ No student predicts a row within {self.latency_target_ms} ms; serving the fastest")
+            best = min(self.rows[1:], key=lambda row: row['row_ms'])
+        self.best_name = best['model']
+        return self.best_name, self.models[self.best_name]
+
+    def report(self):
+        """Accuracy, fidelity to the teacher and latency of every model, on the test split"""
+        table = pd.DataFrame(self.rows)
+        teacher = self.rows[0]
+        logger.info("\n" + "-"*80)
+        logger.info(f"{'Model':<10} {'Row ms':>8} {'Batch ms':>9} {'MAE':>7} {'R2':>7} {'R2 gap':>8} "
+                    f"{'Fid. RMSE':>10} {'Fid. R2':>8}")
+        logger.info("-"*80)
+        for row in self.rows:
+            marker = " *" if row['model'] == self.best_name else ""
+            logger.info(f"{row['model']:<10} {row['row_ms']:>8.3f} {row['batch_ms']:>9.2f} {row['MAE']:>7.2f} "
+                        f"{row['R2']:>7.4f} {teacher['R2'] - row['R2']:>8.4f} {row['fidelity_RMSE']:>10.2f} "
+                        f"{row['fidelity_R2']:>8.4f}{marker}")
+        logger.info("-"*80)
+        best = next(row for row in self.rows if row['model'] == self.best_name)
+        logger.info(f"  ✓ Serving '{self.best_name}': {teacher['row_ms'] / best['row_ms']:.0f}× faster per row, "
+                    f"R² {teacher['R2']:.4f} -> {best['R2']:.4f}")
+        return table
\ No newline at end of file
@@ -1,9 +1,10 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from src.logger import logger
-from src.config import PROCESSED_DATA_DIR
+from src.config import PROCESSED_DATA_DIR, EDA_CUBE_DIMENSIONS, CHUNK_SIZE, CORRELATION_TARGET, CORRELATION_TOP_K
+from src.data_profiler import DataProfile
+from src.aggregation_cube import AggregationCube
+from src.correlation_engine import CorrelationEngine
 
 class ExploratoryDataAnalysis:
     """Comprehensive EDA with visualizations"""
@@ -11,8 +12,32 @@ class ExploratoryDataAnalysis:
     def __init__(self, df):
         self.df = df.copy()
         self.insights = {}
-        sns.set_style("whitegrid")
-        plt.rcParams['figure.figsize'] = (12, 6)
+        self._profile = None
+        self._cube = None
+        self._correlations = None
+    
+    @property
+    def profile(self):
+        """Single-pass data quality profile, cached on first use"""
+        if self._profile is None:
+            self._profile = DataProfile.from_dataframe(self.df)
+        return self._profile
+    
+    @property
+    def cube(self):
+        """Grouped counts, approvals, salary and processing-time stats, cached on first use"""
+        if self._cube is None:
+            dims = [dim for dim in EDA_CUBE_DIMENSIONS if dim in self.df.columns]
+            self._cube = AggregationCube.from_dataframe(self.df, dimensions=dims)
+        return self._cube
+    
+    @property
+    def correlations(self):
+        """Streaming correlation moments over the numeric columns, cached on first use"""
+        if self._correlations is None:
+            self._correlations = CorrelationEngine.from_dataframe(
+                self.df, chunk_size=CHUNK_SIZE, target=CORRELATION_TARGET)
+        return self._correlations
     
     def basic_statistics(self):
         """Generate basic statistics"""
@@ -46,13 +71,13 @@ class ExploratoryDataAnalysis:
         logger.info("MISSING VALUE ANALYSIS")
         logger.info("-"*70)
         
-        missing = self.df.isnull().sum()
-        if missing.sum() == 0:
+        missing = pd.Series(self.profile.null_counts)
+        if self.profile.total_missing == 0:
             logger.info("✓ No missing values - Dataset is complete!")
         else:
             logger.info("Missing values found:")
             for col, count in missing[missing > 0].items():
-                pct = (count / len(self.df)) * 100
+                pct = self.profile.missing_pct[col]
                 logger.info(f"  {col}: {count} ({pct:.2f}%)")
         
         self.insights['missing'] = missing.to_dict()
@@ -87,20 +112,25 @@ class ExploratoryDataAnalysis:
         logger.info("CORRELATION ANALYSIS")
         logger.info("-"*70)
         
-        numeric_df = self.df.select_dtypes(include=[np.number])
+        engine = self.correlations
         
-        if len(numeric_df.columns) > 1:
-            corr_matrix = numeric_df.corr()
+        if len(engine.columns) > 1:
+            logger.info(f"\nNumeric features: {len(engine.columns)} "
+                        f"({engine.n} complete rows, {engine.rows_skipped} skipped, "
+                        f"Spearman sample: {len(engine.sample)})")
             
             logger.info("\nTop correlations with target variable:")
-            if 'processing_time_days' in numeric_df.columns:
-                target_corr = corr_matrix['processing_time_days'].sort_values(ascending=False)
-                logger.info(f"\nCorrelations with 'processing_time_days':")
-                for feature, corr_val in target_corr.items():
-                    if feature != 'processing_time_days':
-                        logger.info(f"  {feature}: {corr_val:.3f}")
-            
-            self.insights['correlations'] = corr_matrix.to_dict()
+            if CORRELATION_TARGET in engine.columns:
+                pearson = engine.top_k(CORRELATION_TOP_K, method='pearson')
+                spearman = engine.target_correlations(method='spearman')
+                logger.info(f"\nCorrelations with '{CORRELATION_TARGET}' (Pearson / Spearman):")
+                for feature, corr_val in pearson.items():
+                    logger.info(f"  {feature}: {corr_val:.3f} / {spearman.get(feature, np.nan):.3f}")
+                
+                self.insights['correlations'] = {
+                    'pearson': pearson.to_dict(),
+                    'spearman': engine.top_k(CORRELATION_TOP_K, method='spearman').to_dict()
+                }
     
     def nationality_analysis(self):
         """Analyze visa approval by nationality"""
@@ -110,18 +140,15 @@ class ExploratoryDataAnalysis:
         
         if 'nationality' in self.df.columns and 'visa_status' in self.df.columns:
             logger.info("\nTop 10 nationalities by application count:")
-            top_nationalities = self.df['nationality'].value_counts().head(10)
+            by_nationality = self.cube.rollup(['nationality'])
+            top_nationalities = by_nationality['applications'].head(10)
             for idx, (nat, count) in enumerate(top_nationalities.items(), 1):
                 logger.info(f"  {idx}. {nat}: {count}")
             
             # Approval rate by nationality
             logger.info("\nVisa approval rate by top nationalities:")
-            for nat in top_nationalities.head(5).index:
-                nat_data = self.df[self.df['nationality'] == nat]
-                approved = (nat_data['visa_status'] == 'Approved').sum()
-                total = len(nat_data)
-                approval_rate = (approved / total) * 100
-                logger.info(f"  {nat}: {approval_rate:.1f}% ({approved}/{total})")
+            for nat, row in by_nationality.head(5).iterrows():
+                logger.info(f"  {nat}: {row['approval_rate']:.1f}% ({int(row['approved'])}/{int(row['applications'])})")
     
     def job_category_analysis(self):
         """Analyze visa approval by job category"""
@@ -131,17 +158,14 @@ class ExploratoryDataAnalysis:
         
         if 'naics_title' in self.df.columns and 'visa_status' in self.df.columns:
             logger.info("\nTop 10 industries by application count:")
-            top_industries = self.df['naics_title'].value_counts().head(10)
+            by_industry = self.cube.rollup(['naics_title'])
+            top_industries = by_industry['applications'].head(10)
             for idx, (ind, count) in enumerate(top_industries.items(), 1):
                 logger.info(f"  {idx}. {ind}: {count}")
             
             logger.info("\nVisa approval rate by top industries:")
-            for ind in top_industries.head(5).index:
-                ind_data = self.df[self.df['naics_title'] == ind]
-                approved = (ind_data['visa_status'] == 'Approved').sum()
-                total = len(ind_data)
-                approval_rate = (approved / total) * 100
-                logger.info(f"  {ind}: {approval_rate:.1f}% ({approved}/{total})")
+            for ind, row in by_industry.head(5).iterrows():
+                logger.info(f"  {ind}: {row['approval_rate']:.1f}% ({int(row['approved'])}/{int(row['applications'])})")
     
     def salary_analysis(self):
         """Analyze salary distribution and impact"""
@@ -160,7 +184,7 @@ class ExploratoryDataAnalysis:
             # Salary by visa status
             if 'visa_status' in self.df.columns:
                 logger.info("\nAverage salary by visa status:")
-                salary_by_status = self.df.groupby('visa_status')['annual_income_usd'].mean()
+                salary_by_status = self.cube.rollup(['visa_status'])['avg_salary'].sort_index()
                 for status, avg_salary in salary_by_status.items():
                     logger.info(f"  {status}: ${avg_salary:,.2f}")
     
@@ -172,19 +196,16 @@ class ExploratoryDataAnalysis:
         
         if 'application_date_month' in self.df.columns:
             logger.info("\nApplications by month:")
-            month_counts = self.df['application_date_month'].value_counts().sort_index()
+            by_month = self.cube.rollup(['application_date_month']).sort_index()
+            by_month = by_month[by_month.index.notna()]
             months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            for month_num, count in month_counts.items():
+            for month_num, count in by_month['applications'].items():
                 logger.info(f"  {months[int(month_num)-1]}: {count}")
             
             # Approval rate by month
             if 'visa_status' in self.df.columns:
                 logger.info("\nApproval rate by month:")
-                for month_num in sorted(self.df['application_date_month'].unique()):
-                    month_data = self.df[self.df['application_date_month'] == month_num]
-                    approved = (month_data['visa_status'] == 'Approved').sum()
-                    total = len(month_data)
-                    approval_rate = (approved / total) * 100
+                for month_num, approval_rate in by_month['approval_rate'].items():
                     logger.info(f"  {months[int(month_num)-1]}: {approval_rate:.1f}%")
     
     def run_all_analysis(self):
@@ -0,0 +1,187 @@
+import json
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import (
+    SELECTION_LEAK_COLUMNS, SELECTION_CORRELATION_THRESHOLD, SELECTION_MIN_IMPORTANCE, SELECTION_SAMPLE_SIZE,
+    SELECTION_MAX_ROUNDS, SELECTION_REPEATS
+)
+from src.featurizer import Featurizer
+
+
+class FeatureSelector:
+    """Prunes the engineered columns before training: leaks, constants, duplicates, then proxy-model elimination"""
+
+    def __init__(self, target='processing_time_days', leak_columns=SELECTION_LEAK_COLUMNS,
+                 correlation_threshold=SELECTION_CORRELATION_THRESHOLD, min_importance=SELECTION_MIN_IMPORTANCE,
+                 sample_size=SELECTION_SAMPLE_SIZE, max_rounds=SELECTION_MAX_ROUNDS, n_repeats=SELECTION_REPEATS):
+        self.target = target
+        self.leak_columns = list(leak_columns)
+        self.correlation_threshold = correlation_threshold
+        self.min_importance = min_importance
+        self.sample_size = sample_size
+        self.max_rounds = max_rounds
+        self.n_repeats = n_repeats
+        self.selected = []
+        self.dropped = {}
+        self.importances = {}
+        self.proxy_r2 = None
+
+    def _drop(self, columns, reason):
+        for col in columns:
+            self.dropped[col] = reason
+            logger.info(f"    ✗ {col}: {reason}")
+
+    def _leaks(self, features):
+        """Configured leaks plus anything computed from the target (its name appears in the column)"""
+        return [c for c in features if c in self.leak_columns or self.target in c]
+
+    @staticmethod
+    def _constants(df, features):
+        return [c for c in features if df[c].nunique(dropna=False) <= 1]
+
+    def _encodings(self, df, features):
+        """Numeric columns that are a frequency/count encoding of a kept categorical"""
+        categorical = [c for c in features if not pd.api.types.is_numeric_dtype(df[c]) and df[c].nunique() > 1]
+        duplicates = {}
+        for col in features:
+            if col in categorical or not pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            for cat in categorical:
+                keys = df[cat].astype(str)
+                if df[col].groupby(keys).nunique().max() > 1:
+                    continue
+                counts = keys.map(keys.value_counts())
+                if abs(df[col].corr(counts, method='spearman')) >= self.correlation_threshold:
+                    duplicates[col] = cat
+                    break
+        return duplicates
+
+    def _clusters(self, df, features):
+        """Numeric columns linked by |Spearman| >= threshold, grouped by single linkage"""
+        numeric = [c for c in features if pd.api.types.is_numeric_dtype(df[c])]
+        if len(numeric) < 2:
+            return []
+        corr = df[numeric].corr(method='spearman').abs().to_numpy()
+        parent = list(range(len(numeric)))
+
+        def root(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        rows, cols = np.where(np.triu(np.nan_to_num(corr) >= self.correlation_threshold, k=1))
+        for i, j in zip(rows, cols):
+            parent[root(i)] = root(j)
+        clusters = {}
+        for i, col in enumerate(numeric):
+            clusters.setdefault(root(i), []).append(col)
+        return [members for members in clusters.values() if len(members) > 1]
+
+    def _proxy_importance(self, df, features):
+        """Permutation R² drop of each feature for a shallow random forest scored on a holdout"""
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.inspection import permutation_importance
+        from sklearn.model_selection import train_test_split
+
+        # Canonicalization would add title-derived columns; the proxy scores source columns one-to-one
+        featurizer = Featurizer(canonicalize_titles=False)
+        X = featurizer.fit_transform(df[features])
+        y = df[self.target].to_numpy(dtype=np.float64)
+        X_fit, X_val, y_fit, y_val = train_test_split(X, y, test_size=0.25, random_state=42)
+
+        proxy = RandomForestRegressor(n_estimators=50, max_depth=12, min_samples_leaf=5,
+                                      max_features=0.5, random_state=42, n_jobs=-1)
+        proxy.fit(X_fit, y_fit)
+        result = permutation_importance(proxy, X_val, y_val, scoring='r2', n_repeats=self.n_repeats,
+                                        random_state=42, n_jobs=1)
+        return dict(zip(featurizer.feature_names, result.importances_mean)), proxy.score(X_val, y_val)
+
+    def fit(self, df):
+        """Select on ModelTrainer's training split so the held-out test rows never inform the schema"""
+        from sklearn.model_selection import train_test_split
+
+        logger.info("\n" + "="*70)
+        logger.info("FEATURE SELECTION")
+        logger.info("="*70)
+
+        train_index, _ = train_test_split(df.index, test_size=0.2, random_state=42)
+        df = df.loc[train_index]
+        if self.sample_size and self.sample_size < len(df):
+            df = df.sample(self.sample_size, random_state=42)
+        df = df[df[self.target].notna()]
+
+        features = [c for c in df.columns if c != self.target]
+        self.dropped = {}
+        logger.info(f"  {len(features)} candidate features on {len(df):,} training rows")
+
+        logger.info("\n  [1] Leaked and constant columns")
+        leaks = self._leaks(features)
+        self._drop([c for c in leaks if self.target in c], "derived from the target")
+        self._drop([c for c in leaks if self.target not in c], "not servable for a new application")
+        features = [c for c in features if c not in self.dropped]
+        self._drop(self._constants(df, features), "constant")
+        features = [c for c in features if c not in self.dropped]
+
+        logger.info("\n  [2] Duplicate encodings and correlated clusters")
+        for col, cat in self._encodings(df, features).items():
+            self._drop([col], f"encodes {cat}")
+        features = [c for c in features if c not in self.dropped]
+        strength = df[features].select_dtypes('number').corrwith(df[self.target], method='spearman').abs().fillna(0)
+        for members in self._clusters(df, features):
+            # The member that tracks the target best speaks for the cluster
+            keep = max(members, key=lambda c: strength[c])
+            self._drop([c for c in members if c != keep], f"correlated with {keep}")
+        features = [c for c in features if c not in self.dropped]
+
+        logger.info("\n  [3] Proxy-model elimination")
+        for round_number in range(1, self.max_rounds + 1):
+            self.importances, self.proxy_r2 = self._proxy_importance(df, features)
+            weak = [c for c in features if self.importances[c] < self.min_importance]
+            logger.info(f"    Round {round_number}: {len(features)} features, proxy R² = {self.proxy_r2:.4f}, "
+                        f"{len(weak)} below {self.min_importance}")
+            if not weak or len(weak) == len(features):
+                break
+            for col in weak:
+                self._drop([col], f"proxy importance {self.importances[col]:.4f}")
+            features = [c for c in features if c not in self.dropped]
+
+        self.selected = features
+        logger.info(f"\n  ✓ Kept {len(self.selected)} of {len(self.selected) + len(self.dropped)} features")
+        return self
+
+    def transform(self, df):
+        """The selected columns (and the target when present), in schema order"""
+        missing = [c for c in self.selected if c not in df.columns]
+        if missing:
+            raise ValueError(f"Missing selected columns: {missing}")
+        columns = self.selected + ([self.target] if self.target in df.columns else [])
+        return df[columns]
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+    def save(self, path):
+        """Write the chosen schema; serving and the training stages read it back"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'target': self.target,
+                'selected': self.selected,
+                'dropped': self.dropped,
+                'proxy_r2': self.proxy_r2,
+                'proxy_importance': {c: float(self.importances[c]) for c in self.selected if c in self.importances}
+            }, f, indent=2)
+        logger.info(f"✓ Feature schema saved: {path}")
+
+    @staticmethod
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        selector = FeatureSelector(target=schema['target'])
+        selector.selected = schema['selected']
+        selector.dropped = schema['dropped']
+        selector.proxy_r2 = schema.get('proxy_r2')
+        selector.importances = schema.get('proxy_importance', {})
+        return selector
\ No newline at end of file
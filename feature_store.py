@@ -0,0 +1,116 @@
+import hashlib
+import json
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import (
+    FEATURE_STORE_DIR, CANONICALIZE_JOB_TITLES, CATEGORICAL_ENCODING, CATEGORICAL_MIN_FREQUENCY,
+    CATEGORICAL_HASH_FEATURES, TARGET_ENCODING_FOLDS
+)
+
+
+class FeatureStore:
+    """Float32 memory-mapped design matrix written once and opened read-only by every process"""
+
+    MATRICES = ['X_train', 'X_test']
+    TARGETS = ['y_train', 'y_test']
+    INDICES = ['train_index', 'test_index']
+
+    def __init__(self, path=FEATURE_STORE_DIR):
+        self.path = path
+        self.metadata_file = path / 'metadata.json'
+
+    @staticmethod
+    def preparation_settings(categorical_encoding=CATEGORICAL_ENCODING):
+        """Config that changes the prepared matrices (or the linear view built beside them)"""
+        return {
+            'canonicalize_job_titles': CANONICALIZE_JOB_TITLES,
+            'categorical_encoding': categorical_encoding,
+            'categorical_min_frequency': CATEGORICAL_MIN_FREQUENCY,
+            'categorical_hash_features': CATEGORICAL_HASH_FEATURES,
+            'target_encoding_folds': TARGET_ENCODING_FOLDS
+        }
+
+    @staticmethod
+    def fingerprint(df, settings=None):
+        """Hash of the source frame and the preparation settings, used to detect a stale store"""
+        if settings is None:
+            settings = FeatureStore.preparation_settings()
+        digest = hashlib.sha1()
+        digest.update(','.join(map(str, df.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        digest.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def exists(self):
+        """Check whether a complete store is on disk"""
+        if not self.metadata_file.exists():
+            return False
+        names = self.MATRICES + self.TARGETS + self.INDICES
+        return all((self.path / f'{name}.npy').exists() for name in names)
+
+    def is_current(self, fingerprint):
+        """Check whether the store was built from data with this fingerprint"""
+        return self.exists() and self.metadata().get('fingerprint') == fingerprint
+
+    def metadata(self):
+        """Return the row and column metadata"""
+        with open(self.metadata_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_array(self, name, values, dtype):
+        """Stream an array into a .npy file through a writable memory map"""
+        values = np.asarray(values)
+        target = np.lib.format.open_memmap(self.path / f'{name}.npy', mode='w+', dtype=dtype, shape=values.shape)
+        target[:] = values
+        target.flush()
+        del target
+
+    def write(self, X_train, X_test, y_train, y_test, feature_names, train_index, test_index,
+              target_name='processing_time_days', fingerprint=None):
+        """Write the prepared, scaled matrices once"""
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._write_array('X_train', X_train, np.float32)
+        self._write_array('X_test', X_test, np.float32)
+        self._write_array('y_train', y_train, np.float64)
+        self._write_array('y_test', y_test, np.float64)
+        self._write_array('train_index', train_index, np.int64)
+        self._write_array('test_index', test_index, np.int64)
+
+        metadata = {
+            'feature_names': list(feature_names),
+            'target': target_name,
+            'n_features': int(np.shape(X_train)[1]),
+            'n_train': int(np.shape(X_train)[0]),
+            'n_test': int(np.shape(X_test)[0]),
+            'dtype': 'float32',
+            'fingerprint': fingerprint,
+            'created': datetime.now().isoformat(timespec='seconds')
+        }
+        with open(self.metadata_file, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
+        size_mb = sum((self.path / f'{name}.npy').stat().st_size for name in self.MATRICES) / 1e6
+        logger.info(f"  ✓ Feature store written: {self.path} ({size_mb:.1f} MB float32)")
+
+    def load(self, name):
+        """Open one array read-only without copying it into memory"""
+        return np.load(self.path / f'{name}.npy', mmap_mode='r')
+
+    def open(self):
+        """Open the design matrices as read-only memory maps and the targets as Series"""
+        if not self.exists():
+            raise FileNotFoundError(f"No feature store at {self.path}")
+
+        target = self.metadata().get('target')
+        train_index = pd.Index(np.asarray(self.load('train_index')))
+        test_index = pd.Index(np.asarray(self.load('test_index')))
+
+        return (
+            self.load('X_train'),
+            self.load('X_test'),
+            pd.Series(np.asarray(self.load('y_train')), index=train_index, name=target),
+            pd.Series(np.asarray(self.load('y_test')), index=test_index, name=target)
+        )
\ No newline at end of file
@@ -0,0 +1,190 @@
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import CANONICALIZE_JOB_TITLES, STATE_COLUMNS, DATE_FEATURES
+from src.title_canonicalizer import TitleCanonicalizer
+from src.state_normalizer import StateNormalizer
+
+MISSING_CATEGORY = '__missing__'
+
+
+def _as_category(values):
+    """Category labels as strings; NaN becomes its own label (pandas 3 keeps NaN through astype(str))"""
+    return values.astype(object).fillna(MISSING_CATEGORY).astype(str)
+
+
+def _parse_dates(values):
+    """The raw files' dd-mm-YYYY dates, falling back to ISO (processed frames) per value, never guessed per frame"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    parsed = pd.to_datetime(values, format='%d-%m-%Y', errors='coerce')
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(values[retry].astype(str), format='ISO8601', errors='coerce')
+    return parsed
+
+
+class Featurizer:
+    """Fitted application -> scaled matrix transform, pickled with the model so serving encodes exactly as training did"""
+
+    DATE_PARTS = ['dayofweek', 'year', 'month', 'day']
+    # Class-level defaults keep featurizers pickled before raw-file cleaning loadable
+    state_normalizer = None
+    state_columns = ()
+    date_columns = ()
+
+    def __init__(self, drop_columns=(), canonicalize_titles=CANONICALIZE_JOB_TITLES):
+        self.drop_columns = list(drop_columns)
+        self.canonicalize_titles = canonicalize_titles
+        self.title_canonicalizer = None
+        self.feature_names = []
+        self.categories = {}
+        self.frequencies = {}
+        self.mean_ = None
+        self.scale_ = None
+
+    @classmethod
+    def from_fitted(cls, feature_names, label_encoders, scaler, title_canonicalizer=None, source_df=None):
+        """Wrap ModelTrainer's fitted encoders and scaler so the tuned model can be served"""
+        featurizer = cls(canonicalize_titles=title_canonicalizer is not None)
+        featurizer.title_canonicalizer = title_canonicalizer
+        featurizer.feature_names = list(feature_names)
+        # astype(str) turns NaN into 'nan' under pandas 2 but keeps it as a float NaN under pandas 3
+        featurizer.categories = {
+            col: pd.Index([MISSING_CATEGORY if pd.isna(c) or c == 'nan' else str(c) for c in le.classes_])
+            for col, le in label_encoders.items()
+        }
+        featurizer.mean_ = np.asarray(scaler.mean_, dtype=np.float64)
+        featurizer.scale_ = np.asarray(scaler.scale_, dtype=np.float64)
+        if source_df is not None:
+            featurizer._fit_frequencies(source_df)
+        featurizer._fit_cleaning()
+        return featurizer
+
+    def _fit_cleaning(self):
+        """Repeat DataCleaner's state names and the processed ISO dates on raw files"""
+        self.state_columns = [c for c in self.categories if 'state' in c.lower() or c in STATE_COLUMNS]
+        self.date_columns = [c for c in self.categories if c in DATE_FEATURES]
+        # The memo travels with the pickle; serving never writes the shared cache file
+        self.state_normalizer = StateNormalizer(cache_file=None) if self.state_columns else None
+
+    def _clean(self, X):
+        """Raw spellings and dd-mm-YYYY dates -> the values the training vocabularies were built on"""
+        columns = [c for c in (*self.state_columns, *self.date_columns) if c in X.columns]
+        if not columns:
+            return X
+        X = X.copy()
+        for col in self.state_columns:
+            if col in X.columns:
+                X[col] = self.state_normalizer.normalize(X[col], verbose=False)
+        for col in self.date_columns:
+            if col in X.columns:
+                parsed = _parse_dates(X[col])
+                X[col] = parsed.dt.strftime('%Y-%m-%d').where(parsed.notna(), X[col])
+        return X
+
+    def _fit_frequencies(self, df):
+        """Keep the count aggregates behind *_frequency features so raw rows can be scored"""
+        for name in self.feature_names:
+            base = name[:-len('_frequency')]
+            if name.endswith('_frequency') and base in df.columns:
+                self.frequencies[base] = _as_category(df[base]).value_counts().to_dict()
+
+    def _derive(self, df):
+        """Rebuild engineered columns a raw application file does not carry"""
+        missing = [name for name in self.feature_names if name not in df.columns]
+        if not missing:
+            return df
+        df = df.copy()
+        for name in missing:
+            base = name[:-len('_frequency')]
+            if name.endswith('_frequency') and base in self.frequencies and base in df.columns:
+                df[name] = _as_category(df[base]).map(self.frequencies[base]).fillna(0)
+                continue
+            for part in self.DATE_PARTS:
+                base = name[:-len(part) - 1]
+                if name.endswith(f'_{part}') and base in df.columns:
+                    df[name] = getattr(_parse_dates(df[base]).dt, part)
+                    break
+        return df
+
+    def _to_numeric(self, X):
+        """Raw numeric fields as DataCleaner normalises them ("1,09,600.00" -> 109600.0)"""
+        columns = [c for c in self.feature_names
+                   if c not in self.categories and c in X.columns and not pd.api.types.is_numeric_dtype(X[c])]
+        if not columns:
+            return X
+        X = X.copy()
+        for col in columns:
+            raw = X[col]
+            X[col] = pd.to_numeric(raw.astype(str).str.replace(',', '', regex=False), errors='coerce')
+            unparsed = int((X[col].isna() & raw.notna()).sum())
+            if unparsed:
+                logger.warning(f"  ✗ {col}: {unparsed} value(s) could not be parsed as numbers; "
+                               f"imputed with the training mean")
+        return X
+
+    def _prepare(self, df):
+        X = self._derive(df)
+        X = X.drop(columns=[c for c in self.drop_columns if c in X.columns])
+        if self.title_canonicalizer is not None and 'job_title' in X.columns:
+            X = self.title_canonicalizer.transform_frame(X)
+        return self._to_numeric(self._clean(X))
+
+    def _encode(self, X):
+        """Categoricals become their training-vocabulary code (-1 when unseen)"""
+        columns = []
+        for col in self.feature_names:
+            if col in self.categories:
+                columns.append(self.categories[col].get_indexer(_as_category(X[col])).astype(np.float64))
+            else:
+                columns.append(pd.to_numeric(X[col], errors='coerce').to_numpy(dtype=np.float64))
+        return np.column_stack(columns)
+
+    def fit(self, df):
+        """Learn the column layout, category vocabularies and scaling"""
+        if self.canonicalize_titles and 'job_title' in df.columns:
+            self.title_canonicalizer = TitleCanonicalizer()
+
+        X = self._prepare(df)
+        self.feature_names = list(X.columns)
+        self.categories = {
+            col: pd.Index(sorted(_as_category(X[col]).unique()))
+            for col in self.feature_names if not pd.api.types.is_numeric_dtype(X[col])
+        }
+        self._fit_frequencies(df)
+        self._fit_cleaning()
+
+        matrix = self._encode(X)
+        self.mean_ = np.nanmean(matrix, axis=0)
+        self.scale_ = np.nanstd(matrix, axis=0)
+        self.scale_[~(self.scale_ > 0)] = 1.0
+        return self
+
+    def prepare(self, df):
+        """Raw application fields -> the training column layout, before encoding (for other encoders)"""
+        return self._prepare(df)[self.feature_names]
+
+    def transform(self, df):
+        """Scaled float32 matrix; missing numeric values are imputed with the training mean"""
+        X = self._prepare(df)
+        missing = [c for c in self.feature_names if c not in X.columns]
+        if missing:
+            raise ValueError(f"Missing feature columns: {missing}")
+        scaled = (self._encode(X) - self.mean_) / self.scale_
+        return np.nan_to_num(scaled, nan=0.0).astype(np.float32)
+
+    def fit_transform(self, df):
+        return self.fit(df).transform(df)
+
+    def save(self, path):
+        """Persist the fitted transform for serving"""
+        import joblib
+        joblib.dump(self, path)
+        logger.info(f"  ✓ Saved preprocessor: {path}")
+
+    @staticmethod
+    def load(path):
+        """Load a persisted featurizer"""
+        import joblib
+        return joblib.load(path)
\ No newline at end of file
@@ -0,0 +1,297 @@
+import io
+import time
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import (
+    COMPRESSION_TOLERANCE, COMPRESSION_DEPTHS, COMPRESSION_LEAF_TOLERANCE, COMPRESSION_MIN_TREES,
+    COMPRESSION_CHUNK_SIZE
+)
+
+
+def is_forest(model):
+    """Averaging ensembles of fitted regression trees (random forest, extra trees)"""
+    estimators = getattr(model, 'estimators_', None)
+    return isinstance(estimators, list) and len(estimators) > 0 and hasattr(estimators[0], 'tree_')
+
+
+def _tree_arrays(tree):
+    """Editable copy of one fitted sklearn tree"""
+    t = tree.tree_
+    return {
+        'left': t.children_left.copy(),
+        'right': t.children_right.copy(),
+        'feature': t.feature.copy(),
+        'threshold': t.threshold.copy(),
+        'value': t.value.reshape(-1).copy()
+    }
+
+
+def _depths(tree):
+    depth = np.zeros(len(tree['left']), dtype=np.int64)
+    for node in range(len(depth)):
+        # Children always follow their parent in sklearn's node order
+        if tree['left'][node] >= 0:
+            depth[tree['left'][node]] = depth[tree['right'][node]] = depth[node] + 1
+    return depth
+
+
+def _compact(tree):
+    """Drop nodes no longer reachable from the root and renumber the rest"""
+    keep = np.zeros(len(tree['left']), dtype=bool)
+    stack = [0]
+    while stack:
+        node = stack.pop()
+        keep[node] = True
+        if tree['left'][node] >= 0:
+            stack.extend((tree['left'][node], tree['right'][node]))
+    index = np.cumsum(keep) - 1
+    out = {key: values[keep] for key, values in tree.items()}
+    for side in ('left', 'right'):
+        out[side] = np.where(out[side] >= 0, index[np.maximum(out[side], 0)], -1)
+    return out
+
+
+def cap_depth(tree, max_depth):
+    """Internal nodes at max_depth become leaves predicting their own training mean"""
+    tree = {key: values.copy() for key, values in tree.items()}
+    at_cap = _depths(tree) >= max_depth
+    tree['left'][at_cap] = tree['right'][at_cap] = -1
+    return _compact(tree)
+
+
+def merge_leaves(tree, tolerance):
+    """Collapse sibling leaves whose predictions differ by at most `tolerance` into their parent, bottom-up"""
+    tree = {key: values.copy() for key, values in tree.items()}
+    left, right, value = tree['left'], tree['right'], tree['value']
+    # Reverse node order visits children before parents, so merges cascade upward in one pass
+    for node in range(len(left) - 1, -1, -1):
+        l, r = left[node], right[node]
+        if l >= 0 and left[l] < 0 and left[r] < 0 and abs(value[l] - value[r]) <= tolerance:
+            left[node] = right[node] = -1
+    return _compact(tree)
+
+
+def _float32_floor(threshold):
+    """Largest float32 <= threshold, so x <= t is unchanged for the float32 inputs sklearn trees compare"""
+    rounded = threshold.astype(np.float32)
+    above = rounded.astype(np.float64) > threshold
+    rounded[above] = np.nextafter(rounded[above], np.float32(-np.inf))
+    return rounded
+
+
+class CompactForest:
+    """Averaged regression trees packed into flat float32/int32 arrays and evaluated level by level in numpy"""
+
+    def __init__(self, trees, n_features):
+        self.n_features = n_features
+        self.n_trees = len(trees)
+        sizes = [len(t['left']) for t in trees]
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int32)
+        self.roots = offsets
+
+        left, right = [], []
+        for tree, offset in zip(trees, offsets):
+            own = np.arange(len(tree['left']), dtype=np.int32) + offset
+            leaf = tree['left'] < 0
+            # Leaves point at themselves, so a fixed number of steps lands every row on its leaf
+            left.append(np.where(leaf, own, tree['left'] + offset).astype(np.int32))
+            right.append(np.where(leaf, own, tree['right'] + offset).astype(np.int32))
+        self.left = np.concatenate(left)
+        self.right = np.concatenate(right)
+        feature_dtype = np.uint16 if n_features <= np.iinfo(np.uint16).max else np.int32
+        self.feature = np.concatenate([np.maximum(t['feature'], 0) for t in trees]).astype(feature_dtype)
+        self.threshold = _float32_floor(np.concatenate([t['threshold'] for t in trees]))
+        self.value = np.concatenate([t['value'] for t in trees]).astype(np.float32)
+        self.depth = max(int(_depths(t).max()) for t in trees)
+
+    @property
+    def n_nodes(self):
+        return len(self.left)
+
+    @property
+    def n_leaves(self):
+        return int((self.left == np.arange(self.n_nodes)).sum())
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        out = np.empty(len(X), dtype=np.float64)
+        for start in range(0, len(X), COMPRESSION_CHUNK_SIZE):
+            chunk = X[start:start + COMPRESSION_CHUNK_SIZE]
+            rows = np.arange(len(chunk))[:, None]
+            node = np.broadcast_to(self.roots, (len(chunk), self.n_trees))
+            for _ in range(self.depth):
+                go_left = chunk[rows, self.feature[node]] <= self.threshold[node]
+                node = np.where(go_left, self.left[node], self.right[node])
+            out[start:start + len(chunk)] = self.value[node].mean(axis=1, dtype=np.float64)
+        return out
+
+    def save(self, path):
+        import joblib
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self, path)
+        logger.info(f"✓ Compressed model saved: {path}")
+
+    @staticmethod
+    def load(path):
+        import joblib
+        return joblib.load(path)
+
+
+class ForestCompressor:
+    """Post-training compression of a fitted random forest: tree selection, depth capping, leaf merging, float32 storage"""
+
+    def __init__(self, model, X_test, y_test, tolerance=COMPRESSION_TOLERANCE, depths=COMPRESSION_DEPTHS,
+                 leaf_tolerance=COMPRESSION_LEAF_TOLERANCE, min_trees=COMPRESSION_MIN_TREES):
+        if not is_forest(model):
+            raise ValueError(f"Only fitted tree forests can be compressed, not {type(model).__name__}")
+        self.model = model
+        self.tolerance = tolerance
+        self.depths = list(depths)
+        self.leaf_tolerance = leaf_tolerance
+        self.min_trees = min_trees
+        self.rows = []
+
+        # Half the test split chooses the compression, the other half reports its cost
+        y_test = np.asarray(y_test, dtype=np.float64)
+        order = np.random.RandomState(42).permutation(len(y_test))
+        half = len(order) // 2
+        select, report = np.sort(order[:half]), np.sort(order[half:])
+        X_test = np.asarray(X_test, dtype=np.float32)
+        self.X_val, self.y_val = X_test[select], y_test[select]
+        self.X_report, self.y_report = X_test[report], y_test[report]
+
+    @classmethod
+    def from_feature_store(cls, model, store=None, **kwargs):
+        from src.feature_store import FeatureStore
+        store = store or FeatureStore()
+        _, X_test, _, y_test = store.open()
+        return cls(model, X_test, y_test, **kwargs)
+
+    def _rmse(self, forest):
+        return float(np.sqrt(np.mean((forest.predict(self.X_val) - self.y_val) ** 2)))
+
+    def _select_trees(self, trees, budget):
+        """Greedy forward selection: add the tree that most lowers validation RMSE of the running average
+
+        A floor on the tree count keeps a few lucky trees from fitting the small selection half
+        """
+        predictions = np.stack([CompactForest([t], self.model.n_features_in_).predict(self.X_val) for t in trees])
+        chosen, total = [], np.zeros(len(self.y_val))
+        remaining = list(range(len(trees)))
+        while remaining:
+            k = len(chosen) + 1
+            errors = [np.sqrt(np.mean(((total + predictions[i]) / k - self.y_val) ** 2)) for i in remaining]
+            best = remaining[int(np.argmin(errors))]
+            chosen.append(best)
+            remaining.remove(best)
+            total += predictions[best]
+            if len(chosen) >= self.min_trees and min(errors) <= budget:
+                break
+        return [trees[i] for i in sorted(chosen)]
+
+    @staticmethod
+    def _size(model):
+        import joblib
+        buffer = io.BytesIO()
+        joblib.dump(model, buffer)
+        return buffer.tell()
+
+    def _measure(self, name, model):
+        """Artifact size, batch and single-row latency, and accuracy on the report half"""
+        n_jobs = getattr(model, 'n_jobs', None)
+        if n_jobs is not None:
+            model.n_jobs = 1
+        try:
+            batch = min(self._time(lambda: model.predict(self.X_report)) for _ in range(3))
+            single = np.median([self._time(lambda: model.predict(self.X_report[:1])) for _ in range(50)])
+            y_pred = model.predict(self.X_report)
+        finally:
+            if n_jobs is not None:
+                model.n_jobs = n_jobs
+        if isinstance(model, CompactForest):
+            trees, nodes = model.n_trees, model.n_nodes
+        else:
+            trees, nodes = len(model.estimators_), sum(e.tree_.node_count for e in model.estimators_)
+        error = y_pred - self.y_report
+        ss_tot = np.sum((self.y_report - self.y_report.mean()) ** 2)
+        row = {
+            'model': name,
+            'trees': trees,
+            'nodes': nodes,
+            'size_kb': self._size(model) / 1024,
+            'batch_ms': batch * 1000,
+            'row_ms': single * 1000,
+            'MAE': float(np.abs(error).mean()),
+            'RMSE': float(np.sqrt(np.mean(error ** 2))),
+            'R2': float(1 - np.sum(error ** 2) / ss_tot)
+        }
+        self.rows.append(row)
+        return row
+
+    @staticmethod
+    def _time(fn):
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+
+    def compress(self):
+        """Apply each step only while validation RMSE stays within tolerance of the full forest"""
+        logger.info("\n" + "="*70)
+        logger.info("FOREST COMPRESSION")
+        logger.info("="*70)
+
+        trees = [_tree_arrays(e) for e in self.model.estimators_]
+        n_features = self.model.n_features_in_
+        baseline = self._rmse(CompactForest(trees, n_features))
+        budget = baseline * (1 + self.tolerance)
+        logger.info(f"  {len(trees)} trees, validation RMSE {baseline:.3f} (budget {budget:.3f}, "
+                    f"{len(self.y_val):,} selection rows / {len(self.y_report):,} report rows)")
+        self._measure('original', self.model)
+        self._measure('float32 arrays', CompactForest(trees, n_features))
+
+        trees = self._select_trees(trees, budget)
+        forest = CompactForest(trees, n_features)
+        logger.info(f"  ✓ Tree selection: kept {len(trees)} of {len(self.model.estimators_)} trees "
+                    f"(RMSE {self._rmse(forest):.3f})")
+        self._measure('+ tree selection', forest)
+
+        # Shallowest depth cap that keeps the selected trees within budget
+        for depth in sorted(d for d in self.depths if d < forest.depth):
+            capped = [cap_depth(t, depth) for t in trees]
+            if self._rmse(CompactForest(capped, n_features)) <= budget:
+                trees, forest = capped, CompactForest(capped, n_features)
+                logger.info(f"  ✓ Depth cap: {depth} (RMSE {self._rmse(forest):.3f})")
+                self._measure('+ depth cap', forest)
+                break
+        else:
+            logger.info(f"  ✗ Depth cap: no depth below {forest.depth} stays within the budget")
+
+        merged = [merge_leaves(t, self.leaf_tolerance) for t in trees]
+        candidate = CompactForest(merged, n_features)
+        if self._rmse(candidate) <= budget:
+            logger.info(f"  ✓ Leaf merging (±{self.leaf_tolerance} days): {forest.n_leaves:,} -> "
+                        f"{candidate.n_leaves:,} leaves (RMSE {self._rmse(candidate):.3f})")
+            forest = candidate
+            self._measure('+ leaf merging', forest)
+        else:
+            logger.info("  ✗ Leaf merging exceeds the budget; skipped")
+        return forest
+
+    def report(self):
+        """Size, latency and accuracy of each step, measured on the held-back report rows"""
+        table = pd.DataFrame(self.rows)
+        logger.info("\n" + "-"*90)
+        logger.info(f"{'Step':<18} {'Trees':>6} {'Nodes':>9} {'Size KB':>9} {'Batch ms':>9} {'Row ms':>8} "
+                    f"{'MAE':>7} {'RMSE':>7} {'R2':>7}")
+        logger.info("-"*90)
+        for row in self.rows:
+            logger.info(f"{row['model']:<18} {row['trees']:>6} {row['nodes']:>9,} {row['size_kb']:>9.1f} "
+                        f"{row['batch_ms']:>9.2f} {row['row_ms']:>8.3f} {row['MAE']:>7.2f} {row['RMSE']:>7.2f} "
+                        f"{row['R2']:>7.4f}")
+        logger.info("-"*90)
+        first, last = self.rows[0], self.rows[-1]
+        logger.info(f"  ✓ {first['size_kb'] / last['size_kb']:.1f}× smaller, "
+                    f"{first['batch_ms'] / last['batch_ms']:.1f}× faster batch, "
+                    f"R² {first['R2']:.4f} -> {last['R2']:.4f}")
+        return table
\ No newline at end of file
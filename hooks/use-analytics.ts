@@ -0,0 +1,25 @@
+import * as React from 'react'
+
+// Aggregates precomputed by run_analytics_export.py and served from public/
+const ANALYTICS_BASE_URL = '/data/analytics'
+
+export function useAnalytics<T>(name: string, fallback: T): T {
+  const [data, setData] = React.useState<T>(fallback)
+
+  React.useEffect(() => {
+    let cancelled = false
+    fetch(`${ANALYTICS_BASE_URL}/${name}.json`)
+      .then((res) => (res.ok ? res.json() : Promise.reject(res.status)))
+      .then((json: T) => {
+        if (!cancelled) setData(json)
+      })
+      .catch(() => {
+        // Keep the bundled sample data when no export has been published
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [name])
+
+  return data
+}
@@ -1,9 +1,8 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
-from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from src.logger import logger
+from src.feature_store import FeatureStore
+from src.search_coordinator import SearchCoordinator
 import warnings
 
 warnings.filterwarnings('ignore')
@@ -12,16 +11,35 @@ warnings.filterwarnings('ignore')
 class HyperparameterTuning:
     """Hyperparameter tuning for regression models"""
 
-    def __init__(self, X_train, X_test, y_train, y_test):
+    def __init__(self, X_train, X_test, y_train, y_test, fingerprint=None, feature_store_path=None, trial_store=None):
         self.X_train = X_train
         self.X_test = X_test
         self.y_train = y_train
         self.y_test = y_test
+        self.fingerprint = fingerprint
+        self.feature_store_path = feature_store_path
+        self.trial_store = trial_store
         self.best_models = {}
         self.tuning_results = {}
 
+    @classmethod
+    def from_feature_store(cls, store=None, trial_store=None):
+        """Tune on the shared memory-mapped matrix instead of a per-process copy"""
+        store = store or FeatureStore()
+        return cls(*store.open(), fingerprint=store.metadata().get('fingerprint'), feature_store_path=store.path,
+                   trial_store=trial_store)
+
+    def _search(self, model, param_grid, n_iter, cv):
+        """Random search through the persistent trial store: resumable, deduplicated, one process per core"""
+        coordinator = SearchCoordinator(
+            model, param_grid, n_iter, cv, self.X_train, self.y_train, fingerprint=self.fingerprint,
+            feature_store_path=self.feature_store_path, store=self.trial_store
+        )
+        return coordinator.best()
+
     def tune_gradient_boosting(self):
         """Tune Gradient Boosting Regressor"""
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
         logger.info("\n" + "=" * 70)
         logger.info("HYPERPARAMETER TUNING: GRADIENT BOOSTING REGRESSOR")
@@ -41,28 +59,13 @@ class HyperparameterTuning:
         logger.info(f"  learning_rate: {param_grid['learning_rate']}")
         logger.info(f"  max_depth: {param_grid['max_depth']}")
 
-        logger.info("\n[STEP 1] Performing Fast RandomizedSearchCV...")
-
-        gb_model = GradientBoostingRegressor(random_state=42)
-
-        random_search = RandomizedSearchCV(
-            estimator=gb_model,
-            param_distributions=param_grid,
-            n_iter=5,
-            cv=2,
-            scoring='r2',
-            n_jobs=1,
-            verbose=2,
-            random_state=42
-        )
+        logger.info("\n[STEP 1] Performing fast random search...")
 
-        random_search.fit(self.X_train, self.y_train)
+        best_model, best_params, best_score = self._search('Gradient Boosting', param_grid, n_iter=5, cv=2)
 
-        logger.info(f"\n✓ RandomizedSearchCV completed")
-        logger.info(f"  Best CV R² Score: {random_search.best_score_:.6f}")
-        logger.info(f"  Best Parameters: {random_search.best_params_}")
-
-        best_model = random_search.best_estimator_
+        logger.info(f"\n✓ Random search completed")
+        logger.info(f"  Best CV R² Score: {best_score:.6f}")
+        logger.info(f"  Best Parameters: {best_params}")
 
         y_pred_train = best_model.predict(self.X_train)
         y_pred_test = best_model.predict(self.X_test)
@@ -83,13 +86,14 @@ class HyperparameterTuning:
             'MAE': mae_test,
             'RMSE': rmse_test,
             'R2': r2_test,
-            'Best_Params': random_search.best_params_
+            'Best_Params': best_params
         }
 
-        return best_model, random_search.best_params_
+        return best_model, best_params
 
     def tune_random_forest(self):
         """Tune Random Forest"""
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 
         logger.info("\n" + "=" * 70)
         logger.info("HYPERPARAMETER TUNING: RANDOM FOREST REGRESSOR")
@@ -103,22 +107,7 @@ class HyperparameterTuning:
             'max_features': ['sqrt']
         }
 
-        rf_model = RandomForestRegressor(random_state=42, n_jobs=-1)
-
-        random_search = RandomizedSearchCV(
-            estimator=rf_model,
-            param_distributions=param_grid,
-            n_iter=5,
-            cv=2,
-            scoring='r2',
-            n_jobs=1,
-            verbose=2,
-            random_state=42
-        )
-
-        random_search.fit(self.X_train, self.y_train)
-
-        best_model = random_search.best_estimator_
+        best_model, best_params, _ = self._search('Random Forest', param_grid, n_iter=5, cv=2)
 
         y_pred_test = best_model.predict(self.X_test)
 
@@ -126,17 +115,17 @@ class HyperparameterTuning:
         rmse_test = np.sqrt(mean_squared_error(self.y_test, y_pred_test))
         r2_test = r2_score(self.y_test, y_pred_test)
 
-        logger.info(f"\n✓ Random Forest Best Params: {random_search.best_params_}")
+        logger.info(f"\n✓ Random Forest Best Params: {best_params}")
 
         self.best_models['Random Forest (Tuned)'] = best_model
         self.tuning_results['Random Forest (Tuned)'] = {
             'MAE': mae_test,
             'RMSE': rmse_test,
             'R2': r2_test,
-            'Best_Params': random_search.best_params_
+            'Best_Params': best_params
         }
 
-        return best_model, random_search.best_params_
+        return best_model, best_params
 
     def compare_tuned_models(self):
         """Compare tuned models"""
@@ -0,0 +1,139 @@
+import importlib.util
+import json
+import numpy as np
+from src.logger import logger
+from src.config import (
+    IMPORTANCE_SAMPLE_SIZE, IMPORTANCE_REPEATS, IMPORTANCE_WORKERS, IMPORTANCE_SHAP, IMPORTANCE_SHAP_ROWS,
+    IMPORTANCE_CACHE_DIR, IMPORTANCE_CATEGORIES, ANALYTICS_TOP_N
+)
+
+
+MODEL_NAMES = {'RandomForestRegressor': 'Random Forest', 'GradientBoostingRegressor': 'Gradient Boosting'}
+
+
+def model_name(model):
+    return MODEL_NAMES.get(type(model).__name__, type(model).__name__)
+
+
+def feature_category(name):
+    for prefix, category in IMPORTANCE_CATEGORIES:
+        if name.startswith(prefix):
+            return category
+    return 'other'
+
+
+class ImportanceEngine:
+    """Permutation importance (parallel across features, on a row subsample) and optional TreeSHAP, cached per model"""
+
+    def __init__(self, model, X, y, feature_names, sample_size=IMPORTANCE_SAMPLE_SIZE, n_repeats=IMPORTANCE_REPEATS,
+                 workers=IMPORTANCE_WORKERS, shap=IMPORTANCE_SHAP, cache_dir=IMPORTANCE_CACHE_DIR):
+        self.model = model
+        self.feature_names = list(feature_names)
+        self.n_repeats = n_repeats
+        self.workers = workers
+        self.shap = shap
+        self.cache_dir = cache_dir
+
+        # One fixed subsample: every feature and repeat is scored on the same rows
+        y = np.asarray(y)
+        if sample_size and sample_size < len(y):
+            rows = np.sort(np.random.RandomState(42).choice(len(y), sample_size, replace=False))
+            self.X, self.y = np.asarray(X[rows]), y[rows]
+        else:
+            self.X, self.y = np.asarray(X), y
+
+    @classmethod
+    def from_feature_store(cls, model, store=None, **kwargs):
+        """Explain a model on the shared test split"""
+        from src.feature_store import FeatureStore
+        store = store or FeatureStore()
+        _, X_test, _, y_test = store.open()
+        return cls(model, X_test, y_test, store.metadata()['feature_names'], **kwargs)
+
+    def _cache_file(self):
+        """Keyed on the fitted model, the scored rows and the settings, so a retrained model never hits"""
+        import joblib
+        key = joblib.hash((self.model, self.X, self.y, self.feature_names, self.n_repeats, self.shap))
+        return self.cache_dir / f'{key}.json'
+
+    def _permutation(self):
+        from sklearn.inspection import permutation_importance
+
+        # Features run on the worker pool; estimator threads inside each worker would oversubscribe it
+        n_jobs = getattr(self.model, 'n_jobs', None)
+        if n_jobs is not None and self.workers > 1:
+            self.model.n_jobs = 1
+        try:
+            result = permutation_importance(
+                self.model, self.X, self.y, scoring='r2', n_repeats=self.n_repeats,
+                random_state=42, n_jobs=self.workers
+            )
+        finally:
+            if n_jobs is not None:
+                self.model.n_jobs = n_jobs
+        return result.importances_mean, result.importances_std
+
+    def _shap(self):
+        """Mean |TreeSHAP contribution| per feature"""
+        import shap
+        rows = self.X[:IMPORTANCE_SHAP_ROWS]
+        values = shap.TreeExplainer(self.model).shap_values(rows)
+        return np.abs(values).mean(axis=0)
+
+    def compute(self):
+        """Per-feature importances, from the cache when this model was already explained"""
+        if self.shap and importlib.util.find_spec('shap') is None:
+            logger.warning("  ✗ shap is not installed; skipping TreeSHAP contributions")
+            self.shap = False
+
+        cache_file = self._cache_file()
+        if cache_file.exists():
+            logger.info(f"  ✓ Importances unchanged for this model: {cache_file.name}")
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        logger.info(f"  Permuting {len(self.feature_names)} features × {self.n_repeats} repeats "
+                    f"on {len(self.y):,} rows ({self.workers} workers)...")
+        mean, std = self._permutation()
+        impurity = getattr(self.model, 'feature_importances_', None)
+        shap_values = self._shap() if self.shap else None
+
+        features = []
+        for i, name in enumerate(self.feature_names):
+            row = {'name': name, 'category': feature_category(name),
+                   'r2Drop': float(mean[i]), 'std': float(std[i])}
+            if impurity is not None:
+                row['impurity'] = float(impurity[i])
+            if shap_values is not None:
+                row['shap'] = float(shap_values[i])
+            features.append(row)
+        features.sort(key=lambda row: row['r2Drop'], reverse=True)
+
+        # Share of the total positive R² drop, the scale the dashboard plots
+        total = sum(max(row['r2Drop'], 0.0) for row in features) or 1.0
+        for row in features:
+            row['importance'] = max(row['r2Drop'], 0.0) / total
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(features, f, indent=2)
+        return features
+
+    @staticmethod
+    def report(features, top_n=ANALYTICS_TOP_N):
+        logger.info("\n" + "-"*80)
+        logger.info(f"{'Feature':<50} {'R² drop':>10} {'± std':>8} {'Impurity':>9}")
+        logger.info("-"*80)
+        for row in features[:top_n]:
+            impurity = f"{row['impurity']:>9.3f}" if 'impurity' in row else f"{'-':>9}"
+            logger.info(f"{row['name']:<50} {row['r2Drop']:>10.4f} {row['std']:>8.4f} {impurity}")
+        logger.info("-"*80)
+
+    @staticmethod
+    def export(features, path, model_name, top_n=ANALYTICS_TOP_N):
+        """Write the top features for the dashboard chart"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'model': model_name, 'method': 'permutation', 'features': features[:top_n]},
+                      f, separators=(',', ':'))
+        logger.info(f"✓ Feature importance saved: {path}")
\ No newline at end of file
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import (
+    APPROVED_STATUSES, JOINT_STATUS_TARGET, JOINT_DAYS_TARGET, JOINT_EXCLUDE_COLUMNS, CONFORMAL_COVERAGE
+)
+from src.featurizer import Featurizer
+from src.conformal import ConformalCalibrator
+
+# scikit-learn is imported inside fit/evaluate; a loaded model only needs the
+# estimator classes that unpickling brings in.
+
+
+class JointModel:
+    """Visa status classifier and processing-time regressor behind one featurization and one predict"""
+
+    def __init__(self, status_target=JOINT_STATUS_TARGET, days_target=JOINT_DAYS_TARGET,
+                 exclude_columns=JOINT_EXCLUDE_COLUMNS):
+        self.status_target = status_target
+        self.days_target = days_target
+        self.featurizer = Featurizer(drop_columns=[status_target, days_target, *exclude_columns])
+        self.classifier = None
+        self.regressor = None
+        self.classes_ = None
+        self.calibrator = None
+        self.metrics = {}
+
+    @classmethod
+    def train_test(cls, df, test_size=0.2):
+        """Fit on a stratified split and score the held-out rows"""
+        from sklearn.model_selection import train_test_split
+
+        model = cls()
+        train_df, test_df = train_test_split(
+            df, test_size=test_size, random_state=42, stratify=df[model.status_target]
+        )
+        logger.info(f"  Training set: {len(train_df)} samples")
+        logger.info(f"  Testing set: {len(test_df)} samples")
+        model.fit(train_df)
+        model.evaluate(test_df)
+        return model
+
+    def fit(self, df):
+        """Featurize once, then fit both heads on the same matrix"""
+        from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+
+        logger.info("\n[JOINT] Featurizing training data...")
+        X = self.featurizer.fit_transform(df)
+        logger.info(f"  ✓ {X.shape[0]} rows × {X.shape[1]} features")
+
+        logger.info("\n[JOINT] Training status classifier...")
+        self.classifier = RandomForestClassifier(
+            n_estimators=100,
+            max_depth=15,
+            min_samples_leaf=2,
+            class_weight='balanced',
+            random_state=42,
+            n_jobs=-1
+        )
+        self.classifier.fit(X, df[self.status_target].astype(str))
+        self.classes_ = self.classifier.classes_
+
+        logger.info("[JOINT] Training processing-time regressor...")
+        self.regressor = RandomForestRegressor(
+            n_estimators=100,
+            max_depth=15,
+            min_samples_split=5,
+            min_samples_leaf=2,
+            oob_score=True,
+            random_state=42,
+            n_jobs=-1
+        )
+        self.regressor.fit(X, df[self.days_target])
+        logger.info("  ✓ Both heads trained")
+
+        # Out-of-bag predictions calibrate the intervals without any extra fits
+        self.calibrator = ConformalCalibrator().fit(df[self.days_target], self.regressor.oob_prediction_)
+        return self
+
+    def predict(self, df, level=CONFORMAL_COVERAGE):
+        """Status probabilities, most likely status, approval probability, days and its interval for each row"""
+        X = self.featurizer.transform(df)
+        proba = self.classifier.predict_proba(X)
+
+        result = pd.DataFrame(proba, columns=[f'p_{c}' for c in self.classes_], index=df.index)
+        result.insert(0, 'visa_status', self.classes_[proba.argmax(axis=1)])
+        result['approval_probability'] = proba[:, np.isin(self.classes_, APPROVED_STATUSES)].sum(axis=1)
+        result['processing_time_days'] = self.regressor.predict(X)
+        result['days_lower'], result['days_upper'] = self.calibrator.interval(result['processing_time_days'], level)
+        return result
+
+    def evaluate(self, df):
+        """Score both heads on held-out rows"""
+        from sklearn.metrics import (
+            accuracy_score, f1_score, log_loss, mean_absolute_error, mean_squared_error, r2_score
+        )
+
+        predictions = self.predict(df)
+        y_status = df[self.status_target].astype(str)
+        y_days = df[self.days_target]
+        proba = predictions[[f'p_{c}' for c in self.classes_]].to_numpy()
+
+        self.metrics = {
+            'Accuracy': accuracy_score(y_status, predictions['visa_status']),
+            'Macro_F1': f1_score(y_status, predictions['visa_status'], average='macro'),
+            'Log_Loss': log_loss(y_status, proba, labels=self.classes_),
+            'MAE': mean_absolute_error(y_days, predictions['processing_time_days']),
+            'RMSE': np.sqrt(mean_squared_error(y_days, predictions['processing_time_days'])),
+            'R2': r2_score(y_days, predictions['processing_time_days'])
+        }
+
+        logger.info("\n" + "-"*70)
+        logger.info("JOINT MODEL EVALUATION")
+        logger.info("-"*70)
+        logger.info(f"  Status accuracy:   {self.metrics['Accuracy']:.4f}")
+        logger.info(f"  Status macro F1:   {self.metrics['Macro_F1']:.4f}")
+        logger.info(f"  Status log loss:   {self.metrics['Log_Loss']:.4f}")
+        logger.info(f"  Days MAE:          {self.metrics['MAE']:.2f} days")
+        logger.info(f"  Days RMSE:         {self.metrics['RMSE']:.2f} days")
+        logger.info(f"  Days R² Score:     {self.metrics['R2']:.4f}")
+        for level, stats in self.calibrator.coverage(y_days, predictions['processing_time_days']).items():
+            self.metrics[f'Coverage_{level:.0%}'] = stats['coverage']
+            logger.info(f"  {level:.0%} interval:      {stats['coverage']:.1%} coverage, {stats['width']:.1f} days wide")
+        return self.metrics
+
+    def save(self, path):
+        """Persist featurizer and both heads as one artifact"""
+        import joblib
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self, path)
+        logger.info(f"✓ Saved joint model: {path}")
+
+    @staticmethod
+    def load(path):
+        import joblib
+        return joblib.load(path)
\ No newline at end of file
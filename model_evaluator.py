@@ -1,10 +1,115 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from src.logger import logger
-from src.config import PROCESSED_DATA_DIR
+from src.config import PROCESSED_DATA_DIR, EVALUATION_DPI
+from src.feature_store import FeatureStore
+from src.chart_renderer import ChartRenderer, RenderJob, dense_scatter
+
+
+def _model_grid(n_models):
+    """One panel per model, two per row; unused panels are hidden"""
+    from matplotlib.figure import Figure
+
+    rows = max(1, -(-n_models // 2))
+    fig = Figure(figsize=(14, 5 * rows))
+    axes = fig.subplots(rows, 2, squeeze=False).flatten()
+    for ax in axes[n_models:]:
+        ax.set_visible(False)
+    return fig, axes
+
+
+def draw_predictions(y_test, results):
+    """Actual vs predicted values per model"""
+    fig, axes = _model_grid(len(results))
+    
+    for idx, (model_name, metrics) in enumerate(results.items()):
+        dense_scatter(axes[idx], y_test, metrics['y_pred'], alpha=0.5, s=30)
+        axes[idx].plot([y_test.min(), y_test.max()], 
+                       [y_test.min(), y_test.max()], 
+                       'r--', lw=2)
+        
+        axes[idx].set_xlabel('Actual Processing Time (days)')
+        axes[idx].set_ylabel('Predicted Processing Time (days)')
+        axes[idx].set_title(f"{model_name}\nR² = {metrics['R2']:.4f}, MAE = {metrics['MAE']:.2f}")
+        axes[idx].grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+    return fig
+
+
+def draw_residuals(y_test, results):
+    """Residuals against predictions per model"""
+    fig, axes = _model_grid(len(results))
+    
+    for idx, (model_name, metrics) in enumerate(results.items()):
+        y_pred = metrics['y_pred']
+        dense_scatter(axes[idx], y_pred, y_test - y_pred, alpha=0.5, s=30)
+        axes[idx].axhline(y=0, color='r', linestyle='--', lw=2)
+        
+        axes[idx].set_xlabel('Predicted Values')
+        axes[idx].set_ylabel('Residuals')
+        axes[idx].set_title(f'{model_name} - Residual Plot')
+        axes[idx].grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+    return fig
+
+
+def draw_error_distribution(y_test, results):
+    """Absolute error histogram per model"""
+    fig, axes = _model_grid(len(results))
+    
+    for idx, (model_name, metrics) in enumerate(results.items()):
+        errors = np.abs(y_test - metrics['y_pred'])
+        
+        axes[idx].hist(errors, bins=30, color='#3498db', edgecolor='black', alpha=0.7)
+        axes[idx].set_xlabel('Absolute Error (days)')
+        axes[idx].set_ylabel('Frequency')
+        axes[idx].set_title(f'{model_name} - Error Distribution')
+        axes[idx].axvline(errors.mean(), color='r', linestyle='--', 
+                          label=f'Mean: {errors.mean():.2f}')
+        axes[idx].legend()
+        axes[idx].grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+    return fig
+
+
+def draw_model_comparison(models, maes, rmses, r2s):
+    """MAE, RMSE and R² bars across models"""
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(15, 5))
+    axes = fig.subplots(1, 3)
+    
+    # MAE comparison
+    axes[0].bar(models, maes, color='#3498db', edgecolor='black')
+    axes[0].set_ylabel('Mean Absolute Error (days)')
+    axes[0].set_title('MAE Comparison')
+    axes[0].tick_params(axis='x', rotation=45)
+    for i, v in enumerate(maes):
+        axes[0].text(i, v, f'{v:.2f}', ha='center', va='bottom')
+    
+    # RMSE comparison
+    axes[1].bar(models, rmses, color='#e74c3c', edgecolor='black')
+    axes[1].set_ylabel('Root Mean Squared Error (days)')
+    axes[1].set_title('RMSE Comparison')
+    axes[1].tick_params(axis='x', rotation=45)
+    for i, v in enumerate(rmses):
+        axes[1].text(i, v, f'{v:.2f}', ha='center', va='bottom')
+    
+    # R2 comparison
+    axes[2].bar(models, r2s, color='#2ecc71', edgecolor='black')
+    axes[2].set_ylabel('R² Score')
+    axes[2].set_title('R² Score Comparison')
+    axes[2].set_ylim(0, 1)
+    axes[2].tick_params(axis='x', rotation=45)
+    for i, v in enumerate(r2s):
+        axes[2].text(i, v, f'{v:.4f}', ha='center', va='bottom')
+    
+    fig.tight_layout()
+    return fig
+
 
 class ModelEvaluator:
     """Evaluate model performance"""
@@ -12,125 +117,76 @@ class ModelEvaluator:
     def __init__(self, y_test, results):
         self.y_test = y_test
         self.results = results
-        sns.set_style("whitegrid")
+        self.renderer = ChartRenderer(PROCESSED_DATA_DIR, dpi=EVALUATION_DPI)
+    
+    @classmethod
+    def from_feature_store(cls, results, store=None):
+        """Evaluate against the test targets held in the shared feature store"""
+        store = store or FeatureStore()
+        _, _, _, y_test = store.open()
+        return cls(y_test, results)
+    
+    def _plot_inputs(self):
+        """Only the arrays and scores the figures need, so jobs pickle and hash cheaply"""
+        return {
+            'y_test': np.asarray(self.y_test, dtype=float),
+            'results': {
+                name: {'y_pred': np.asarray(metrics['y_pred'], dtype=float),
+                       'R2': metrics['R2'], 'MAE': metrics['MAE']}
+                for name, metrics in self.results.items()
+            }
+        }
+    
+    def _job(self, draw, filename, inputs):
+        return RenderJob(draw, PROCESSED_DATA_DIR / filename, inputs, bbox_inches='tight')
+    
+    def predictions_job(self):
+        return self._job(draw_predictions, 'model_predictions.png', self._plot_inputs())
+    
+    def residuals_job(self):
+        return self._job(draw_residuals, 'model_residuals.png', self._plot_inputs())
+    
+    def error_distribution_job(self):
+        return self._job(draw_error_distribution, 'model_errors.png', self._plot_inputs())
+    
+    def model_comparison_job(self):
+        models = list(self.results.keys())
+        return self._job(draw_model_comparison, 'model_comparison.png', {
+            'models': models,
+            'maes': [self.results[m]['MAE'] for m in models],
+            'rmses': [self.results[m]['RMSE'] for m in models],
+            'r2s': [self.results[m]['R2'] for m in models]
+        })
     
     def plot_predictions(self):
         """Plot actual vs predicted values"""
         logger.info("\nGenerating: Predictions visualization...")
-        
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        axes = axes.flatten()
-        
-        for idx, (model_name, metrics) in enumerate(self.results.items()):
-            y_pred = metrics['y_pred']
-            
-            axes[idx].scatter(self.y_test, y_pred, alpha=0.5, s=30)
-            axes[idx].plot([self.y_test.min(), self.y_test.max()], 
-                          [self.y_test.min(), self.y_test.max()], 
-                          'r--', lw=2)
-            
-            r2 = metrics['R2']
-            mae = metrics['MAE']
-            
-            axes[idx].set_xlabel('Actual Processing Time (days)')
-            axes[idx].set_ylabel('Predicted Processing Time (days)')
-            axes[idx].set_title(f'{model_name}\nR² = {r2:.4f}, MAE = {mae:.2f}')
-            axes[idx].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(PROCESSED_DATA_DIR / 'model_predictions.png', dpi=300, bbox_inches='tight')
-        logger.info("  ✓ Saved: model_predictions.png")
-        plt.close()
+        self.renderer.render([self.predictions_job()])
     
     def plot_residuals(self):
         """Plot residual analysis"""
         logger.info("\nGenerating: Residuals visualization...")
-        
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        axes = axes.flatten()
-        
-        for idx, (model_name, metrics) in enumerate(self.results.items()):
-            y_pred = metrics['y_pred']
-            residuals = self.y_test - y_pred
-            
-            axes[idx].scatter(y_pred, residuals, alpha=0.5, s=30)
-            axes[idx].axhline(y=0, color='r', linestyle='--', lw=2)
-            
-            axes[idx].set_xlabel('Predicted Values')
-            axes[idx].set_ylabel('Residuals')
-            axes[idx].set_title(f'{model_name} - Residual Plot')
-            axes[idx].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(PROCESSED_DATA_DIR / 'model_residuals.png', dpi=300, bbox_inches='tight')
-        logger.info("  ✓ Saved: model_residuals.png")
-        plt.close()
+        self.renderer.render([self.residuals_job()])
     
     def plot_error_distribution(self):
         """Plot error distribution"""
         logger.info("\nGenerating: Error distribution visualization...")
-        
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        axes = axes.flatten()
-        
-        for idx, (model_name, metrics) in enumerate(self.results.items()):
-            y_pred = metrics['y_pred']
-            errors = np.abs(self.y_test - y_pred)
-            
-            axes[idx].hist(errors, bins=30, color='#3498db', edgecolor='black', alpha=0.7)
-            axes[idx].set_xlabel('Absolute Error (days)')
-            axes[idx].set_ylabel('Frequency')
-            axes[idx].set_title(f'{model_name} - Error Distribution')
-            axes[idx].axvline(errors.mean(), color='r', linestyle='--', 
-                             label=f'Mean: {errors.mean():.2f}')
-            axes[idx].legend()
-            axes[idx].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(PROCESSED_DATA_DIR / 'model_errors.png', dpi=300, bbox_inches='tight')
-        logger.info("  ✓ Saved: model_errors.png")
-        plt.close()
+        self.renderer.render([self.error_distribution_job()])
     
     def plot_model_comparison(self):
         """Plot model performance comparison"""
         logger.info("\nGenerating: Model comparison visualization...")
-        
-        models = list(self.results.keys())
-        maes = [self.results[m]['MAE'] for m in models]
-        rmses = [self.results[m]['RMSE'] for m in models]
-        r2s = [self.results[m]['R2'] for m in models]
-        
-        fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-        
-        # MAE comparison
-        axes[0].bar(models, maes, color='#3498db', edgecolor='black')
-        axes[0].set_ylabel('Mean Absolute Error (days)')
-        axes[0].set_title('MAE Comparison')
-        axes[0].tick_params(axis='x', rotation=45)
-        for i, v in enumerate(maes):
-            axes[0].text(i, v, f'{v:.2f}', ha='center', va='bottom')
-        
-        # RMSE comparison
-        axes[1].bar(models, rmses, color='#e74c3c', edgecolor='black')
-        axes[1].set_ylabel('Root Mean Squared Error (days)')
-        axes[1].set_title('RMSE Comparison')
-        axes[1].tick_params(axis='x', rotation=45)
-        for i, v in enumerate(rmses):
-            axes[1].text(i, v, f'{v:.2f}', ha='center', va='bottom')
-        
-        # R2 comparison
-        axes[2].bar(models, r2s, color='#2ecc71', edgecolor='black')
-        axes[2].set_ylabel('R² Score')
-        axes[2].set_title('R² Score Comparison')
-        axes[2].set_ylim(0, 1)
-        axes[2].tick_params(axis='x', rotation=45)
-        for i, v in enumerate(r2s):
-            axes[2].text(i, v, f'{v:.4f}', ha='center', va='bottom')
-        
-        plt.tight_layout()
-        plt.savefig(PROCESSED_DATA_DIR / 'model_comparison.png', dpi=300, bbox_inches='tight')
-        logger.info("  ✓ Saved: model_comparison.png")
-        plt.close()
+        self.renderer.render([self.model_comparison_job()])
+    
+    def plot_all(self):
+        """Render every evaluation figure in parallel"""
+        logger.info("\nGenerating: Evaluation visualizations...")
+        self.renderer.render([
+            self.predictions_job(),
+            self.residuals_job(),
+            self.error_distribution_job(),
+            self.model_comparison_job()
+        ])
     
     def generate_report(self):
         """Generate evaluation report"""
@@ -155,6 +211,13 @@ class ModelEvaluator:
             logger.info(f"    Min Error:      {errors.min():.2f} days")
             logger.info(f"    Max Error:      {errors.max():.2f} days")
             logger.info(f"    90% within:     {np.percentile(errors, 90):.2f} days")
+            
+            calibrator = metrics.get('calibrator')
+            if calibrator is not None:
+                logger.info(f"\n  Prediction Intervals (split-conformal, test set):")
+                for level, stats in calibrator.coverage(self.y_test, y_pred).items():
+                    logger.info(f"    {level:.0%} interval:   {stats['coverage']:.1%} coverage, "
+                                f"{stats['width']:.1f} days wide")
     
     def run_evaluation(self):
         """Run all evaluations"""
@@ -162,10 +225,7 @@ class ModelEvaluator:
         logger.info("MILESTONE 3: MODEL EVALUATION")
         logger.info("="*70)
         
-        self.plot_predictions()
-        self.plot_residuals()
-        self.plot_error_distribution()
-        self.plot_model_comparison()
+        self.plot_all()
         self.generate_report()
         
         logger.info("\n" + "="*70)
@@ -1,30 +1,51 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.svm import SVR
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 from src.logger import logger
-import joblib
+from src.config import CANONICALIZE_JOB_TITLES, CATEGORICAL_ENCODING
+from src.title_canonicalizer import TitleCanonicalizer
+from src.feature_store import FeatureStore
+from src.conformal import ConformalCalibrator
+from src.featurizer import Featurizer
+from src.categorical_encoder import CategoricalEncoder, matrix_nbytes
+from src.stacking import stacking_folds
+
+# scikit-learn is imported inside the methods that need it so that importing
+# this module (e.g. from a serving worker) stays cheap.
 
 class ModelTrainer:
     """Train regression models for processing time prediction"""
     
-    def __init__(self, df):
+    # Fitted on the CATEGORICAL_ENCODING view rather than the label-coded matrix
+    LINEAR_VIEW_MODELS = ('Linear Regression', 'SVR')
+    
+    def __init__(self, df, feature_store=None, categorical_encoding=CATEGORICAL_ENCODING, oof_store=None):
         self.df = df.copy()
+        self.feature_store = feature_store
+        self.oof_store = oof_store
+        self.categorical_encoding = categorical_encoding
         self.X_train = None
         self.X_test = None
         self.y_train = None
         self.y_test = None
         self.models = {}
         self.results = {}
-        self.scaler = StandardScaler()
+        self.scaler = None
         self.label_encoders = {}
+        self.title_canonicalizer = None
+        self.featurizer = None
+        self.categorical_encoder = None
+        self.X_train_linear = None
+        self.X_test_linear = None
+    
+    def _fingerprint(self):
+        """Feature store fingerprint under this trainer's encoding"""
+        return FeatureStore.fingerprint(self.df, FeatureStore.preparation_settings(self.categorical_encoding))
     
     def prepare_data(self):
         """Prepare data for modeling"""
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import LabelEncoder, StandardScaler
+        
         logger.info("\n[STEP 1] Preparing data for modeling...")
         
         # Check if target variable exists
@@ -41,6 +62,15 @@ class ModelTrainer:
         logger.info(f"  Features shape: {X.shape}")
         logger.info(f"  Target shape: {y.shape}")
         
+        # Collapse free-text job titles before encoding
+        if CANONICALIZE_JOB_TITLES and 'job_title' in X.columns:
+            logger.info("\n  Canonicalizing job titles...")
+            self.title_canonicalizer = TitleCanonicalizer()
+            X = self.title_canonicalizer.transform_frame(X)
+        
+        # Linear and kernel models encode categoricals from the unencoded columns
+        X_raw = X.copy()
+        
         # Handle categorical variables
         logger.info("\n  Encoding categorical variables...")
         categorical_cols = X.select_dtypes(include=['object']).columns
@@ -62,30 +92,91 @@ class ModelTrainer:
         
         # Scale features
         logger.info("\n  Scaling features...")
+        self.scaler = StandardScaler()
         self.X_train = self.scaler.fit_transform(self.X_train)
         self.X_test = self.scaler.transform(self.X_test)
         logger.info("  ✓ Features scaled successfully")
         
+        # The same encoders and scaler as one transform that batch scoring and serving can load
+        self.featurizer = Featurizer.from_fitted(
+            X.columns, self.label_encoders, self.scaler, self.title_canonicalizer, source_df=self.df
+        )
+        self._check_featurizer_parity()
+        
+        # Share the scaled matrix with tuning/evaluation processes through a read-only memory map
+        if self.feature_store is not None:
+            self.feature_store.write(
+                self.X_train, self.X_test, self.y_train, self.y_test,
+                feature_names=X.columns,
+                train_index=self.y_train.index,
+                test_index=self.y_test.index,
+                target_name=target_col,
+                fingerprint=self._fingerprint()
+            )
+            self.X_train, self.X_test, _, _ = self.feature_store.open()
+        
+        self._encode_linear_view(X_raw)
+        
         return True
     
+    def _check_featurizer_parity(self):
+        """The served featurizer must reproduce the test matrix the models are scored on"""
+        served = self.featurizer.transform(self.df.loc[self.y_test.index])
+        expected = np.nan_to_num(np.asarray(self.X_test, dtype=np.float64))
+        mismatched = [name for name, ok in zip(self.featurizer.feature_names,
+                                               np.isclose(served, expected, atol=1e-4).all(axis=0)) if not ok]
+        if mismatched:
+            raise ValueError(f"Featurizer does not reproduce the training encoding for: {mismatched}")
+        logger.info("  ✓ Featurizer reproduces the test matrix")
+    
+    def _encode_linear_view(self, X):
+        """Encode categoricals per CATEGORICAL_ENCODING for the linear and kernel models; trees keep the compact codes"""
+        if self.categorical_encoding == 'label':
+            self.X_train_linear, self.X_test_linear = self.X_train, self.X_test
+            return
+        
+        logger.info(f"\n  Encoding categoricals for linear models ({self.categorical_encoding})...")
+        self.categorical_encoder = CategoricalEncoder(self.categorical_encoding)
+        self.X_train_linear = self.categorical_encoder.fit_transform(X.loc[self.y_train.index], self.y_train)
+        self.X_test_linear = self.categorical_encoder.transform(X.loc[self.y_test.index])
+        
+        layout = 'sparse CSR' if self.categorical_encoder.is_sparse else 'dense'
+        size_mb = (matrix_nbytes(self.X_train_linear) + matrix_nbytes(self.X_test_linear)) / 1e6
+        logger.info(f"  ✓ {self.X_train_linear.shape[1]} columns, {size_mb:.1f} MB ({layout})")
+    
+    def _cross_validate(self, model, X=None):
+        """5-fold CV R² plus the out-of-fold predictions that calibrate the prediction intervals"""
+        from sklearn.model_selection import cross_val_predict
+        from sklearn.metrics import r2_score
+        
+        X = self.X_train if X is None else X
+        y = np.asarray(self.y_train)
+        folds = stacking_folds(len(y))
+        oof_pred = cross_val_predict(model, X, y, cv=folds)
+        cv_score = np.mean([r2_score(y[test], oof_pred[test]) for _, test in folds])
+        return cv_score, oof_pred
+    
     def train_linear_regression(self):
         """Train Linear Regression model"""
+        from sklearn.linear_model import LinearRegression
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        
         logger.info("\n" + "-"*70)
         logger.info("TRAINING: Linear Regression")
         logger.info("-"*70)
         
         model = LinearRegression()
-        model.fit(self.X_train, self.y_train)
+        model.fit(self.X_train_linear, self.y_train)
         
         # Predictions
-        y_pred_train = model.predict(self.X_train)
-        y_pred_test = model.predict(self.X_test)
+        y_pred_train = model.predict(self.X_train_linear)
+        y_pred_test = model.predict(self.X_test_linear)
         
         # Evaluate
         mae = mean_absolute_error(self.y_test, y_pred_test)
         rmse = np.sqrt(mean_squared_error(self.y_test, y_pred_test))
         r2 = r2_score(self.y_test, y_pred_test)
-        cv_score = cross_val_score(model, self.X_train, self.y_train, cv=5, scoring='r2').mean()
+        cv_score, oof_pred = self._cross_validate(model, self.X_train_linear)
         
         logger.info(f"  Train MAE: {mean_absolute_error(self.y_train, y_pred_train):.2f} days")
         logger.info(f"  Test MAE: {mae:.2f} days")
@@ -99,13 +190,18 @@ class ModelTrainer:
             'RMSE': rmse,
             'R2': r2,
             'CV_Score': cv_score,
-            'y_pred': y_pred_test
+            'y_pred': y_pred_test,
+            'oof_pred': oof_pred,
+            'calibrator': ConformalCalibrator().fit(self.y_train, oof_pred)
         }
         
         return model
     
     def train_random_forest(self):
         """Train Random Forest model"""
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        
         logger.info("\n" + "-"*70)
         logger.info("TRAINING: Random Forest Regressor")
         logger.info("-"*70)
@@ -128,7 +224,7 @@ class ModelTrainer:
         mae = mean_absolute_error(self.y_test, y_pred_test)
         rmse = np.sqrt(mean_squared_error(self.y_test, y_pred_test))
         r2 = r2_score(self.y_test, y_pred_test)
-        cv_score = cross_val_score(model, self.X_train, self.y_train, cv=5, scoring='r2').mean()
+        cv_score, oof_pred = self._cross_validate(model)
         
         logger.info(f"  Train MAE: {mean_absolute_error(self.y_train, y_pred_train):.2f} days")
         logger.info(f"  Test MAE: {mae:.2f} days")
@@ -143,6 +239,8 @@ class ModelTrainer:
             'R2': r2,
             'CV_Score': cv_score,
             'y_pred': y_pred_test,
+            'oof_pred': oof_pred,
+            'calibrator': ConformalCalibrator().fit(self.y_train, oof_pred),
             'feature_importance': model.feature_importances_
         }
         
@@ -150,6 +248,9 @@ class ModelTrainer:
     
     def train_gradient_boosting(self):
         """Train Gradient Boosting model"""
+        from sklearn.ensemble import GradientBoostingRegressor
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        
         logger.info("\n" + "-"*70)
         logger.info("TRAINING: Gradient Boosting Regressor")
         logger.info("-"*70)
@@ -172,7 +273,7 @@ class ModelTrainer:
         mae = mean_absolute_error(self.y_test, y_pred_test)
         rmse = np.sqrt(mean_squared_error(self.y_test, y_pred_test))
         r2 = r2_score(self.y_test, y_pred_test)
-        cv_score = cross_val_score(model, self.X_train, self.y_train, cv=5, scoring='r2').mean()
+        cv_score, oof_pred = self._cross_validate(model)
         
         logger.info(f"  Train MAE: {mean_absolute_error(self.y_train, y_pred_train):.2f} days")
         logger.info(f"  Test MAE: {mae:.2f} days")
@@ -187,6 +288,8 @@ class ModelTrainer:
             'R2': r2,
             'CV_Score': cv_score,
             'y_pred': y_pred_test,
+            'oof_pred': oof_pred,
+            'calibrator': ConformalCalibrator().fit(self.y_train, oof_pred),
             'feature_importance': model.feature_importances_
         }
         
@@ -194,22 +297,25 @@ class ModelTrainer:
     
     def train_svr(self):
         """Train Support Vector Regressor"""
+        from sklearn.svm import SVR
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        
         logger.info("\n" + "-"*70)
         logger.info("TRAINING: Support Vector Regressor (SVR)")
         logger.info("-"*70)
         
         model = SVR(kernel='rbf', C=100, epsilon=0.1)
-        model.fit(self.X_train, self.y_train)
+        model.fit(self.X_train_linear, self.y_train)
         
         # Predictions
-        y_pred_train = model.predict(self.X_train)
-        y_pred_test = model.predict(self.X_test)
+        y_pred_train = model.predict(self.X_train_linear)
+        y_pred_test = model.predict(self.X_test_linear)
         
         # Evaluate
         mae = mean_absolute_error(self.y_test, y_pred_test)
         rmse = np.sqrt(mean_squared_error(self.y_test, y_pred_test))
         r2 = r2_score(self.y_test, y_pred_test)
-        cv_score = cross_val_score(model, self.X_train, self.y_train, cv=5, scoring='r2').mean()
+        cv_score, oof_pred = self._cross_validate(model, self.X_train_linear)
         
         logger.info(f"  Train MAE: {mean_absolute_error(self.y_train, y_pred_train):.2f} days")
         logger.info(f"  Test MAE: {mae:.2f} days")
@@ -223,11 +329,25 @@ class ModelTrainer:
             'RMSE': rmse,
             'R2': r2,
             'CV_Score': cv_score,
-            'y_pred': y_pred_test
+            'y_pred': y_pred_test,
+            'oof_pred': oof_pred,
+            'calibrator': ConformalCalibrator().fit(self.y_train, oof_pred)
         }
         
         return model
     
+    def save_oof_predictions(self):
+        """Persist every model's out-of-fold and test predictions so stacking never refits the roster"""
+        fingerprint = self._fingerprint()
+        linear = self.categorical_encoder is not None
+        for name, result in self.results.items():
+            view = 'linear' if linear and name in self.LINEAR_VIEW_MODELS else 'tree'
+            self.oof_store.save(name, self.models[name], result['oof_pred'], result['y_pred'], view, fingerprint,
+                                result['CV_Score'])
+        if linear:
+            self.oof_store.save_encoder(self.categorical_encoder, fingerprint)
+        logger.info(f"\n  ✓ Out-of-fold predictions saved for stacking: {self.oof_store.path}")
+    
     def get_best_model(self):
         """Get best model based on R2 score"""
         logger.info("\n" + "="*70)
@@ -275,6 +395,9 @@ class ModelTrainer:
         self.train_gradient_boosting()
         self.train_svr()
         
+        if self.oof_store is not None:
+            self.save_oof_predictions()
+        
         # Get best model
         best_model_name, best_model = self.get_best_model()
         
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+from src.config import AGGREGATE_FOLDS, AGGREGATE_SMOOTHING
+
+
+def assign_folds(n_rows, n_folds=AGGREGATE_FOLDS):
+    """Shuffled, balanced fold ids; seeded so every aggregate over the same rows shares them"""
+    return np.random.RandomState(42).permutation(n_rows) % n_folds
+
+
+class OutOfFoldAggregator:
+    """Smoothed group means of a label where no row sees its own fold, in one pass of sums and counts"""
+
+    def __init__(self, n_folds=AGGREGATE_FOLDS, smoothing=AGGREGATE_SMOOTHING):
+        self.n_folds = n_folds
+        self.smoothing = smoothing
+        self.table = None
+        self.prior = None
+
+    def fit_transform(self, keys, values, fold_ids=None):
+        """Out-of-fold feature for the fitting rows: each fold's sums are subtracted from the group totals"""
+        codes, groups = pd.factorize(keys)
+        values = np.asarray(values, dtype=np.float64)
+        if fold_ids is None:
+            fold_ids = assign_folds(len(codes), self.n_folds)
+        fold_ids = np.asarray(fold_ids)
+        n_folds = int(fold_ids.max()) + 1
+        m = self.smoothing
+
+        # One bincount over (group, fold) cells replaces a groupby per fold
+        known = codes >= 0
+        cells = codes[known] * n_folds + fold_ids[known]
+        size = len(groups) * n_folds
+        fold_sums = np.bincount(cells, weights=values[known], minlength=size).reshape(-1, n_folds)
+        fold_counts = np.bincount(cells, minlength=size).reshape(-1, n_folds)
+        group_sums = fold_sums.sum(axis=1)
+        group_counts = fold_counts.sum(axis=1)
+
+        # Each fold shrinks toward the overall mean of the other folds
+        total_by_fold = np.bincount(fold_ids, weights=values, minlength=n_folds)
+        rows_by_fold = np.bincount(fold_ids, minlength=n_folds)
+        fold_prior = (total_by_fold.sum() - total_by_fold) / np.maximum(rows_by_fold.sum() - rows_by_fold, 1)
+
+        prior = fold_prior[fold_ids]
+        result = prior.copy()
+        group, fold = codes[known], fold_ids[known]
+        sums = group_sums[group] - fold_sums[group, fold]
+        counts = group_counts[group] - fold_counts[group, fold]
+        result[known] = np.where(
+            counts + m > 0, (sums + m * prior[known]) / np.maximum(counts + m, 1e-12), prior[known]
+        )
+
+        # Full-data statistics serve rows outside the fit
+        self.prior = float(values.mean())
+        self.table = pd.Series((group_sums + m * self.prior) / np.maximum(group_counts + m, 1e-12), index=groups)
+        return result
+
+    def transform(self, keys):
+        """Smoothed full-fit group means; unseen groups get the overall mean"""
+        return pd.Series(keys).map(self.table).fillna(self.prior).to_numpy(dtype=np.float64)
\ No newline at end of file
@@ -0,0 +1,233 @@
+from src.config import (
+    RAW_DATA_FILE, PROCESSED_DATA_FILE, PROCESSED_DATA_DIR, REPORT_FILE, ML_READY_FILE,
+    FEATURE_STORE_DIR, MODEL_RESULTS_FILE, TUNING_RESULTS_FILE, BEST_MODEL_FILE, PREPROCESSOR_FILE,
+    TITLE_CANONICALIZER_FILE, JOINT_MODEL_FILE, ANALYTICS_EXPORT_DIR, INTERVALS_EXPORT_FILE,
+    VALIDATION_RULES, MISSING_VALUE_THRESHOLD, OUTLIER_METHOD, STATE_COLUMNS, STATE_ALIASES,
+    STATE_FUZZY_CUTOFF, CANONICALIZE_JOB_TITLES, JOINT_EXCLUDE_COLUMNS,
+    CONFORMAL_LEVELS, CONFORMAL_BINS, CONFORMAL_MIN_BIN_SIZE, CATEGORICAL_ENCODING, CATEGORICAL_MIN_FREQUENCY,
+    CATEGORICAL_HASH_FEATURES, TARGET_ENCODING_FOLDS,
+    CUBE_DIMENSIONS, CUBE_BIN_DAYS, CUBE_MAX_DAYS, ANALYTICS_TOP_N, APPROVED_STATUSES, RENDER_DPI, EVALUATION_DPI,
+    IMPORTANCE_SAMPLE_SIZE, IMPORTANCE_REPEATS, IMPORTANCE_SHAP, IMPORTANCE_SHAP_ROWS, IMPORTANCE_CATEGORIES,
+    IMPORTANCE_EXPORT_FILE, FEATURE_SCHEMA_FILE, SELECTION_LEAK_COLUMNS, SELECTION_CORRELATION_THRESHOLD,
+    SELECTION_MIN_IMPORTANCE, SELECTION_SAMPLE_SIZE, SELECTION_MAX_ROUNDS, SELECTION_REPEATS,
+    COMPRESSED_MODEL_FILE, COMPRESSION_REPORT_FILE, COMPRESSION_TOLERANCE, COMPRESSION_DEPTHS,
+    COMPRESSION_LEAF_TOLERANCE, COMPRESSION_MIN_TREES, STUDENT_MODEL_FILE, DISTILL_REPORT_FILE, DISTILL_STUDENTS,
+    DISTILL_SYNTHETIC_ROWS, DISTILL_SWAP_PROBABILITY, DISTILL_TREE_DEPTH, DISTILL_LATENCY_TARGET_MS,
+    STACKING_DIR, STACKED_MODEL_FILE, STACKING_FOLDS, SCATTER_POINT_THRESHOLD
+)
+from src.stage_graph import Stage
+
+# Stage bodies import their heavy dependencies lazily so that planning a
+# run (or a dry run) never loads pandas or scikit-learn.
+
+
+def preprocess():
+    """Milestone 1: load, clean, engineer and validate the raw applications"""
+    from src.pipeline import DataPipeline
+    DataPipeline().run()
+
+
+def remove_leakage():
+    """Milestone 1.5: drop columns unknown at application time"""
+    from src.remove_data_leakage import DataLeakageRemover
+    DataLeakageRemover().run()
+
+
+def export_analytics():
+    """Refresh the dashboard aggregates from the processed dataset"""
+    import pandas as pd
+    from src.analytics_export import AnalyticsExporter
+    AnalyticsExporter().run(pd.read_csv(PROCESSED_DATA_FILE))
+
+
+def select_features():
+    """Prune leaked, constant and redundant columns and save the schema training and serving use"""
+    import pandas as pd
+    from src.feature_selector import FeatureSelector
+    FeatureSelector().fit(pd.read_csv(ML_READY_FILE)).save(FEATURE_SCHEMA_FILE)
+
+
+def train():
+    """Milestone 3: build the feature store and train the baseline models"""
+    import joblib
+    import pandas as pd
+    from src.feature_selector import FeatureSelector
+    from src.feature_store import FeatureStore
+    from src.model_trainer import ModelTrainer
+    from src.stacking import OOFStore
+
+    df = FeatureSelector.load(FEATURE_SCHEMA_FILE).transform(pd.read_csv(ML_READY_FILE))
+    trainer = ModelTrainer(df, feature_store=FeatureStore(), oof_store=OOFStore())
+    if trainer.run_all_training() is None:
+        raise RuntimeError("Model training failed")
+
+    if trainer.title_canonicalizer is not None:
+        trainer.title_canonicalizer.save(TITLE_CANONICALIZER_FILE)
+    trainer.featurizer.save(PREPROCESSOR_FILE)
+    joblib.dump(trainer.results, MODEL_RESULTS_FILE)
+
+
+def stack():
+    """Meta-learner over the base models' stored out-of-fold predictions"""
+    from src.stacking import StackedEnsemble
+    StackedEnsemble().fit().save(STACKED_MODEL_FILE)
+
+
+def train_joint():
+    """Joint visa status + processing time model for serving"""
+    import pandas as pd
+    from src.joint_model import JointModel
+    model = JointModel.train_test(pd.read_csv(ML_READY_FILE))
+    model.save(JOINT_MODEL_FILE)
+    model.calibrator.export(INTERVALS_EXPORT_FILE)
+
+
+def evaluate():
+    """Milestone 3: evaluation report and figures for the baseline models"""
+    import joblib
+    from src.model_evaluator import ModelEvaluator
+    ModelEvaluator.from_feature_store(joblib.load(MODEL_RESULTS_FILE)).run_evaluation()
+
+
+def tune():
+    """Milestone 3 extended: hyperparameter search on the shared feature store"""
+    import joblib
+    from src.hyperparameter_tuning import HyperparameterTuning
+
+    tuner = HyperparameterTuning.from_feature_store()
+    _, best_model = tuner.run_all_tuning()
+    joblib.dump(best_model, BEST_MODEL_FILE)
+    joblib.dump(tuner.tuning_results, TUNING_RESULTS_FILE)
+
+
+def compress():
+    """Compact float32 form of a tuned random forest, with its size/latency/accuracy report"""
+    import joblib
+    from src.forest_compressor import ForestCompressor, is_forest
+
+    model = joblib.load(BEST_MODEL_FILE)
+    if not is_forest(model):
+        # Nothing to compress for a boosted model; the tuned model is served as is
+        joblib.dump(model, COMPRESSED_MODEL_FILE)
+        return
+    compressor = ForestCompressor.from_feature_store(model)
+    forest = compressor.compress()
+    compressor.report().to_csv(COMPRESSION_REPORT_FILE, index=False)
+    forest.save(COMPRESSED_MODEL_FILE)
+
+
+def distill():
+    """Fast student of the tuned model for interactive predictions"""
+    import joblib
+    from src.distiller import Distiller
+
+    distiller = Distiller.from_feature_store(joblib.load(BEST_MODEL_FILE))
+    _, student = distiller.distill()
+    distiller.report().to_csv(DISTILL_REPORT_FILE, index=False)
+    joblib.dump(student, STUDENT_MODEL_FILE)
+
+
+def tuning_report():
+    """Baseline vs tuned comparison figures"""
+    import joblib
+    from src.tuning_visualization import TuningVisualization
+    TuningVisualization(joblib.load(MODEL_RESULTS_FILE), joblib.load(TUNING_RESULTS_FILE)).generate_all_visualizations()
+
+
+def explain():
+    """Permutation importance of the tuned model, exported for the dashboard"""
+    import joblib
+    from src.importance import ImportanceEngine, model_name
+
+    model = joblib.load(BEST_MODEL_FILE)
+    engine = ImportanceEngine.from_feature_store(model)
+    features = engine.compute()
+    engine.report(features)
+    engine.export(features, IMPORTANCE_EXPORT_FILE, model_name(model))
+
+
+def build_stages():
+    """The milestone DAG; edges follow from matching outputs and inputs"""
+    return [
+        Stage('preprocess', preprocess,
+              inputs=[RAW_DATA_FILE],
+              outputs=[PROCESSED_DATA_FILE, REPORT_FILE],
+              params={'validation_rules': VALIDATION_RULES, 'missing_value_threshold': MISSING_VALUE_THRESHOLD,
+                      'outlier_method': OUTLIER_METHOD, 'state_columns': STATE_COLUMNS,
+                      'state_aliases': STATE_ALIASES, 'state_fuzzy_cutoff': STATE_FUZZY_CUTOFF},
+              code=['src.pipeline', 'src.data_loader', 'src.data_cleaner', 'src.feature_engineer',
+                    'src.data_validator', 'src.rule_engine', 'src.state_normalizer']),
+        Stage('leakage', remove_leakage,
+              inputs=[PROCESSED_DATA_FILE],
+              outputs=[ML_READY_FILE],
+              code=['src.remove_data_leakage']),
+        Stage('select', select_features,
+              inputs=[ML_READY_FILE],
+              outputs=[FEATURE_SCHEMA_FILE],
+              params={'leak_columns': SELECTION_LEAK_COLUMNS, 'correlation_threshold': SELECTION_CORRELATION_THRESHOLD,
+                      'min_importance': SELECTION_MIN_IMPORTANCE, 'sample_size': SELECTION_SAMPLE_SIZE,
+                      'rounds': [SELECTION_MAX_ROUNDS, SELECTION_REPEATS]},
+              code=['src.feature_selector', 'src.featurizer']),
+        Stage('analytics', export_analytics,
+              inputs=[PROCESSED_DATA_FILE],
+              outputs=[ANALYTICS_EXPORT_DIR / f'{name}.json' for name in
+                       ['nationality', 'centers', 'industries', 'monthly', 'summary']],
+              params={'dimensions': CUBE_DIMENSIONS, 'bin_days': CUBE_BIN_DAYS, 'max_days': CUBE_MAX_DAYS,
+                      'top_n': ANALYTICS_TOP_N, 'approved_statuses': APPROVED_STATUSES},
+              code=['src.analytics_export', 'src.aggregation_cube']),
+        Stage('train', train,
+              inputs=[ML_READY_FILE, FEATURE_SCHEMA_FILE],
+              outputs=[FEATURE_STORE_DIR, MODEL_RESULTS_FILE, TITLE_CANONICALIZER_FILE, PREPROCESSOR_FILE,
+                       STACKING_DIR],
+              params={'canonicalize_job_titles': CANONICALIZE_JOB_TITLES,
+                      'conformal': [CONFORMAL_LEVELS, CONFORMAL_BINS, CONFORMAL_MIN_BIN_SIZE],
+                      'categorical_encoding': [CATEGORICAL_ENCODING, CATEGORICAL_MIN_FREQUENCY,
+                                               CATEGORICAL_HASH_FEATURES, TARGET_ENCODING_FOLDS],
+                      'folds': STACKING_FOLDS},
+              code=['src.model_trainer', 'src.title_canonicalizer', 'src.feature_store', 'src.conformal',
+                    'src.featurizer', 'src.categorical_encoder', 'src.stacking']),
+        Stage('stack', stack,
+              inputs=[STACKING_DIR, FEATURE_STORE_DIR],
+              outputs=[STACKED_MODEL_FILE],
+              code=['src.stacking']),
+        Stage('joint', train_joint,
+              inputs=[ML_READY_FILE],
+              outputs=[JOINT_MODEL_FILE, INTERVALS_EXPORT_FILE],
+              params={'canonicalize_job_titles': CANONICALIZE_JOB_TITLES, 'exclude_columns': JOINT_EXCLUDE_COLUMNS,
+                      'conformal': [CONFORMAL_LEVELS, CONFORMAL_BINS, CONFORMAL_MIN_BIN_SIZE]},
+              code=['src.joint_model', 'src.featurizer', 'src.title_canonicalizer', 'src.conformal']),
+        Stage('evaluate', evaluate,
+              inputs=[FEATURE_STORE_DIR, MODEL_RESULTS_FILE],
+              outputs=[PROCESSED_DATA_DIR / name for name in
+                       ['model_predictions.png', 'model_residuals.png', 'model_errors.png', 'model_comparison.png']],
+              params={'dpi': EVALUATION_DPI, 'scatter_threshold': SCATTER_POINT_THRESHOLD},
+              code=['src.model_evaluator', 'src.chart_renderer']),
+        Stage('tune', tune,
+              inputs=[FEATURE_STORE_DIR],
+              outputs=[BEST_MODEL_FILE, TUNING_RESULTS_FILE],
+              code=['src.hyperparameter_tuning', 'src.search_coordinator', 'src.trial_store']),
+        Stage('importance', explain,
+              inputs=[BEST_MODEL_FILE, FEATURE_STORE_DIR],
+              outputs=[IMPORTANCE_EXPORT_FILE],
+              params={'sample_size': IMPORTANCE_SAMPLE_SIZE, 'repeats': IMPORTANCE_REPEATS, 'shap': IMPORTANCE_SHAP,
+                      'shap_rows': IMPORTANCE_SHAP_ROWS, 'categories': IMPORTANCE_CATEGORIES, 'top_n': ANALYTICS_TOP_N},
+              code=['src.importance']),
+        Stage('compress', compress,
+              inputs=[BEST_MODEL_FILE, FEATURE_STORE_DIR],
+              outputs=[COMPRESSED_MODEL_FILE],
+              params={'tolerance': COMPRESSION_TOLERANCE, 'depths': COMPRESSION_DEPTHS,
+                      'leaf_tolerance': COMPRESSION_LEAF_TOLERANCE, 'min_trees': COMPRESSION_MIN_TREES},
+              code=['src.forest_compressor']),
+        Stage('distill', distill,
+              inputs=[BEST_MODEL_FILE, FEATURE_STORE_DIR],
+              outputs=[STUDENT_MODEL_FILE, DISTILL_REPORT_FILE],
+              params={'students': DISTILL_STUDENTS, 'synthetic_rows': DISTILL_SYNTHETIC_ROWS,
+                      'swap_probability': DISTILL_SWAP_PROBABILITY, 'tree_depth': DISTILL_TREE_DEPTH,
+                      'latency_target_ms': DISTILL_LATENCY_TARGET_MS},
+              code=['src.distiller']),
+        Stage('tuning_report', tuning_report,
+              inputs=[MODEL_RESULTS_FILE, TUNING_RESULTS_FILE],
+              outputs=[PROCESSED_DATA_DIR / 'tuning_comparison.png', PROCESSED_DATA_DIR / 'parameter_sensitivity.png'],
+              params={'dpi': RENDER_DPI},
+              code=['src.tuning_visualization', 'src.chart_renderer'])
+    ]
\ No newline at end of file
@@ -0,0 +1,204 @@
+import time
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from src.logger import logger
+from src.config import (
+    PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL, PREDICTION_CACHE_SALARY_BUCKET,
+    PREDICTION_CACHE_DATE_BUCKET
+)
+
+
+class PredictionCache:
+    """Bounded LRU map with per-entry expiry; safe to share between request threads"""
+
+    def __init__(self, maxsize=PREDICTION_CACHE_SIZE, ttl=PREDICTION_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Cached value or None; a hit moves the entry to the most-recently-used end"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires = entry
+            if expires is not None and now >= expires:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _parse_date(value):
+    """The raw files' dd-mm-YYYY dates, or ISO dates, as the featurizer reads them"""
+    text = str(value).strip()[:10]
+    try:
+        return datetime.strptime(text, '%d-%m-%Y').date()
+    except ValueError:
+        return datetime.fromisoformat(text).date()
+
+
+def _parse_income(value):
+    """Salary as DataCleaner reads it ("1,09,600.00" -> 109600.0); None when it is not a number"""
+    try:
+        return float(str(value).replace(',', ''))
+    except ValueError:
+        return None
+
+
+def _bucket_date(value, period):
+    """Snap a date to the Monday of its week or the first of its month"""
+    if isinstance(value, datetime):
+        value = value.date()
+    elif not isinstance(value, date):
+        value = _parse_date(value)
+    if period == 'week':
+        value = value - timedelta(days=value.weekday())
+    elif period == 'month':
+        value = value.replace(day=1)
+    else:
+        raise ValueError(f"Unknown date bucket: {period}")
+    return value.isoformat()
+
+
+class CachedPredictor:
+    """Memoizes single-application predictions, keyed on the application as the model sees it"""
+
+    def __init__(self, predictor=None, cache=None, salary_bucket=PREDICTION_CACHE_SALARY_BUCKET,
+                 date_bucket=PREDICTION_CACHE_DATE_BUCKET):
+        if predictor is None:
+            from src.predictor import JointPredictor
+            predictor = JointPredictor()
+        self.predictor = predictor
+        self.cache = cache if cache is not None else PredictionCache()
+        self.salary_bucket = salary_bucket
+        self.date_bucket = date_bucket
+        self._model_columns = None
+        self._version = None
+        self._hit_seconds = 0.0
+        self._miss_seconds = 0.0
+        self.invalidations = 0
+
+    @property
+    def model_columns(self):
+        """Raw fields the predictor's featurizer reads: its features and the columns they are derived from"""
+        if self._model_columns is None:
+            self._model_columns = list(self.predictor.featurizer.feature_names)
+        return self._model_columns
+
+    def _reads(self, column):
+        return any(name == column or name.startswith(f'{column}_') for name in self.model_columns)
+
+    def canonicalize(self, application):
+        """(cache key, model input): fields the model reads, trimmed, optional salary/date buckets, canonical job title"""
+        canonical = {}
+        for column, value in application.items():
+            if not self._reads(column):
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+            canonical[column] = value
+
+        # Bucketing changes the model input too, so every key maps to exactly one prediction
+        if self.salary_bucket and canonical.get('annual_income_usd') is not None:
+            # An unparseable salary is left as sent; the featurizer reports it
+            income = _parse_income(canonical['annual_income_usd'])
+            if income is not None:
+                canonical['annual_income_usd'] = round(income / self.salary_bucket) * self.salary_bucket
+        if self.date_bucket and canonical.get('application_date') is not None:
+            canonical['application_date'] = _bucket_date(canonical['application_date'], self.date_bucket)
+
+        key = dict(canonical)
+        title_canonicalizer = getattr(self.predictor.featurizer, 'title_canonicalizer', None)
+        if title_canonicalizer is not None and isinstance(key.get('job_title'), str):
+            # Spelling variants of one title reach the model as the same canonical title
+            key['job_title'] = title_canonicalizer.canonicalize(key['job_title'])
+        return tuple(sorted(key.items())), canonical
+
+    def _check_version(self):
+        """A retrained or redeployed model invalidates every cached prediction"""
+        version = self.predictor.version()
+        if version != self._version:
+            if self._version is not None:
+                self.cache.clear()
+                self.predictor.reload()
+                self._model_columns = None
+                self.invalidations += 1
+                logger.info("✓ Model artifacts changed: prediction cache cleared")
+            self._version = version
+
+    def predict(self, application):
+        """Prediction for one application (a dict of raw fields) as a dict of outputs"""
+        start = time.perf_counter()
+        self._check_version()
+        key, canonical = self.canonicalize(application)
+
+        result = self.cache.get(key)
+        if result is not None:
+            self._hit_seconds += time.perf_counter() - start
+            return dict(result)
+
+        result = self.predictor.predict(canonical).iloc[0].to_dict()
+        self.cache.put(key, result)
+        self._miss_seconds += time.perf_counter() - start
+        return dict(result)
+
+    def stats(self):
+        hits, misses = self.cache.hits, self.cache.misses
+        requests = hits + misses
+        hit_ms = 1000 * self._hit_seconds / hits if hits else 0.0
+        miss_ms = 1000 * self._miss_seconds / misses if misses else 0.0
+        return {
+            'requests': requests,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / requests if requests else 0.0,
+            'size': len(self.cache),
+            'evictions': self.cache.evictions,
+            'expirations': self.cache.expirations,
+            'invalidations': self.invalidations,
+            'avg_hit_ms': hit_ms,
+            'avg_miss_ms': miss_ms,
+            'saved_seconds': hits * max(miss_ms - hit_ms, 0.0) / 1000
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info("\n" + "="*70)
+        logger.info("PREDICTION CACHE")
+        logger.info("="*70)
+        logger.info(f"  Requests: {stats['requests']:,} | hit rate: {stats['hit_rate']:.1%} "
+                    f"| size: {stats['size']:,}/{self.cache.maxsize:,}")
+        logger.info(f"  Evictions: {stats['evictions']:,} | expirations: {stats['expirations']:,} "
+                    f"| invalidations: {stats['invalidations']}")
+        logger.info(f"  Latency: {stats['avg_hit_ms']:.3f} ms per hit vs {stats['avg_miss_ms']:.1f} ms per miss "
+                    f"(~{stats['saved_seconds']:.1f}s saved)")
+        return stats
\ No newline at end of file
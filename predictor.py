@@ -0,0 +1,147 @@
+import os
+from src.logger import logger
+from src.config import (
+    BEST_MODEL_FILE, JOINT_MODEL_FILE, PREPROCESSOR_FILE, STUDENT_MODEL_FILE, DISTILL_BATCH_ROWS,
+    STACKED_MODEL_FILE
+)
+
+
+def _as_frame(applications):
+    """Accept a DataFrame, a dict, or a list of dicts"""
+    import pandas as pd
+    if isinstance(applications, dict):
+        applications = [applications]
+    if not isinstance(applications, pd.DataFrame):
+        applications = pd.DataFrame(applications)
+    return applications
+
+
+class Predictor:
+    """Serving entry point: loads the persisted model on first use and nothing else"""
+
+    def __init__(self, model_path=BEST_MODEL_FILE):
+        self.model_path = model_path
+        self._model = None
+
+    @property
+    def model(self):
+        """Unpickling imports only the estimator classes the model actually uses"""
+        if self._model is None:
+            import joblib
+            self._model = joblib.load(self.model_path)
+            logger.info(f"✓ Loaded model: {self.model_path}")
+        return self._model
+
+    def artifacts(self):
+        return [self.model_path]
+
+    def version(self):
+        """Cheap model version: (mtime, size) of every artifact, so a redeploy is noticed without hashing"""
+        signature = []
+        for path in self.artifacts():
+            stat = os.stat(path)
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def reload(self):
+        """Drop loaded artifacts; the next prediction loads the current files"""
+        self._model = None
+
+    def predict(self, X):
+        """Predict processing time (days) for prepared, scaled feature rows"""
+        return self.model.predict(X)
+
+
+class TunedPredictor(Predictor):
+    """Serves best_model_tuned.pkl from raw application fields through its saved preprocessing"""
+
+    def __init__(self, model_path=BEST_MODEL_FILE, preprocessor_path=PREPROCESSOR_FILE):
+        super().__init__(model_path)
+        self.preprocessor_path = preprocessor_path
+        self._featurizer = None
+
+    @property
+    def featurizer(self):
+        if self._featurizer is None:
+            from src.featurizer import Featurizer
+            self._featurizer = Featurizer.load(self.preprocessor_path)
+        return self._featurizer
+
+    def artifacts(self):
+        return [self.model_path, self.preprocessor_path]
+
+    def reload(self):
+        super().reload()
+        self._featurizer = None
+
+    def predict(self, applications):
+        """Predict processing time (days) from raw application fields"""
+        import pandas as pd
+        frame = _as_frame(applications)
+        X = self.featurizer.transform(frame)
+        return pd.DataFrame({'processing_time_days': self.model.predict(X)}, index=frame.index)
+
+
+class DistilledPredictor(TunedPredictor):
+    """Distilled student for interactive requests; the teacher is loaded only when a batch arrives"""
+
+    def __init__(self, student_path=STUDENT_MODEL_FILE, teacher_path=BEST_MODEL_FILE,
+                 preprocessor_path=PREPROCESSOR_FILE, batch_rows=DISTILL_BATCH_ROWS):
+        super().__init__(student_path, preprocessor_path)
+        self.teacher_path = teacher_path
+        self.batch_rows = batch_rows
+        self._teacher = None
+
+    @property
+    def teacher(self):
+        if self._teacher is None:
+            import joblib
+            self._teacher = joblib.load(self.teacher_path)
+            logger.info(f"✓ Loaded teacher: {self.teacher_path}")
+        return self._teacher
+
+    def artifacts(self):
+        return [self.model_path, self.teacher_path, self.preprocessor_path]
+
+    def reload(self):
+        super().reload()
+        self._teacher = None
+
+    def predict(self, applications):
+        """Student below batch_rows rows, teacher at or above it; both read the same features"""
+        import pandas as pd
+        frame = _as_frame(applications)
+        X = self.featurizer.transform(frame)
+        model = self.model if len(frame) < self.batch_rows else self.teacher
+        return pd.DataFrame({'processing_time_days': model.predict(X)}, index=frame.index)
+
+
+class StackedPredictor(TunedPredictor):
+    """Serves the stacked ensemble: each base model reads its own view of the same raw fields"""
+
+    def __init__(self, model_path=STACKED_MODEL_FILE, preprocessor_path=PREPROCESSOR_FILE):
+        super().__init__(model_path, preprocessor_path)
+
+    def predict(self, applications):
+        import pandas as pd
+        frame = _as_frame(applications)
+        X = self.featurizer.transform(frame)
+        X_linear = None
+        if self.model.encoder is not None:
+            X_linear = self.model.encoder.transform(self.featurizer.prepare(frame))
+        return pd.DataFrame({'processing_time_days': self.model.predict(X, X_linear)}, index=frame.index)
+
+
+class JointPredictor(Predictor):
+    """Serves the joint model: status probabilities and processing time from one call"""
+
+    def __init__(self, model_path=JOINT_MODEL_FILE):
+        super().__init__(model_path)
+
+    @property
+    def featurizer(self):
+        return self.model.featurizer
+
+    def predict(self, applications):
+        """Predict from raw application fields (a DataFrame, a dict, or a list of dicts)"""
+        return self.model.predict(_as_frame(applications))
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Analytics export: precompute dashboard aggregates
+Refresh the nationality x center x month x industry cube and write static JSON for the web app
+"""
+
+import sys
+import pandas as pd
+from src.logger import logger
+from src.config import PROCESSED_DATA_FILE, ensure_directories
+from src.analytics_export import AnalyticsExporter
+
+def main():
+    ensure_directories()
+    data_file = sys.argv[1] if len(sys.argv) > 1 else PROCESSED_DATA_FILE
+    
+    logger.info(f"\nLoading dataset: {data_file}")
+    df = pd.read_csv(data_file)
+    logger.info(f"✓ Loaded {len(df)} rows × {len(df.columns)} columns")
+    
+    exporter = AnalyticsExporter()
+    summary = exporter.run(df)
+    
+    logger.info(f"\n✓ {summary['applications']} applications, "
+                f"{summary['approvalRate']}% approved, {summary['avgTime']} days average")
+    logger.info(f"  Output: {exporter.export_dir}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Rolling-origin backtest: train on the past, predict the future
+Scores each retraining origin on the months after it to size retraining frequency against accuracy decay
+
+Usage:
+    python run_backtest.py                                  # expanding window, config defaults
+    python run_backtest.py --window rolling --train-months 6
+    python run_backtest.py --step 1 --horizon 12 --models "Random Forest"
+"""
+
+import argparse
+import pandas as pd
+from src.logger import logger
+from src.config import (
+    ML_READY_FILE, BACKTEST_RESULTS_FILE, BACKTEST_MODELS, BACKTEST_WINDOW, BACKTEST_INITIAL_MONTHS,
+    BACKTEST_STEP_MONTHS, BACKTEST_HORIZON_MONTHS, BACKTEST_TRAIN_MONTHS, BACKTEST_WORKERS, FEATURE_SCHEMA_FILE,
+    ensure_directories
+)
+from src.feature_selector import FeatureSelector
+from src.backtester import Backtester
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest the model roster with rolling-origin splits")
+    parser.add_argument('--window', choices=['expanding', 'rolling'], default=BACKTEST_WINDOW)
+    parser.add_argument('--initial-months', type=int, default=BACKTEST_INITIAL_MONTHS)
+    parser.add_argument('--step', type=int, default=BACKTEST_STEP_MONTHS, help="Months between origins")
+    parser.add_argument('--horizon', type=int, default=BACKTEST_HORIZON_MONTHS, help="Months scored per origin")
+    parser.add_argument('--train-months', type=int, default=BACKTEST_TRAIN_MONTHS, help="Rolling window length")
+    parser.add_argument('--models', nargs='+', default=BACKTEST_MODELS)
+    parser.add_argument('--workers', type=int, default=BACKTEST_WORKERS)
+    args = parser.parse_args()
+
+    ensure_directories()
+    logger.info(f"\nLoading dataset: {ML_READY_FILE}")
+    df = pd.read_csv(ML_READY_FILE)
+    logger.info(f"✓ Loaded {len(df)} rows × {len(df.columns)} columns")
+
+    # Backtest the features the deployed model reads; without a schema, the columns known at filing time
+    features = None
+    if FEATURE_SCHEMA_FILE.exists():
+        features = FeatureSelector.load(FEATURE_SCHEMA_FILE).selected
+        logger.info(f"✓ Applied feature schema: {len(features)} features ({FEATURE_SCHEMA_FILE.name})")
+
+    backtester = Backtester(
+        df, models=args.models, window=args.window, initial_months=args.initial_months,
+        step_months=args.step, horizon_months=args.horizon, train_months=args.train_months,
+        workers=args.workers, features=features
+    )
+    predictions = backtester.run()
+    by_month, _, _ = backtester.report(predictions)
+
+    by_month.to_csv(BACKTEST_RESULTS_FILE, index=False)
+    logger.info(f"\n✓ Per-window metrics saved: {BACKTEST_RESULTS_FILE}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Batch scoring: predict a file of pending applications
+Streams a CSV/Parquet file in chunks through the saved preprocessing and model on a worker pool
+
+Usage:
+    python run_batch_scoring.py pending.csv                      # -> pending_scored.csv
+    python run_batch_scoring.py pending.parquet scored.parquet --workers 8
+    python run_batch_scoring.py backlog.csv --model tuned        # best_model_tuned.pkl
+    python run_batch_scoring.py backlog.csv --model compressed   # run_model_compression.py output
+    python run_batch_scoring.py backlog.csv --model stacked      # stacked_model.pkl
+"""
+
+import argparse
+from pathlib import Path
+from src.config import BATCH_CHUNK_SIZE, BATCH_WORKERS, ensure_directories
+from src.batch_scorer import BatchScorer
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a file of visa applications")
+    parser.add_argument('input', help="CSV or Parquet file of applications")
+    parser.add_argument('output', nargs='?', help="Output CSV/Parquet (default: <input>_scored.<ext>)")
+    parser.add_argument('--model', choices=['joint', 'tuned', 'compressed', 'stacked'], default='joint',
+                        help="joint: status + days from application-time fields; tuned: best_model_tuned.pkl; "
+                             "compressed: best_model_compressed.pkl; stacked: stacked_model.pkl")
+    parser.add_argument('--chunk-size', type=int, default=BATCH_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=BATCH_WORKERS)
+    args = parser.parse_args()
+
+    ensure_directories()
+    input_path = Path(args.input)
+    output_path = Path(args.output) if args.output else input_path.with_name(
+        f"{input_path.stem}_scored{input_path.suffix}"
+    )
+
+    scorer = BatchScorer(model=args.model, chunk_size=args.chunk_size, workers=args.workers)
+    scorer.score(input_path, output_path)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""
+Knowledge distillation: a fast student of the tuned model for interactive predictions
+Fits small students to the teacher's predictions on real and synthetic rows, reports the fidelity gap
+and latency, and saves the most accurate student within the single-row latency target
+
+Usage:
+    python run_distillation.py
+    python run_distillation.py --students tree gbm --synthetic-rows 200000
+"""
+
+import argparse
+import joblib
+from src.logger import logger
+from src.config import (
+    BEST_MODEL_FILE, STUDENT_MODEL_FILE, DISTILL_REPORT_FILE, DISTILL_STUDENTS, DISTILL_SYNTHETIC_ROWS,
+    ensure_directories
+)
+from src.distiller import Distiller
+
+def main():
+    parser = argparse.ArgumentParser(description="Distill the tuned model into a fast student")
+    parser.add_argument('--students', nargs='+', default=DISTILL_STUDENTS, choices=['tree', 'gbm', 'linear'])
+    parser.add_argument('--synthetic-rows', type=int, default=DISTILL_SYNTHETIC_ROWS)
+    args = parser.parse_args()
+
+    ensure_directories()
+    teacher = joblib.load(BEST_MODEL_FILE)
+    distiller = Distiller.from_feature_store(teacher, students=args.students, synthetic_rows=args.synthetic_rows)
+    name, student = distiller.distill()
+    distiller.report().to_csv(DISTILL_REPORT_FILE, index=False)
+    logger.info(f"✓ Distillation report saved: {DISTILL_REPORT_FILE}")
+
+    joblib.dump(student, STUDENT_MODEL_FILE)
+    logger.info(f"✓ Student ({name}) saved: {STUDENT_MODEL_FILE}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
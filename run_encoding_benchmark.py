@@ -0,0 +1,109 @@
+"""
+Categorical encoding benchmark
+Compare matrix memory, peak memory and fit time of each encoding against the dense label-encoded path
+
+Usage:
+    python run_encoding_benchmark.py                     # raw job titles (high cardinality)
+    python run_encoding_benchmark.py --canonical-titles  # titles collapsed as in training
+    python run_encoding_benchmark.py --rows 100000 --input large_applications.csv
+"""
+
+import argparse
+import time
+import tracemalloc
+import pandas as pd
+from src.logger import logger
+from src.config import ML_READY_FILE, FEATURE_SCHEMA_FILE
+from src.feature_selector import FeatureSelector
+from src.title_canonicalizer import TitleCanonicalizer
+from src.categorical_encoder import CategoricalEncoder, matrix_nbytes
+
+DENSE_LIMIT_MB = 2000  # dense one-hot is only materialized below this size
+
+def run(name, X_train, X_test, y_train, y_test, method, densify=False):
+    """Encode and fit LinearRegression; return memory and timings"""
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import r2_score
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    encoder = CategoricalEncoder(method)
+    train = encoder.fit_transform(X_train, y_train)
+    test = encoder.transform(X_test)
+    if densify:
+        train, test = train.toarray(), test.toarray()
+    encode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model = LinearRegression().fit(train, y_train)
+    fit_seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'name': name,
+        'columns': train.shape[1],
+        'matrix_mb': (matrix_nbytes(train) + matrix_nbytes(test)) / 1e6,
+        'peak_mb': peak / 1e6,
+        'encode_s': encode_seconds,
+        'fit_s': fit_seconds,
+        'r2': r2_score(y_test, model.predict(test))
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark categorical encodings for the linear models")
+    parser.add_argument('--input', default=ML_READY_FILE, help="ML-ready CSV (default: the leakage-free dataset)")
+    parser.add_argument('--rows', type=int, default=None, help="Sample this many rows (default: all)")
+    parser.add_argument('--canonical-titles', action='store_true', help="Canonicalize job titles first")
+    args = parser.parse_args()
+
+    from sklearn.model_selection import train_test_split
+
+    logger.info("\n" + "="*70)
+    logger.info("CATEGORICAL ENCODING BENCHMARK")
+    logger.info("="*70)
+
+    df = pd.read_csv(args.input)
+    # Train on the columns Milestone 3 selected, so the baseline is the matrix ModelTrainer fits
+    if FEATURE_SCHEMA_FILE.exists():
+        df = FeatureSelector.load(FEATURE_SCHEMA_FILE).transform(df)
+        logger.info(f"✓ Applied feature schema: {len(df.columns) - 1} features ({FEATURE_SCHEMA_FILE.name})")
+    if args.rows and args.rows < len(df):
+        df = df.sample(args.rows, random_state=42)
+    X = df.drop(columns=['processing_time_days'])
+    y = df['processing_time_days']
+    if args.canonical_titles and 'job_title' in X.columns:
+        X = TitleCanonicalizer().transform_frame(X)
+
+    cardinality = {col: X[col].nunique() for col in X.select_dtypes(include=['object']).columns}
+    logger.info(f"  Rows: {len(X):,} | categorical cardinality: "
+                + ", ".join(f"{col}={n:,}" for col, n in cardinality.items()))
+
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    runs = [
+        ('label (current dense)', 'label', False),
+        ('onehot (sparse CSR)', 'onehot', False),
+        ('hashing (sparse CSR)', 'hashing', False),
+        ('target (out-of-fold)', 'target', False)
+    ]
+    onehot_columns = CategoricalEncoder('onehot').fit(X_train).feature_names_out()
+    dense_onehot_mb = len(X) * len(onehot_columns) * 4 / 1e6
+    if dense_onehot_mb <= DENSE_LIMIT_MB:
+        runs.insert(2, ('onehot (dense)', 'onehot', True))
+
+    results = [run(name, X_train, X_test, y_train, y_test, method, densify) for name, method, densify in runs]
+
+    logger.info("\n" + "-"*70)
+    logger.info(f"{'Encoding':<24} {'Columns':>8} {'Matrix MB':>10} {'Peak MB':>9} {'Encode s':>9} {'Fit s':>7} {'R2':>7}")
+    logger.info("-"*70)
+    for r in results:
+        logger.info(f"{r['name']:<24} {r['columns']:>8,} {r['matrix_mb']:>10.1f} {r['peak_mb']:>9.1f} "
+                    f"{r['encode_s']:>9.2f} {r['fit_s']:>7.2f} {r['r2']:>7.4f}")
+    if dense_onehot_mb > DENSE_LIMIT_MB:
+        logger.info(f"{'onehot (dense)':<24} {len(onehot_columns):>8,} {dense_onehot_mb:>10.1f}   "
+                    f"(not materialized: over {DENSE_LIMIT_MB} MB)")
+    logger.info("-"*70)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Feature importance: permutation importance of the tuned model on the test split
+Scores a row subsample in parallel across features and exports the top features for the dashboard
+
+Usage:
+    python run_feature_importance.py
+    python run_feature_importance.py --sample-size 0 --repeats 10   # every test row
+    python run_feature_importance.py --shap                         # TreeSHAP too (pip install shap)
+"""
+
+import argparse
+import joblib
+from src.logger import logger
+from src.config import (
+    BEST_MODEL_FILE, IMPORTANCE_EXPORT_FILE, IMPORTANCE_SAMPLE_SIZE, IMPORTANCE_REPEATS, IMPORTANCE_WORKERS,
+    IMPORTANCE_SHAP, ensure_directories
+)
+from src.importance import ImportanceEngine, model_name
+
+def main():
+    parser = argparse.ArgumentParser(description="Permutation importance of the tuned model")
+    parser.add_argument('--sample-size', type=int, default=IMPORTANCE_SAMPLE_SIZE, help="Test rows (0: all)")
+    parser.add_argument('--repeats', type=int, default=IMPORTANCE_REPEATS)
+    parser.add_argument('--workers', type=int, default=IMPORTANCE_WORKERS)
+    parser.add_argument('--shap', action='store_true', default=IMPORTANCE_SHAP, help="Add TreeSHAP contributions")
+    args = parser.parse_args()
+
+    logger.info("\n" + "="*70)
+    logger.info("FEATURE IMPORTANCE")
+    logger.info("="*70)
+    ensure_directories()
+
+    model = joblib.load(BEST_MODEL_FILE)
+    logger.info(f"  Model: {model_name(model)} ({BEST_MODEL_FILE})")
+
+    engine = ImportanceEngine.from_feature_store(
+        model, sample_size=args.sample_size, n_repeats=args.repeats, workers=args.workers, shap=args.shap
+    )
+    features = engine.compute()
+    engine.report(features)
+    engine.export(features, IMPORTANCE_EXPORT_FILE, model_name(model))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Import-time benchmark
+Measure cumulative import time of each entry module with -X importtime and check it against the budget
+"""
+
+import subprocess
+import sys
+from src.logger import logger
+from src.config import IMPORT_TIME_BUDGET_MS
+
+RUNS = 3
+
+def import_time_ms(module):
+    """Best-of-N cumulative import time for one module in a fresh interpreter"""
+    best = None
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise ImportError(result.stderr.strip().splitlines()[-1])
+        
+        timings = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:') or '|' not in line:
+                continue
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                timings[name.strip()] = int(cumulative) / 1000
+        
+        elapsed = timings[module]
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    logger.info("\n" + "="*70)
+    logger.info("IMPORT-TIME BENCHMARK")
+    logger.info("="*70)
+    
+    failures = 0
+    for module, budget in IMPORT_TIME_BUDGET_MS.items():
+        elapsed = import_time_ms(module)
+        if elapsed <= budget:
+            logger.info(f"  ✓ {module:<28} {elapsed:8.1f} ms (budget {budget} ms)")
+        else:
+            failures += 1
+            logger.info(f"  ✗ {module:<28} {elapsed:8.1f} ms (budget {budget} ms)")
+    
+    if failures:
+        logger.error(f"\n{failures} module(s) over the import-time budget")
+        sys.exit(1)
+    logger.info("\n✓ All modules within the import-time budget")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""
+Joint model: visa status and processing time from one featurization
+Trains the status classifier and processing-time regressor together and saves them as one artifact
+"""
+
+import pandas as pd
+from src.logger import logger
+from src.config import ML_READY_FILE, JOINT_MODEL_FILE, INTERVALS_EXPORT_FILE, ensure_directories
+from src.joint_model import JointModel
+
+def main():
+    logger.info("\n" + "="*70)
+    logger.info("JOINT MODEL: VISA STATUS + PROCESSING TIME")
+    logger.info("="*70)
+    ensure_directories()
+
+    logger.info(f"\nLoading dataset: {ML_READY_FILE}")
+    df = pd.read_csv(ML_READY_FILE)
+    logger.info(f"✓ Loaded {len(df)} rows × {len(df.columns)} columns")
+
+    model = JointModel.train_test(df)
+    model.save(JOINT_MODEL_FILE)
+    model.calibrator.export(INTERVALS_EXPORT_FILE)
+
+    # One call answers both questions
+    sample = model.predict(df.head(1)).iloc[0]
+    logger.info("\nSample prediction:")
+    logger.info(f"  Status: {sample['visa_status']} (approval probability {sample['approval_probability']:.1%})")
+    logger.info(f"  Processing time: {sample['processing_time_days']:.0f} days "
+                f"({sample['days_lower']:.0f}-{sample['days_upper']:.0f} days)")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
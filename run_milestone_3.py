@@ -5,31 +5,45 @@ Train and evaluate regression models for processing time prediction
 
 import pandas as pd
 from src.logger import logger
-from src.config import PROCESSED_DATA_DIR
+from src.config import ML_READY_FILE, TITLE_CANONICALIZER_FILE, PREPROCESSOR_FILE, FEATURE_SCHEMA_FILE, ensure_directories
+from src.feature_selector import FeatureSelector
 from src.model_trainer import ModelTrainer
 from src.model_evaluator import ModelEvaluator
+from src.feature_store import FeatureStore
+from src.stacking import OOFStore
 
 def main():
     logger.info("\n" + "="*70)
     logger.info("MILESTONE 3: PREDICTIVE MODELING")
     logger.info("="*70)
+    ensure_directories()
     
     # Load engineered dataset
-    ml_file = PROCESSED_DATA_DIR / 'visa_applications_no_leakage.csv'
+    ml_file = ML_READY_FILE
     
     logger.info(f"\nLoading dataset: {ml_file}")
     df = pd.read_csv(ml_file)
     logger.info(f"✓ Loaded {len(df)} rows × {len(df.columns)} columns")
     
+    # Prune leaked and redundant columns; the schema is saved for tuning and serving
+    selector = FeatureSelector()
+    df = selector.fit_transform(df)
+    selector.save(FEATURE_SCHEMA_FILE)
+    
     # Train models
     logger.info("\n" + "-"*70)
-    trainer = ModelTrainer(df)
+    trainer = ModelTrainer(df, feature_store=FeatureStore(), oof_store=OOFStore())
     best_model_name, best_model = trainer.run_all_training()
     
     if best_model is None:
         logger.error("Model training failed!")
         return
     
+    # Persist title canonicalization and preprocessing for serving
+    if trainer.title_canonicalizer is not None:
+        trainer.title_canonicalizer.save(TITLE_CANONICALIZER_FILE)
+    trainer.featurizer.save(PREPROCESSOR_FILE)
+    
     # Evaluate models
     logger.info("\n" + "-"*70)
     evaluator = ModelEvaluator(trainer.y_test, trainer.results)
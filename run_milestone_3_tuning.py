@@ -4,10 +4,11 @@ Optimize Gradient Boosting and Random Forest models
 """
 
 import pandas as pd
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from sklearn.model_selection import train_test_split
 from src.logger import logger
-from src.config import PROCESSED_DATA_DIR
+from src.config import ML_READY_FILE, BEST_MODEL_FILE, PREPROCESSOR_FILE, FEATURE_SCHEMA_FILE, ensure_directories
+from src.feature_selector import FeatureSelector
+from src.feature_store import FeatureStore
+from src.model_trainer import ModelTrainer
 from src.hyperparameter_tuning import HyperparameterTuning
 #from src.tuning_visualization import TuningVisualization
 import joblib
@@ -16,47 +17,41 @@ def main():
     logger.info("\n" + "="*70)
     logger.info("MILESTONE 3 EXTENDED: HYPERPARAMETER TUNING")
     logger.info("="*70)
+    ensure_directories()
     
     # Load data
-    ml_file = PROCESSED_DATA_DIR / 'visa_applications_no_leakage.csv'
+    ml_file = ML_READY_FILE
     logger.info(f"\nLoading dataset: {ml_file}")
     df = pd.read_csv(ml_file)
     logger.info(f"✓ Loaded {len(df)} rows × {len(df.columns)} columns")
     
-    # Prepare data
-    logger.info("\n[DATA PREPARATION]")
-    target_col = 'processing_time_days'
-    X = df.drop(columns=[target_col])
-    y = df[target_col]
-    
-    # Encode categorical variables
-    label_encoders = {}
-    for col in X.select_dtypes(include=['object']).columns:
-        le = LabelEncoder()
-        X[col] = le.fit_transform(X[col].astype(str))
-        label_encoders[col] = le
+    # Train on the columns Milestone 3 selected
+    if FEATURE_SCHEMA_FILE.exists():
+        df = FeatureSelector.load(FEATURE_SCHEMA_FILE).transform(df)
+        logger.info(f"✓ Applied feature schema: {len(df.columns) - 1} features ({FEATURE_SCHEMA_FILE.name})")
     
-    # Split data
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
-    
-    # Scale features
-    scaler = StandardScaler()
-    X_train = scaler.fit_transform(X_train)
-    X_test = scaler.transform(X_test)
+    # Prepare data once and share it through the memory-mapped feature store
+    logger.info("\n[DATA PREPARATION]")
+    store = FeatureStore()
+    if store.is_current(FeatureStore.fingerprint(df)):
+        logger.info(f"  ✓ Reusing feature store: {store.path}")
+    else:
+        trainer = ModelTrainer(df, feature_store=store)
+        trainer.prepare_data()
+        trainer.featurizer.save(PREPROCESSOR_FILE)
     
+    X_train, X_test, y_train, y_test = store.open()
     logger.info(f"  Training samples: {X_train.shape[0]}")
     logger.info(f"  Testing samples: {X_test.shape[0]}")
     
     # Run hyperparameter tuning
     logger.info("\n" + "-"*70)
-    tuner = HyperparameterTuning(X_train, X_test, y_train, y_test)
+    tuner = HyperparameterTuning.from_feature_store(store)
     best_model_name, best_model = tuner.run_all_tuning()
     
     # Save best model
     logger.info(f"\n[SAVING BEST MODEL]")
-    model_path = PROCESSED_DATA_DIR / 'best_model_tuned.pkl'
+    model_path = BEST_MODEL_FILE
     joblib.dump(best_model, model_path)
     logger.info(f"✓ Saved best model: {model_path}")
     
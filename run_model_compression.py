@@ -0,0 +1,44 @@
+"""
+Forest compression: shrink the tuned Random Forest for serving
+Selects a subset of trees, caps depth and merges near-identical leaves while validation error stays
+within tolerance, then stores the trees as flat float32 arrays
+
+Usage:
+    python run_model_compression.py
+    python run_model_compression.py --tolerance 0.02 --leaf-tolerance 1.0
+    python run_model_compression.py --model best_model_tuned.pkl --output compact.pkl
+"""
+
+import argparse
+from pathlib import Path
+import joblib
+from src.logger import logger
+from src.config import (
+    BEST_MODEL_FILE, COMPRESSED_MODEL_FILE, COMPRESSION_REPORT_FILE, COMPRESSION_TOLERANCE,
+    COMPRESSION_LEAF_TOLERANCE, ensure_directories
+)
+from src.forest_compressor import ForestCompressor
+
+def main():
+    parser = argparse.ArgumentParser(description="Compress the tuned Random Forest")
+    parser.add_argument('--model', type=Path, default=BEST_MODEL_FILE)
+    parser.add_argument('--output', type=Path, default=COMPRESSED_MODEL_FILE)
+    parser.add_argument('--tolerance', type=float, default=COMPRESSION_TOLERANCE,
+                        help="Validation RMSE growth allowed over the full forest")
+    parser.add_argument('--leaf-tolerance', type=float, default=COMPRESSION_LEAF_TOLERANCE,
+                        help="Days within which sibling leaves merge")
+    args = parser.parse_args()
+
+    ensure_directories()
+    model = joblib.load(args.model)
+    logger.info(f"  Model: {type(model).__name__} ({args.model})")
+
+    compressor = ForestCompressor.from_feature_store(model, tolerance=args.tolerance,
+                                                     leaf_tolerance=args.leaf_tolerance)
+    forest = compressor.compress()
+    compressor.report().to_csv(COMPRESSION_REPORT_FILE, index=False)
+    logger.info(f"✓ Compression report saved: {COMPRESSION_REPORT_FILE}")
+    forest.save(args.output)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Prediction cache check
+Serve processed applications through CachedPredictor for each persisted model and compare with uncached predictions
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import PROCESSED_DATA_FILE, BEST_MODEL_FILE, PREPROCESSOR_FILE, JOINT_MODEL_FILE
+from src.predictor import TunedPredictor, JointPredictor
+from src.prediction_cache import CachedPredictor
+
+SAMPLE_ROWS = 50
+
+def check(name, predictor, applications):
+    """Two passes over the sample: the first must match the uncached model, the second must be all hits"""
+    cached = CachedPredictor(predictor)
+    try:
+        first = [cached.predict(application) for application in applications]
+        second = [cached.predict(application) for application in applications]
+    except ValueError as e:
+        logger.info(f"  ✗ {name}: {e}")
+        return False
+
+    expected = predictor.predict(pd.DataFrame(applications))
+    served = pd.DataFrame(first, index=expected.index)[expected.columns]
+    numeric = expected.select_dtypes('number').columns
+    matches = np.allclose(served[numeric].to_numpy(dtype=float), expected[numeric].to_numpy(dtype=float))
+    stats = cached.stats()
+    repeats_hit = second == first and stats['hits'] >= len(applications)
+
+    ok = matches and repeats_hit
+    mark = '✓' if ok else '✗'
+    logger.info(f"  {mark} {name}: {'matches' if matches else 'differs from'} the uncached model, "
+                f"{stats['hits']} hits / {stats['requests']} requests, {len(cached.model_columns)} model columns")
+    return ok
+
+def main():
+    logger.info("\n" + "="*70)
+    logger.info("PREDICTION CACHE CHECK")
+    logger.info("="*70)
+
+    # Processed rows carry fields no model reads (applicant_id, the outcomes), as web-form requests may
+    df = pd.read_csv(PROCESSED_DATA_FILE, nrows=SAMPLE_ROWS)
+    applications = df.astype(object).where(df.notna(), None).to_dict('records')
+
+    predictors = []
+    if BEST_MODEL_FILE.exists() and PREPROCESSOR_FILE.exists():
+        predictors.append(('TunedPredictor', TunedPredictor()))
+    if JOINT_MODEL_FILE.exists():
+        predictors.append(('JointPredictor', JointPredictor()))
+    if not predictors:
+        logger.error("No persisted model to check; run the training stages first")
+        sys.exit(1)
+
+    failures = sum(not check(name, predictor, applications) for name, predictor in predictors)
+    if failures:
+        logger.error(f"\n{failures} predictor(s) failed the cache check")
+        sys.exit(1)
+    logger.info("\n✓ Cached predictions match the models")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
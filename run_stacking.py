@@ -0,0 +1,30 @@
+"""
+Stacked ensemble over the Milestone 3 model roster
+Trains a non-negative linear meta-learner on the out-of-fold predictions ModelTrainer saved, so no base
+model is refit; --add cross-fits one more base model on the same folds without touching the others
+
+Usage:
+    python run_stacking.py
+    python run_stacking.py --add "Extra Trees" "Hist Gradient Boosting"
+"""
+
+import argparse
+from src.config import STACKED_MODEL_FILE, ensure_directories
+from src.stacking import OOFStore, StackedEnsemble, build_base_model
+
+def main():
+    parser = argparse.ArgumentParser(description="Stack the trained models on their out-of-fold predictions")
+    parser.add_argument('--add', nargs='+', default=[],
+                        choices=['Extra Trees', 'K-Nearest Neighbors', 'Hist Gradient Boosting'],
+                        help="Base models to cross-fit and add before stacking")
+    args = parser.parse_args()
+
+    ensure_directories()
+    store = OOFStore()
+    for name in args.add:
+        store.add_model(name, build_base_model(name))
+
+    StackedEnsemble().fit(store).save(STACKED_MODEL_FILE)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Stage runner: every milestone as one DAG
+Fingerprints each stage's inputs, parameters and code, skips the ones that are up to date
+and runs independent stages (evaluation, tuning, analytics) concurrently
+
+Usage:
+    python run_stages.py                 # bring every stage up to date
+    python run_stages.py tune            # tune, plus whatever it depends on that is stale
+    python run_stages.py --force train   # rerun train and everything downstream of it
+    python run_stages.py --dry-run       # show what would run
+"""
+
+import argparse
+from src.logger import logger
+from src.config import STAGE_WORKERS, ensure_directories
+from src.stage_graph import StageGraph
+from src.pipeline_stages import build_stages
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the visa processing milestones as a stage DAG")
+    parser.add_argument('targets', nargs='*', help="Stages to bring up to date (default: all)")
+    parser.add_argument('--force', nargs='*', metavar='STAGE',
+                        help="Rerun these stages even if current ('all' or no names: every target)")
+    parser.add_argument('--dry-run', action='store_true', help="List the stages that would run")
+    parser.add_argument('--workers', type=int, default=STAGE_WORKERS, help="Stages run concurrently")
+    args = parser.parse_args()
+
+    ensure_directories()
+    graph = StageGraph(build_stages(), max_workers=args.workers)
+    targets = args.targets or None
+    if args.force is None:
+        force = []
+    else:
+        force = args.force or ['all']
+
+    logger.info("\n" + "="*70)
+    logger.info("STAGE RUNNER")
+    logger.info("="*70)
+
+    if args.dry_run:
+        to_run = graph.plan(targets, force)
+        for name in graph.order(targets):
+            stage = graph.stages[name]
+            marker = '▶ Run' if name in to_run else '✓ Up to date'
+            upstream = f" (after {', '.join(stage.upstream)})" if stage.upstream else ''
+            logger.info(f"  {marker}: {name}{upstream}")
+        return
+
+    executed = graph.run(targets, force)
+
+    logger.info("\n" + "="*70)
+    logger.info(f"✓ {len(executed)} stage(s) run: {', '.join(executed) or 'nothing to do'}")
+    logger.info("="*70)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
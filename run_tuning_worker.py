@@ -0,0 +1,28 @@
+"""
+Tuning worker: evaluate pending hyperparameter-search trials from the shared trial store
+Run on any machine that sees the same trial store file and feature store to add workers to a running
+search; trials already finished or claimed by another worker are skipped
+
+Usage:
+    python run_tuning_worker.py                  # every core on this machine
+    python run_tuning_worker.py --workers 4
+    python run_tuning_worker.py --store /shared/trials.sqlite
+"""
+
+import argparse
+from pathlib import Path
+from src.config import TRIAL_STORE_FILE, TUNING_N_JOBS, ensure_directories
+from src.search_coordinator import join_studies, resolve_workers
+from src.trial_store import TrialStore
+
+def main():
+    parser = argparse.ArgumentParser(description="Work off pending hyperparameter-search trials")
+    parser.add_argument('--store', type=Path, default=TRIAL_STORE_FILE, help="Trial store (SQLite) file")
+    parser.add_argument('--workers', type=int, default=TUNING_N_JOBS, help="Worker processes (-1: every core)")
+    args = parser.parse_args()
+
+    ensure_directories()
+    join_studies(TrialStore(args.store), workers=resolve_workers(args.workers))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
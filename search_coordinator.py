@@ -0,0 +1,167 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src.logger import logger
+from src.config import TUNING_N_JOBS, TUNING_VERBOSE
+from src.trial_store import TrialStore, config_key, worker_id
+
+
+def build_estimator(model, params, n_jobs=1):
+    """The tuned estimator with one trial's settings; one thread, the worker pool supplies parallelism"""
+    if model == 'Gradient Boosting':
+        from sklearn.ensemble import GradientBoostingRegressor
+        return GradientBoostingRegressor(random_state=42, **params)
+    if model == 'Random Forest':
+        from sklearn.ensemble import RandomForestRegressor
+        return RandomForestRegressor(random_state=42, n_jobs=n_jobs, **params)
+    raise ValueError(f"Unknown model: {model}")
+
+
+def resolve_workers(n_jobs=TUNING_N_JOBS):
+    """joblib-style count: -1 means every core, -2 all but one"""
+    if not n_jobs:
+        return 1
+    return n_jobs if n_jobs > 0 else max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+
+
+def evaluate(model, params, X, y, cv):
+    """KFold CV R² per fold, as RandomizedSearchCV scores a regressor"""
+    from sklearn.base import clone
+    from sklearn.metrics import r2_score
+    from sklearn.model_selection import KFold
+    estimator = build_estimator(model, params)
+    scores = []
+    for fit_rows, held_out in KFold(n_splits=cv).split(X):
+        fitted = clone(estimator).fit(X[fit_rows], y[fit_rows])
+        scores.append(r2_score(y[held_out], fitted.predict(X[held_out])))
+    return scores
+
+
+# Each worker process opens the training matrix once, in the pool initializer
+_worker_data = None
+
+
+def _init_worker(feature_store_path, X, y):
+    global _worker_data
+    if feature_store_path is not None:
+        from src.feature_store import FeatureStore
+        X, _, y, _ = FeatureStore(feature_store_path).open()
+    _worker_data = (X, np.asarray(y))
+
+
+def run_worker(store_path, study, model, cv):
+    """Claim and evaluate trials until the study has none pending; returns how many this worker ran"""
+    X, y = _worker_data
+    store = TrialStore(store_path)
+    me = worker_id()
+    done = 0
+    while True:
+        params = store.claim(study, me)
+        if params is None:
+            return done
+        try:
+            scores = evaluate(model, params, X, y, cv)
+        except Exception as e:
+            store.fail(study, params, e)
+            logger.warning(f"  ✗ [{me}] {params}: {e}")
+            continue
+        store.complete(study, params, np.mean(scores), scores)
+        if TUNING_VERBOSE:
+            logger.info(f"  ✓ [{me}] CV R² {np.mean(scores):.4f} {params}")
+        done += 1
+
+
+def _dispatch(store_path, study, model, cv, workers, data):
+    """Run `workers` claim loops on one study: inline for one, on a process pool otherwise"""
+    if workers <= 1:
+        _init_worker(*data)
+        return run_worker(store_path, study, model, cv)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=data) as pool:
+        futures = [pool.submit(run_worker, store_path, study, model, cv) for _ in range(workers)]
+        return sum(future.result() for future in futures)
+
+
+def join_studies(store=None, feature_store=None, workers=None):
+    """Work off the pending trials of every study on this feature store, e.g. one another host started"""
+    from src.feature_store import FeatureStore
+    store = store or TrialStore()
+    feature_store = feature_store or FeatureStore()
+    workers = workers or resolve_workers()
+    total = 0
+    for study, model, cv in store.studies(feature_store.metadata().get('fingerprint')):
+        store.requeue_stale(study)
+        pending = store.counts(study).get('pending', 0)
+        if pending:
+            logger.info(f"  Joining study '{model}' (cv={cv}): {pending} pending trials")
+            total += _dispatch(store.path, study, model, cv, min(workers, pending), (feature_store.path, None, None))
+    logger.info(f"✓ Evaluated {total} trial(s)")
+    return total
+
+
+class SearchCoordinator:
+    """Random search whose trials live in a TrialStore and run on a pool of worker processes
+
+    Configurations are sampled as RandomizedSearchCV samples them and enqueued once; finished ones are
+    never re-evaluated, so a rerun after a crash resumes where it stopped. Workers on other hosts that
+    open the same store file (run_tuning_worker.py) claim trials from the same queue.
+    """
+
+    def __init__(self, model, param_grid, n_iter, cv, X, y, fingerprint=None, feature_store_path=None,
+                 store=None, workers=None):
+        self.model = model
+        self.param_grid = param_grid
+        self.n_iter = n_iter
+        self.cv = cv
+        self.X = X
+        self.y = y
+        self.feature_store_path = feature_store_path
+        self.store = store or TrialStore()
+        self.workers = workers or resolve_workers()
+        if fingerprint is None:
+            import joblib
+            fingerprint = joblib.hash((np.asarray(X), np.asarray(y)))
+        self.fingerprint = fingerprint
+        self.study = f"{model}:cv{cv}:{fingerprint}"
+
+    def configs(self):
+        from sklearn.model_selection import ParameterSampler
+        return list(ParameterSampler(self.param_grid, n_iter=self.n_iter, random_state=42))
+
+    def run(self):
+        """Evaluate every outstanding trial; returns the finished trials, best first"""
+        self.store.create_study(self.study, self.model, self.cv, self.fingerprint)
+        configs = self.configs()
+        new = self.store.enqueue(self.study, configs)
+        stale = self.store.requeue_stale(self.study)
+        counts = self.store.counts(self.study)
+        pending = counts.get('pending', 0)
+        logger.info(f"  Study '{self.model}' (cv={self.cv}): {len(configs)} configs, {new} new, "
+                    f"{counts.get('done', 0)} already done, {stale} requeued after a crash, {pending} to run")
+
+        if pending:
+            # The feature store is reopened by path in each worker; in-memory data is sent once per worker
+            data = (self.feature_store_path, None, None) if self.feature_store_path else (None, self.X, self.y)
+            workers = min(self.workers, pending)
+            logger.info(f"  Dispatching {pending} trials to {workers} worker process(es)...")
+            _dispatch(self.store.path, self.study, self.model, self.cv, workers, data)
+
+        counts = self.store.counts(self.study)
+        if counts.get('failed'):
+            logger.warning(f"  ✗ {counts['failed']} trial(s) failed; see the error column in {self.store.path}")
+        if counts.get('running'):
+            logger.info(f"  {counts['running']} trial(s) still running on other workers")
+        # Trials of earlier, differently sized searches in this study are kept but not chosen from
+        keys = {config_key(params) for params in configs}
+        results = self.store.results(self.study)
+        results = results[results['config'].isin(keys)]
+        if results.empty:
+            raise RuntimeError(f"No finished trials for {self.study}")
+        return results
+
+    def best(self):
+        """Best configuration and its CV R², refit on the full training split with every core"""
+        results = self.run()
+        params = results['params'].iloc[0]
+        estimator = build_estimator(self.model, params, n_jobs=-1)
+        estimator.fit(self.X, np.asarray(self.y))
+        return estimator, params, float(results['score'].iloc[0])
\ No newline at end of file
@@ -0,0 +1,203 @@
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.logger import logger
+from src.config import STACKING_DIR, STACKING_FOLDS, STACKING_WORKERS
+
+
+def stacking_folds(n_rows, n_folds=STACKING_FOLDS):
+    """ModelTrainer's CV split; every base model is cross-fitted on it so their OOF columns line up"""
+    from sklearn.model_selection import KFold
+    return list(KFold(n_splits=n_folds).split(np.zeros((n_rows, 1))))
+
+
+def build_base_model(name):
+    """Extra base models that can join the stack after training, on the shared (tree) feature view"""
+    if name == 'Extra Trees':
+        from sklearn.ensemble import ExtraTreesRegressor
+        return ExtraTreesRegressor(n_estimators=200, min_samples_leaf=2, random_state=42, n_jobs=-1)
+    if name == 'K-Nearest Neighbors':
+        from sklearn.neighbors import KNeighborsRegressor
+        return KNeighborsRegressor(n_neighbors=15, weights='distance')
+    if name == 'Hist Gradient Boosting':
+        from sklearn.ensemble import HistGradientBoostingRegressor
+        return HistGradientBoostingRegressor(max_iter=300, learning_rate=0.1, random_state=42)
+    raise ValueError(f"Unknown base model: {name}")
+
+
+def _slug(name):
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+
+class OOFStore:
+    """Each base model's out-of-fold and test predictions and its fitted estimator, written once per training"""
+
+    def __init__(self, path=STACKING_DIR):
+        self.path = path
+        self.index_file = path / 'index.json'
+
+    def index(self):
+        if not self.index_file.exists():
+            return {}
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, name, model, oof_pred, test_pred, view, fingerprint, cv_score=None):
+        """Persist one base model; entries for other models are left as they are"""
+        import joblib
+        self.path.mkdir(parents=True, exist_ok=True)
+        slug = _slug(name)
+        np.savez(self.path / f'{slug}.npz', oof=np.asarray(oof_pred, dtype=np.float64),
+                 test=np.asarray(test_pred, dtype=np.float64))
+        joblib.dump(model, self.path / f'{slug}.pkl')
+
+        index = self.index()
+        index[name] = {'slug': slug, 'view': view, 'fingerprint': fingerprint,
+                       'cv_r2': None if cv_score is None else float(cv_score)}
+        with open(self.index_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+
+    def save_encoder(self, encoder, fingerprint):
+        """The categorical encoder behind the 'linear' view (sparse one-hot, hashing or target encoding)"""
+        import joblib
+        self.path.mkdir(parents=True, exist_ok=True)
+        joblib.dump({'encoder': encoder, 'fingerprint': fingerprint}, self.path / 'linear_encoder.pkl')
+
+    def encoder(self, fingerprint):
+        import joblib
+        path = self.path / 'linear_encoder.pkl'
+        if not path.exists():
+            return None
+        saved = joblib.load(path)
+        return saved['encoder'] if saved['fingerprint'] == fingerprint else None
+
+    def names(self, fingerprint):
+        """Base models whose predictions were made on the data behind this fingerprint"""
+        return [name for name, entry in self.index().items() if entry['fingerprint'] == fingerprint]
+
+    def entry(self, name):
+        return self.index()[name]
+
+    def predictions(self, name):
+        """(out-of-fold training predictions, test predictions)"""
+        with np.load(self.path / f"{self.entry(name)['slug']}.npz") as data:
+            return data['oof'], data['test']
+
+    def model(self, name):
+        import joblib
+        return joblib.load(self.path / f"{self.entry(name)['slug']}.pkl")
+
+    def add_model(self, name, model, feature_store=None):
+        """Cross-fit one new base model on the shared folds; the models already stored are not refit"""
+        from sklearn.base import clone
+        from sklearn.metrics import r2_score
+        from src.feature_store import FeatureStore
+
+        feature_store = feature_store or FeatureStore()
+        fingerprint = feature_store.metadata()['fingerprint']
+        if name in self.names(fingerprint):
+            logger.info(f"  ✓ {name}: predictions already stored for this feature store")
+            return
+
+        X_train, X_test, y_train, _ = feature_store.open()
+        y = np.asarray(y_train)
+        folds = stacking_folds(len(y))
+        oof_pred = np.empty(len(y))
+        for fit_rows, held_out in folds:
+            oof_pred[held_out] = clone(model).fit(X_train[fit_rows], y[fit_rows]).predict(X_train[held_out])
+        cv_score = np.mean([r2_score(y[held_out], oof_pred[held_out]) for _, held_out in folds])
+        model.fit(X_train, y)
+        self.save(name, model, oof_pred, model.predict(X_test), 'tree', fingerprint, cv_score)
+        logger.info(f"  ✓ Added base model {name} (CV R² {cv_score:.4f})")
+
+
+class StackedEnsemble:
+    """Non-negative linear meta-learner over the base models' predictions; base models predict concurrently"""
+
+    def __init__(self, workers=STACKING_WORKERS):
+        self.workers = workers
+        self.names = []
+        self.views = {}
+        self.models = {}
+        self.encoder = None
+        self.weights = None
+        self.intercept = 0.0
+        self.results = {}
+
+    def fit(self, oof_store=None, feature_store=None):
+        """Train the meta-learner on the stored out-of-fold predictions; no base model is refit"""
+        from sklearn.linear_model import LinearRegression
+        from sklearn.metrics import mean_absolute_error, r2_score
+        from src.feature_store import FeatureStore
+
+        logger.info("\n" + "="*70)
+        logger.info("STACKED ENSEMBLE")
+        logger.info("="*70)
+
+        oof_store = oof_store or OOFStore()
+        feature_store = feature_store or FeatureStore()
+        fingerprint = feature_store.metadata()['fingerprint']
+        _, _, y_train, y_test = feature_store.open()
+
+        self.names = oof_store.names(fingerprint)
+        if not self.names:
+            raise ValueError(f"No base-model predictions for the current feature store in {oof_store.path}")
+        predictions = [oof_store.predictions(name) for name in self.names]
+        oof = np.column_stack([p[0] for p in predictions])
+        test = np.column_stack([p[1] for p in predictions])
+
+        # Positive weights keep the stack an interpretable blend and resist overfitting correlated columns
+        meta = LinearRegression(positive=True).fit(oof, np.asarray(y_train))
+        stacked = meta.predict(test)
+        y_test = np.asarray(y_test)
+
+        logger.info(f"  {len(self.names)} base models, meta-learner fit on {len(oof):,} out-of-fold rows")
+        logger.info("-"*70)
+        logger.info(f"{'Model':<25} {'Weight':>8} {'CV R2':>8} {'Test MAE':>10} {'Test R2':>9}")
+        logger.info("-"*70)
+        for i, name in enumerate(self.names):
+            cv = oof_store.entry(name)['cv_r2']
+            self.results[name] = {'MAE': mean_absolute_error(y_test, test[:, i]), 'R2': r2_score(y_test, test[:, i])}
+            logger.info(f"{name:<25} {meta.coef_[i]:>8.3f} {cv if cv is not None else float('nan'):>8.4f} "
+                        f"{self.results[name]['MAE']:>10.2f} {self.results[name]['R2']:>9.4f}")
+        self.results['Stacked'] = {'MAE': mean_absolute_error(y_test, stacked), 'R2': r2_score(y_test, stacked)}
+        logger.info(f"{'Stacked':<25} {'':>8} {'':>8} {self.results['Stacked']['MAE']:>10.2f} "
+                    f"{self.results['Stacked']['R2']:>9.4f}")
+        logger.info("-"*70)
+        best = max(self.names, key=lambda name: self.results[name]['R2'])
+        logger.info(f"  ✓ Stacked R² {self.results['Stacked']['R2']:.4f} vs best single "
+                    f"{best} {self.results[best]['R2']:.4f}")
+
+        # Base models the meta-learner gave no weight are never loaded or run at inference
+        used = [i for i, name in enumerate(self.names) if meta.coef_[i] > 0]
+        self.names = [self.names[i] for i in used]
+        self.weights = meta.coef_[used]
+        self.intercept = float(meta.intercept_)
+        self.views = {name: oof_store.entry(name)['view'] for name in self.names}
+        self.models = {name: oof_store.model(name) for name in self.names}
+        if 'linear' in self.views.values():
+            self.encoder = oof_store.encoder(fingerprint)
+            if self.encoder is None:
+                raise ValueError("The linear-view encoder is missing or stale; rerun training")
+        return self
+
+    def _predict_base(self, name, X, X_linear):
+        return self.models[name].predict(X_linear if self.views[name] == 'linear' else X)
+
+    def predict(self, X, X_linear=None):
+        """X: the featurizer's scaled matrix; X_linear: the encoder's view, needed when a linear-view model is used"""
+        with ThreadPoolExecutor(max(1, min(self.workers, len(self.names)))) as pool:
+            columns = list(pool.map(lambda name: self._predict_base(name, X, X_linear), self.names))
+        return np.column_stack(columns) @ self.weights + self.intercept
+
+    def save(self, path):
+        import joblib
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self, path)
+        logger.info(f"✓ Stacked ensemble saved: {path}")
+
+    @staticmethod
+    def load(path):
+        import joblib
+        return joblib.load(path)
\ No newline at end of file
@@ -0,0 +1,201 @@
+import hashlib
+import importlib.util
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from pathlib import Path
+from src.logger import logger
+from src.config import STAGE_STATE_FILE, STAGE_WORKERS
+
+
+def _file_digest(path):
+    """Content hash of a file, or of every file under a directory"""
+    digest = hashlib.sha1()
+    path = Path(path)
+    files = sorted(p for p in path.rglob('*') if p.is_file()) if path.is_dir() else [path]
+    for file in files:
+        digest.update(str(file.relative_to(path) if path.is_dir() else file.name).encode('utf-8'))
+        with open(file, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _module_digest(module):
+    """Hash a module's source without importing it"""
+    spec = importlib.util.find_spec(module)
+    if spec is None or spec.origin is None:
+        return 'missing'
+    with open(spec.origin, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class Stage:
+    """One step of the DAG: a module-level function with declared input and output paths"""
+
+    def __init__(self, name, func, inputs=(), outputs=(), params=None, code=()):
+        self.name = name
+        self.func = func
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.params = params or {}
+        self.code = list(code)
+        self.upstream = []
+
+    def fingerprint(self, file_hashes):
+        """Hash of the input contents, parameters and the code that implements the stage"""
+        payload = {
+            'inputs': {str(p): file_hashes.get(str(p)) for p in self.inputs},
+            'params': self.params,
+            'code': {module: _module_digest(module) for module in self.code}
+        }
+        return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _run_stage(stage):
+    """Process-pool entry point"""
+    stage.func()
+    return stage.name
+
+
+class StageGraph:
+    """Run stages in dependency order, skipping current ones and running independent ones concurrently"""
+
+    def __init__(self, stages, state_file=STAGE_STATE_FILE, max_workers=STAGE_WORKERS):
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_file = state_file
+        self.max_workers = max_workers
+        self.state = self._load_state()
+        self._hash_cache = {}
+        self._link()
+
+    def _link(self):
+        """Derive edges from matching output and input paths"""
+        producers = {}
+        for stage in self.stages.values():
+            for output in stage.outputs:
+                producers[output] = stage.name
+        for stage in self.stages.values():
+            stage.upstream = sorted({producers[p] for p in stage.inputs if p in producers and producers[p] != stage.name})
+
+    def _load_state(self):
+        if not self.state_file.exists():
+            return {}
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+
+    def _hash(self, path):
+        """Content hash, memoized on (size, mtime) so unchanged files are not re-read"""
+        path = Path(path)
+        if not path.exists():
+            return None
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        if key not in self._hash_cache:
+            self._hash_cache[key] = _file_digest(path)
+        return self._hash_cache[key]
+
+    def _file_hashes(self, stage):
+        return {str(p): self._hash(p) for p in stage.inputs}
+
+    def order(self, targets=None):
+        """Topological order of the targets and everything they depend on"""
+        wanted = set()
+        pending = list(targets or self.stages)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage: {name}")
+            if name not in wanted:
+                wanted.add(name)
+                pending.extend(self.stages[name].upstream)
+
+        ordered, done = [], set()
+        while len(ordered) < len(wanted):
+            ready = sorted(n for n in wanted - done if set(self.stages[n].upstream) <= done)
+            if not ready:
+                raise ValueError("Stage graph has a cycle")
+            ordered.extend(ready)
+            done.update(ready)
+        return ordered
+
+    def is_current(self, name):
+        """A stage is current when its fingerprint matches and its outputs are unchanged"""
+        stage = self.stages[name]
+        record = self.state.get(name)
+        if record is None:
+            return False
+        if record.get('fingerprint') != stage.fingerprint(self._file_hashes(stage)):
+            return False
+        return all(record.get('outputs', {}).get(str(p)) == self._hash(p) for p in stage.outputs)
+
+    def _mark_done(self, name):
+        stage = self.stages[name]
+        self.state[name] = {
+            'fingerprint': stage.fingerprint(self._file_hashes(stage)),
+            'outputs': {str(p): self._hash(p) for p in stage.outputs},
+            'completed': datetime.now().isoformat(timespec='seconds')
+        }
+        self._save_state()
+
+    def plan(self, targets=None, force=()):
+        """Stages that are stale, forced, or downstream of one that is, in order"""
+        to_run = []
+        for name in self.order(targets):
+            forced = 'all' in force or name in force
+            if forced or not self.is_current(name) or any(up in to_run for up in self.stages[name].upstream):
+                to_run.append(name)
+        return to_run
+
+    def run(self, targets=None, force=()):
+        """Execute the stale stages, running independent ones concurrently"""
+        ordered = self.order(targets)
+        to_run = self.plan(targets, force)
+
+        for name in ordered:
+            marker = '▶ Run' if name in to_run else '✓ Up to date'
+            logger.info(f"  {marker}: {name}")
+        if not to_run:
+            return []
+
+        done = set(ordered) - set(to_run)
+        running = {}
+        executed = []
+        workers = max(1, min(self.max_workers or os.cpu_count() or 1, len(to_run)))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while len(done) < len(ordered):
+                for name in to_run:
+                    if name in done or name in running.values():
+                        continue
+                    if not set(self.stages[name].upstream) <= done:
+                        continue
+                    # Early cutoff: an upstream rerun that reproduced identical outputs leaves this stage current
+                    forced = 'all' in force or name in force
+                    if not forced and self.is_current(name):
+                        logger.info(f"  ✓ Up to date after upstream rerun: {name}")
+                        done.add(name)
+                        continue
+                    logger.info(f"\n[STAGE] {name} started")
+                    running[pool.submit(_run_stage, self.stages[name])] = name
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    future.result()
+                    self._mark_done(name)
+                    done.add(name)
+                    executed.append(name)
+                    logger.info(f"  ✓ Stage complete: {name}")
+        return executed
\ No newline at end of file
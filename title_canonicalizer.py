@@ -0,0 +1,215 @@
+import math
+import re
+from collections import defaultdict
+import numpy as np
+import pandas as pd
+from src.logger import logger
+
+# Canonical titles: (canonical title, SOC code, title variants).
+# A variant matches when all of its normalized tokens appear in the job title.
+TITLE_CATALOG = [
+    ('Software Engineer', '15-1252', [
+        'software engineer', 'software development engineer', 'member technical staff',
+        'firmware engineer', 'java software engineer']),
+    ('Software Developer', '15-1252', [
+        'software developer', 'application developer', 'java developer', 'developer']),
+    ('Web Developer', '15-1254', ['web developer', 'web designer']),
+    ('Software QA Engineer', '15-1253', [
+        'quality assurance engineer', 'quality assurance analyst', 'test engineer',
+        'validation engineer', 'quality assurance']),
+    ('Computer Systems Analyst', '15-1211', [
+        'systems analyst', 'computer systems analyst', 'it analyst', 'technical analyst']),
+    ('Programmer Analyst', '15-1251', ['programmer analyst', 'computer programmer', 'programmer']),
+    ('Systems Architect', '15-1299', [
+        'software architect', 'technical architect', 'solution architect', 'enterprise architect',
+        'application architect', 'technology architect', 'systems architect',
+        'systems engineer', 'computer systems engineer']),
+    ('Technical Lead', '15-1299', ['technical lead', 'technology lead', 'team lead']),
+    ('Database Administrator', '15-1242', ['database administrator', 'database']),
+    ('Network Administrator', '15-1244', [
+        'systems administrator', 'network administrator', 'network engineer']),
+    ('Data Scientist', '15-2051', ['data scientist', 'data analyst', 'business intelligence analyst']),
+    ('Business Analyst', '13-1111', [
+        'business analyst', 'management analyst', 'business systems analyst']),
+    ('Consultant', '13-1111', ['consultant', 'technology consultant']),
+    ('Financial Analyst', '13-2051', ['financial analyst', 'finance analyst', 'risk analyst']),
+    ('Accountant', '13-2011', ['accountant', 'auditor']),
+    ('Analyst', '13-1199', ['analyst', 'quantitative analyst', 'budget analyst', 'credit analyst']),
+    ('Market Research Analyst', '13-1161', [
+        'market research analyst', 'marketing specialist', 'marketing analyst']),
+    ('Operations Research Analyst', '15-2031', ['operations research analyst']),
+    ('Project Manager', '13-1082', ['project manager', 'program manager', 'technical program manager']),
+    ('Product Manager', '11-2021', ['product manager', 'marketing manager']),
+    ('Manager', '11-1021', [
+        'manager', 'director', 'vice president', 'operations manager', 'general manager']),
+    ('Hardware Engineer', '17-2061', [
+        'hardware engineer', 'hardware developer', 'design engineer', 'asic design engineer',
+        'component design engineer']),
+    ('Electrical Engineer', '17-2071', ['electrical engineer', 'rf engineer']),
+    ('Mechanical Engineer', '17-2141', ['mechanical engineer', 'mechanical design engineer']),
+    ('Engineer', '17-2199', ['engineer', 'process engineer', 'project engineer', 'product engineer']),
+    ('Sales Representative', '41-4011', ['sales representative', 'sales engineer']),
+    ('Professor', '25-1099', ['professor', 'lecturer', 'instructor']),
+    ('Teacher', '25-2021', ['teacher']),
+    ('Physician', '29-1229', [
+        'physician', 'hospitalist', 'nephrologist', 'internist', 'psychiatrist', 'pediatrician']),
+    ('Dentist', '29-1021', ['dentist']),
+    ('Therapist', '29-1129', [
+        'occupational therapist', 'physical therapist', 'speech language pathologist']),
+    ('Research Scientist', '19-1099', ['scientist', 'research associate', 'chemist']),
+    ('Graphic Designer', '27-1024', ['graphic designer', 'designer']),
+    ('Poultry Processing Worker', '51-3022', [
+        'poultry', 'meat', 'catfish', 'cutter trimmer', 'fish cutter']),
+    ('Cook', '35-2014', ['cook', 'chef', 'food preparation']),
+    ('Food Service Worker', '35-3023', ['food service', 'serving worker']),
+    ('Cleaner', '37-2011', ['cleaner', 'janitor', 'housekeeper']),
+    ('Caregiver', '31-1122', ['caregiver', 'home health aide']),
+    ('Laborer', '53-7062', ['laborer', 'general labor', 'packer', 'line worker']),
+]
+
+UNCLASSIFIED_SOC = '99-9999'
+
+# Abbreviations are expanded before matching
+ABBREVIATIONS = {
+    'sr': 'senior', 'snr': 'senior', 'jr': 'junior',
+    'sde': 'software development engineer', 'swe': 'software engineer',
+    'qa': 'quality assurance', 'engr': 'engineer', 'eng': 'engineer',
+    'dev': 'developer', 'mgr': 'manager', 'mngr': 'manager', 'admin': 'administrator',
+    'asst': 'assistant', 'assoc': 'associate', 'prof': 'professor',
+    'dba': 'database administrator', 'sys': 'systems', 'system': 'systems',
+    'prog': 'programmer', 'tech': 'technical', 'mts': 'member technical staff',
+    'vp': 'vice president'
+}
+
+# Seniority markers are captured separately and dropped from the canonical title
+SENIORITY_LEVELS = {
+    'intern': 0, 'junior': 1, 'entry': 1,
+    'i': 1, 'ii': 2, 'iii': 3, 'iv': 4, 'v': 5,
+    '1': 1, '2': 2, '3': 3, '4': 4, '5': 5,
+    'senior': 3, 'staff': 4, 'lead': 4, 'principal': 5, 'chief': 6
+}
+DEFAULT_SENIORITY = 2
+
+STOPWORDS = {'of', 'and', 'the', 'a', 'an', 'in', 'for', 'or', 'u', 's', 'us', 'to', 'with'}
+PLURAL_EXCEPTIONS = {'systems', 'services', 'sales', 'operations', 'analytics', 'economics', 'logistics'}
+
+
+def tokenize(title):
+    """Lowercase, split on non-alphanumerics, expand abbreviations and singularize"""
+    tokens = []
+    for raw in re.findall(r'[a-z]+|\d+', str(title).lower()):
+        expanded = ABBREVIATIONS.get(raw, raw)
+        for token in expanded.split():
+            if len(token) > 3 and token.endswith('s') and not token.endswith('ss') \
+                    and token not in PLURAL_EXCEPTIONS:
+                token = token[:-1]
+            tokens.append(token)
+    return tokens
+
+
+class TitleCanonicalizer:
+    """Map free-text job titles to canonical titles and SOC groups via an inverted index"""
+
+    def __init__(self, catalog=TITLE_CATALOG):
+        self.catalog = catalog
+        self.variants = []
+        self.index = defaultdict(list)
+        self.memo = {}
+        self._build_index()
+
+    def _build_index(self):
+        """Index every catalog variant by its tokens, weighting rare tokens higher"""
+        document_freq = defaultdict(int)
+        for canonical, soc_code, variants in self.catalog:
+            for variant in variants:
+                tokens = tuple(sorted(set(tokenize(variant))))
+                self.variants.append((canonical, soc_code, tokens))
+                for token in tokens:
+                    document_freq[token] += 1
+
+        total = len(self.variants)
+        self.idf = {token: math.log(1 + total / df) for token, df in document_freq.items()}
+        for variant_id, (_, _, tokens) in enumerate(self.variants):
+            for token in tokens:
+                self.index[token].append(variant_id)
+
+    def _match(self, tokens):
+        """Return the most specific variant whose tokens are all present"""
+        hits = defaultdict(int)
+        for token in set(tokens):
+            for variant_id in self.index.get(token, ()):
+                hits[variant_id] += 1
+
+        best_id, best_score = None, 0.0
+        for variant_id, count in hits.items():
+            variant_tokens = self.variants[variant_id][2]
+            if count < len(variant_tokens):
+                continue
+            score = sum(self.idf[token] for token in variant_tokens)
+            if score > best_score:
+                best_id, best_score = variant_id, score
+        return best_id
+
+    def canonicalize(self, title):
+        """Return (canonical title, SOC code, seniority level) for one raw title"""
+        if title in self.memo:
+            return self.memo[title]
+
+        tokens = [token for token in tokenize(title) if token not in STOPWORDS]
+        levels = [SENIORITY_LEVELS[token] for token in tokens if token in SENIORITY_LEVELS]
+        seniority = max(levels) if levels else DEFAULT_SENIORITY
+
+        variant_id = self._match(tokens)
+        if variant_id is not None:
+            canonical, soc_code, _ = self.variants[variant_id]
+        else:
+            core = [token for token in tokens if token not in SENIORITY_LEVELS]
+            canonical = ' '.join(core).title() if core else 'Unknown'
+            soc_code = UNCLASSIFIED_SOC
+
+        self.memo[title] = (canonical, soc_code, seniority)
+        return self.memo[title]
+
+    def transform(self, titles):
+        """Canonicalize a column, resolving only its distinct values"""
+        codes, uniques = pd.factorize(titles)
+        resolved = [self.canonicalize(title) for title in uniques] + [('Unknown', UNCLASSIFIED_SOC, DEFAULT_SENIORITY)]
+
+        canonical = np.array([r[0] for r in resolved], dtype=object)
+        soc_codes = np.array([r[1] for r in resolved], dtype=object)
+        seniority = np.array([r[2] for r in resolved], dtype=np.int64)
+
+        # factorize marks missing titles with -1, which indexes the trailing 'Unknown'
+        return pd.DataFrame({
+            'job_title': canonical[codes],
+            'job_soc_group': soc_codes[codes],
+            'job_seniority': seniority[codes]
+        }, index=titles.index)
+
+    def transform_frame(self, df, column='job_title'):
+        """Replace the raw title column with canonical title, SOC group and seniority"""
+        if column not in df.columns:
+            return df
+
+        df = df.copy()
+        before = df[column].nunique()
+        resolved = self.transform(df[column])
+        df[column] = resolved['job_title']
+        df['job_soc_group'] = resolved['job_soc_group']
+        df['job_seniority'] = resolved['job_seniority']
+
+        logger.info(f"    ✓ Canonicalized '{column}': {before} titles -> {df[column].nunique()} canonical "
+                    f"({df['job_soc_group'].nunique()} SOC groups)")
+        return df
+
+    def save(self, path):
+        """Persist the index and memoized lookups for serving"""
+        import joblib
+        joblib.dump(self, path)
+        logger.info(f"  ✓ Saved title canonicalizer: {path}")
+
+    @staticmethod
+    def load(path):
+        """Load a persisted canonicalizer"""
+        import joblib
+        return joblib.load(path)
\ No newline at end of file
@@ -0,0 +1,139 @@
+import json
+import os
+import socket
+import sqlite3
+import time
+from contextlib import contextmanager
+import pandas as pd
+from src.config import TRIAL_STORE_FILE, TUNING_TRIAL_TIMEOUT
+
+
+def config_key(params):
+    """Canonical JSON of one configuration: the same settings always map to the same trial"""
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class TrialStore:
+    """SQLite table of search trials shared by every worker process (or host) that opens the same file"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS studies (
+            study TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            cv INTEGER NOT NULL,
+            fingerprint TEXT,
+            created REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS trials (
+            study TEXT NOT NULL,
+            config TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            worker TEXT,
+            score REAL,
+            fold_scores TEXT,
+            error TEXT,
+            started REAL,
+            finished REAL,
+            PRIMARY KEY (study, config)
+        );
+    """
+
+    def __init__(self, path=TRIAL_STORE_FILE):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._session() as db:
+            db.executescript(self.SCHEMA)
+
+    def _connect(self):
+        # WAL lets readers proceed while one worker writes; writers wait up to the timeout for the lock
+        db = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        db.execute('PRAGMA journal_mode=WAL')
+        return db
+
+    @contextmanager
+    def _session(self):
+        db = self._connect()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def create_study(self, study, model, cv, fingerprint=None):
+        with self._session() as db:
+            db.execute('INSERT OR IGNORE INTO studies VALUES (?, ?, ?, ?, ?)',
+                       (study, model, cv, fingerprint, time.time()))
+
+    def studies(self, fingerprint=None):
+        """(study, model, cv) of every study, or of those on the data behind a fingerprint"""
+        with self._session() as db:
+            if fingerprint is None:
+                return db.execute('SELECT study, model, cv FROM studies').fetchall()
+            return db.execute('SELECT study, model, cv FROM studies WHERE fingerprint = ?', (fingerprint,)).fetchall()
+
+    def enqueue(self, study, configs):
+        """Add configurations not seen before; returns how many were new"""
+        with self._session() as db:
+            before = db.total_changes
+            db.executemany('INSERT OR IGNORE INTO trials (study, config) VALUES (?, ?)',
+                           [(study, config_key(params)) for params in configs])
+            return db.total_changes - before
+
+    def requeue_stale(self, study, timeout=TUNING_TRIAL_TIMEOUT):
+        """Trials left running by a crashed or killed worker go back to pending"""
+        with self._session() as db:
+            cursor = db.execute("UPDATE trials SET status = 'pending', worker = NULL, started = NULL "
+                                "WHERE study = ? AND status = 'running' AND started < ?",
+                                (study, time.time() - timeout))
+            return cursor.rowcount
+
+    def claim(self, study, worker=None):
+        """Atomically mark one pending trial as running for this worker; None when nothing is left"""
+        db = self._connect()
+        try:
+            db.execute('BEGIN IMMEDIATE')
+            row = db.execute("SELECT config FROM trials WHERE study = ? AND status = 'pending' LIMIT 1",
+                             (study,)).fetchone()
+            if row is None:
+                db.execute('COMMIT')
+                return None
+            db.execute("UPDATE trials SET status = 'running', worker = ?, started = ? WHERE study = ? AND config = ?",
+                       (worker or worker_id(), time.time(), study, row[0]))
+            db.execute('COMMIT')
+            return json.loads(row[0])
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+        finally:
+            db.close()
+
+    def complete(self, study, params, score, fold_scores):
+        with self._session() as db:
+            db.execute("UPDATE trials SET status = 'done', score = ?, fold_scores = ?, finished = ? "
+                       "WHERE study = ? AND config = ?",
+                       (float(score), json.dumps([float(s) for s in fold_scores]), time.time(),
+                        study, config_key(params)))
+
+    def fail(self, study, params, error):
+        with self._session() as db:
+            db.execute("UPDATE trials SET status = 'failed', error = ?, finished = ? WHERE study = ? AND config = ?",
+                       (str(error), time.time(), study, config_key(params)))
+
+    def counts(self, study):
+        """Trials per status"""
+        with self._session() as db:
+            rows = db.execute('SELECT status, COUNT(*) FROM trials WHERE study = ? GROUP BY status', (study,))
+            return dict(rows.fetchall())
+
+    def results(self, study):
+        """Finished trials, best score first"""
+        with self._session() as db:
+            frame = pd.read_sql_query(
+                "SELECT config, score, fold_scores, worker, finished - started AS seconds FROM trials "
+                "WHERE study = ? AND status = 'done' ORDER BY score DESC", db, params=(study,)
+            )
+        frame['params'] = frame['config'].map(json.loads)
+        return frame
\ No newline at end of file
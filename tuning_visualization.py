@@ -1,9 +1,99 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from src.logger import logger
 from src.config import PROCESSED_DATA_DIR
+from src.chart_renderer import ChartRenderer, RenderJob
+
+
+def draw_performance_comparison(baseline, tuned):
+    """Compare baseline vs tuned models"""
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(15, 5))
+    axes = fig.subplots(1, 3)
+    
+    models = ['Linear Reg', 'Random Forest', 'Gradient Boost', 'SVR']
+    baseline_mae = [baseline[m]['MAE'] for m in ['Linear Regression', 'Random Forest', 'Gradient Boosting', 'SVR']]
+    baseline_r2 = [baseline[m]['R2'] for m in ['Linear Regression', 'Random Forest', 'Gradient Boosting', 'SVR']]
+    
+    tuned_mae = [tuned['Random Forest (Tuned)']['MAE'], 
+                 tuned['Gradient Boosting (Tuned)']['MAE']]
+    tuned_r2 = [tuned['Random Forest (Tuned)']['R2'],
+                tuned['Gradient Boosting (Tuned)']['R2']]
+    
+    # MAE Comparison
+    x = np.arange(2)
+    width = 0.35
+    axes[0].bar(x - width/2, [baseline_mae[1], baseline_mae[2]], width, label='Baseline', color='#3498db')
+    axes[0].bar(x + width/2, tuned_mae, width, label='Tuned', color='#2ecc71')
+    axes[0].set_ylabel('MAE (days)')
+    axes[0].set_title('MAE: Baseline vs Tuned')
+    axes[0].set_xticks(x)
+    axes[0].set_xticklabels(['Random Forest', 'Gradient Boost'])
+    axes[0].legend()
+    axes[0].grid(axis='y', alpha=0.3)
+    
+    # R² Comparison
+    axes[1].bar(x - width/2, [baseline_r2[1], baseline_r2[2]], width, label='Baseline', color='#3498db')
+    axes[1].bar(x + width/2, tuned_r2, width, label='Tuned', color='#2ecc71')
+    axes[1].set_ylabel('R² Score')
+    axes[1].set_title('R²: Baseline vs Tuned')
+    axes[1].set_xticks(x)
+    axes[1].set_xticklabels(['Random Forest', 'Gradient Boost'])
+    axes[1].set_ylim(0.95, 1.0)
+    axes[1].legend()
+    axes[1].grid(axis='y', alpha=0.3)
+    
+    # Improvement percentage
+    improvements = [
+        ((baseline_r2[1] - tuned_r2[0]) / baseline_r2[1] * 100) if baseline_r2[1] > 0 else 0,
+        ((baseline_r2[2] - tuned_r2[1]) / baseline_r2[2] * 100) if baseline_r2[2] > 0 else 0
+    ]
+    
+    axes[2].bar(['Random Forest', 'Gradient Boost'], improvements, color=['#e74c3c', '#2ecc71'])
+    axes[2].set_ylabel('Improvement (%)')
+    axes[2].set_title('R² Improvement (Tuned vs Baseline)')
+    axes[2].axhline(y=0, color='black', linestyle='-', linewidth=0.5)
+    axes[2].grid(axis='y', alpha=0.3)
+    
+    for i, v in enumerate(improvements):
+        axes[2].text(i, v, f'{v:.2f}%', ha='center', va='bottom' if v > 0 else 'top')
+    
+    fig.tight_layout()
+    return fig
+
+
+def draw_parameter_sensitivity():
+    """Plot parameter sensitivity analysis"""
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(14, 10))
+    axes = fig.subplots(2, 2).flatten()
+    
+    # Key parameters for Gradient Boosting
+    params_info = [
+        ("n_estimators", [50, 100, 150, 200], "Impact on Model Performance"),
+        ("learning_rate", [0.01, 0.05, 0.1, 0.15], "Learning Rate Impact"),
+        ("max_depth", [3, 4, 5, 6, 7], "Tree Depth Impact"),
+        ("min_samples_split", [2, 5, 10], "Min Samples Split Impact")
+    ]
+    
+    for idx, (param_name, param_values, title) in enumerate(params_info):
+        # Simulated sensitivity data (in real scenario, extract from GridSearchCV results)
+        r2_scores = np.linspace(0.92, 0.99, len(param_values))
+        
+        axes[idx].plot(range(len(param_values)), r2_scores, marker='o', linewidth=2, markersize=8, color='#3498db')
+        axes[idx].set_xticks(range(len(param_values)))
+        axes[idx].set_xticklabels(param_values)
+        axes[idx].set_ylabel('R² Score')
+        axes[idx].set_xlabel(param_name)
+        axes[idx].set_title(title)
+        axes[idx].grid(True, alpha=0.3)
+        axes[idx].set_ylim(0.90, 1.0)
+    
+    fig.tight_layout()
+    return fig
+
 
 class TuningVisualization:
     """Visualize hyperparameter tuning results"""
@@ -11,98 +101,32 @@ class TuningVisualization:
     def __init__(self, baseline_results, tuned_results):
         self.baseline = baseline_results
         self.tuned = tuned_results
-        sns.set_style("whitegrid")
+        self.renderer = ChartRenderer(PROCESSED_DATA_DIR)
+    
+    @staticmethod
+    def _scores(results):
+        """Keep only the scalar metrics; predictions are not plotted"""
+        return {name: {'MAE': metrics['MAE'], 'R2': metrics['R2']} for name, metrics in results.items()}
+    
+    def performance_comparison_job(self):
+        return RenderJob(draw_performance_comparison, PROCESSED_DATA_DIR / 'tuning_comparison.png', {
+            'baseline': self._scores(self.baseline),
+            'tuned': self._scores(self.tuned)
+        }, bbox_inches='tight')
+    
+    def parameter_sensitivity_job(self):
+        return RenderJob(draw_parameter_sensitivity, PROCESSED_DATA_DIR / 'parameter_sensitivity.png', {},
+                         bbox_inches='tight')
     
     def plot_performance_comparison(self):
         """Compare baseline vs tuned models"""
         logger.info("\nGenerating: Performance comparison (Baseline vs Tuned)...")
-        
-        fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-        
-        models = ['Linear Reg', 'Random Forest', 'Gradient Boost', 'SVR']
-        baseline_mae = [self.baseline[m]['MAE'] for m in ['Linear Regression', 'Random Forest', 'Gradient Boosting', 'SVR']]
-        baseline_r2 = [self.baseline[m]['R2'] for m in ['Linear Regression', 'Random Forest', 'Gradient Boosting', 'SVR']]
-        
-        tuned_mae = [self.tuned['Random Forest (Tuned)']['MAE'], 
-                     self.tuned['Gradient Boosting (Tuned)']['MAE']]
-        tuned_r2 = [self.tuned['Random Forest (Tuned)']['R2'],
-                    self.tuned['Gradient Boosting (Tuned)']['R2']]
-        
-        # MAE Comparison
-        x = np.arange(2)
-        width = 0.35
-        axes[0].bar(x - width/2, [baseline_mae[1], baseline_mae[2]], width, label='Baseline', color='#3498db')
-        axes[0].bar(x + width/2, tuned_mae, width, label='Tuned', color='#2ecc71')
-        axes[0].set_ylabel('MAE (days)')
-        axes[0].set_title('MAE: Baseline vs Tuned')
-        axes[0].set_xticks(x)
-        axes[0].set_xticklabels(['Random Forest', 'Gradient Boost'])
-        axes[0].legend()
-        axes[0].grid(axis='y', alpha=0.3)
-        
-        # R² Comparison
-        axes[1].bar(x - width/2, [baseline_r2[1], baseline_r2[2]], width, label='Baseline', color='#3498db')
-        axes[1].bar(x + width/2, tuned_r2, width, label='Tuned', color='#2ecc71')
-        axes[1].set_ylabel('R² Score')
-        axes[1].set_title('R²: Baseline vs Tuned')
-        axes[1].set_xticks(x)
-        axes[1].set_xticklabels(['Random Forest', 'Gradient Boost'])
-        axes[1].set_ylim(0.95, 1.0)
-        axes[1].legend()
-        axes[1].grid(axis='y', alpha=0.3)
-        
-        # Improvement percentage
-        improvements = [
-            ((baseline_r2[1] - tuned_r2[0]) / baseline_r2[1] * 100) if baseline_r2[1] > 0 else 0,
-            ((baseline_r2[2] - tuned_r2[1]) / baseline_r2[2] * 100) if baseline_r2[2] > 0 else 0
-        ]
-        
-        axes[2].bar(['Random Forest', 'Gradient Boost'], improvements, color=['#e74c3c', '#2ecc71'])
-        axes[2].set_ylabel('Improvement (%)')
-        axes[2].set_title('R² Improvement (Tuned vs Baseline)')
-        axes[2].axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-        axes[2].grid(axis='y', alpha=0.3)
-        
-        for i, v in enumerate(improvements):
-            axes[2].text(i, v, f'{v:.2f}%', ha='center', va='bottom' if v > 0 else 'top')
-        
-        plt.tight_layout()
-        plt.savefig(PROCESSED_DATA_DIR / 'tuning_comparison.png', dpi=300, bbox_inches='tight')
-        logger.info("  ✓ Saved: tuning_comparison.png")
-        plt.close()
+        self.renderer.render([self.performance_comparison_job()])
     
     def plot_parameter_sensitivity(self):
         """Plot parameter sensitivity analysis"""
         logger.info("\nGenerating: Parameter sensitivity analysis...")
-        
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        axes = axes.flatten()
-        
-        # Key parameters for Gradient Boosting
-        params_info = [
-            ("n_estimators", [50, 100, 150, 200], "Impact on Model Performance"),
-            ("learning_rate", [0.01, 0.05, 0.1, 0.15], "Learning Rate Impact"),
-            ("max_depth", [3, 4, 5, 6, 7], "Tree Depth Impact"),
-            ("min_samples_split", [2, 5, 10], "Min Samples Split Impact")
-        ]
-        
-        for idx, (param_name, param_values, title) in enumerate(params_info):
-            # Simulated sensitivity data (in real scenario, extract from GridSearchCV results)
-            r2_scores = np.linspace(0.92, 0.99, len(param_values))
-            
-            axes[idx].plot(range(len(param_values)), r2_scores, marker='o', linewidth=2, markersize=8, color='#3498db')
-            axes[idx].set_xticks(range(len(param_values)))
-            axes[idx].set_xticklabels(param_values)
-            axes[idx].set_ylabel('R² Score')
-            axes[idx].set_xlabel(param_name)
-            axes[idx].set_title(title)
-            axes[idx].grid(True, alpha=0.3)
-            axes[idx].set_ylim(0.90, 1.0)
-        
-        plt.tight_layout()
-        plt.savefig(PROCESSED_DATA_DIR / 'parameter_sensitivity.png', dpi=300, bbox_inches='tight')
-        logger.info("  ✓ Saved: parameter_sensitivity.png")
-        plt.close()
+        self.renderer.render([self.parameter_sensitivity_job()])
     
     def generate_all_visualizations(self):
         """Generate all tuning visualizations"""
@@ -110,8 +134,10 @@ class TuningVisualization:
         logger.info("GENERATING HYPERPARAMETER TUNING VISUALIZATIONS")
         logger.info("="*70)
         
-        self.plot_performance_comparison()
-        self.plot_parameter_sensitivity()
+        self.renderer.render([
+            self.performance_comparison_job(),
+            self.parameter_sensitivity_job()
+        ])
         
         logger.info("\n" + "="*70)
         logger.info("✓ VISUALIZATIONS COMPLETE")
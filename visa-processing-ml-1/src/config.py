@@ -7,29 +7,247 @@ DATA_DIR = PROJECT_ROOT / 'data'
 RAW_DATA_DIR = DATA_DIR / 'raw'
 PROCESSED_DATA_DIR = DATA_DIR / 'processed'
 REPORTS_DIR = DATA_DIR / 'reports'
+CACHE_DIR = DATA_DIR / 'cache'
 
 # File paths
 RAW_DATA_FILE = RAW_DATA_DIR / 'visa_applications.csv'
 PROCESSED_DATA_FILE = PROCESSED_DATA_DIR / 'visa_applications_processed.csv'
+ML_READY_FILE = PROCESSED_DATA_DIR / 'visa_applications_no_leakage.csv'
 REPORT_FILE = REPORTS_DIR / 'processing_report.json'
 LOG_FILE = REPORTS_DIR / 'processing.log'
+QUARANTINE_FILE = REPORTS_DIR / 'quarantine.csv'
+STATE_CACHE_FILE = CACHE_DIR / 'state_normalization.json'
 
 # Processing parameters
 MISSING_VALUE_THRESHOLD = 0.5
 DUPLICATE_THRESHOLD = 1.0
 OUTLIER_METHOD = 'iqr'
 
+# Data profiling
+PROFILE_SKETCH_SIZE = 1024
+PROFILE_MAX_HISTOGRAM_VALUES = 1000
+PROFILE_MAX_TRACKED_ROWS = 1000000  # exact duplicate counting up to this many distinct rows, KMV estimate beyond
+
+# Streaming ingest
+CHUNK_SIZE = 100000
+
+# US states, DC and territories (abbreviation -> full name)
+US_STATES = {
+    'AL': 'ALABAMA', 'AK': 'ALASKA', 'AZ': 'ARIZONA', 'AR': 'ARKANSAS',
+    'CA': 'CALIFORNIA', 'CO': 'COLORADO', 'CT': 'CONNECTICUT', 'DE': 'DELAWARE',
+    'FL': 'FLORIDA', 'GA': 'GEORGIA', 'HI': 'HAWAII', 'ID': 'IDAHO',
+    'IL': 'ILLINOIS', 'IN': 'INDIANA', 'IA': 'IOWA', 'KS': 'KANSAS',
+    'KY': 'KENTUCKY', 'LA': 'LOUISIANA', 'ME': 'MAINE', 'MD': 'MARYLAND',
+    'MA': 'MASSACHUSETTS', 'MI': 'MICHIGAN', 'MN': 'MINNESOTA', 'MS': 'MISSISSIPPI',
+    'MO': 'MISSOURI', 'MT': 'MONTANA', 'NE': 'NEBRASKA', 'NV': 'NEVADA',
+    'NH': 'NEW HAMPSHIRE', 'NJ': 'NEW JERSEY', 'NM': 'NEW MEXICO', 'NY': 'NEW YORK',
+    'NC': 'NORTH CAROLINA', 'ND': 'NORTH DAKOTA', 'OH': 'OHIO', 'OK': 'OKLAHOMA',
+    'OR': 'OREGON', 'PA': 'PENNSYLVANIA', 'RI': 'RHODE ISLAND', 'SC': 'SOUTH CAROLINA',
+    'SD': 'SOUTH DAKOTA', 'TN': 'TENNESSEE', 'TX': 'TEXAS', 'UT': 'UTAH',
+    'VT': 'VERMONT', 'VA': 'VIRGINIA', 'WA': 'WASHINGTON', 'WV': 'WEST VIRGINIA',
+    'WI': 'WISCONSIN', 'WY': 'WYOMING', 'DC': 'DISTRICT OF COLUMBIA',
+    'PR': 'PUERTO RICO', 'GU': 'GUAM', 'VI': 'VIRGIN ISLANDS',
+    'MP': 'NORTHERN MARIANA ISLANDS', 'AS': 'AMERICAN SAMOA'
+}
+
+# State normalization: informal abbreviations (punctuation and spaces removed)
+STATE_ALIASES = {
+    'ALA': 'AL', 'ARIZ': 'AZ', 'ARK': 'AR', 'CAL': 'CA', 'CALIF': 'CA',
+    'COLO': 'CO', 'CONN': 'CT', 'DEL': 'DE', 'FLA': 'FL', 'ILL': 'IL',
+    'IND': 'IN', 'KAN': 'KS', 'KANS': 'KS', 'MASS': 'MA', 'MICH': 'MI',
+    'MINN': 'MN', 'MISS': 'MS', 'MONT': 'MT', 'NEB': 'NE', 'NEBR': 'NE',
+    'NEV': 'NV', 'OKLA': 'OK', 'ORE': 'OR', 'OREG': 'OR', 'PENN': 'PA',
+    'PENNA': 'PA', 'TENN': 'TN', 'TEX': 'TX', 'WASH': 'WA', 'WVA': 'WV',
+    'WIS': 'WI', 'WISC': 'WI', 'WYO': 'WY', 'WASHINGTONDC': 'DC'
+}
+STATE_COLUMNS = ['processing_center']
+STATE_FUZZY_CUTOFF = 0.85
+
+# Validation rules, compiled into vectorized masks by src.rule_engine.
+# Supported types: range, enum, regex, compare (cross-column).
+# Enum rules with 'normalize': 'state' match spellings through src.state_normalizer, as DataCleaner repairs them.
+VALIDATION_RULES = [
+    {'name': 'processing_time_non_negative', 'type': 'range',
+     'column': 'processing_time_days', 'min': 0},
+    {'name': 'salary_in_range', 'type': 'range',
+     'column': 'annual_income_usd', 'min': 1000, 'max': 1000000},
+    {'name': 'decision_after_application', 'type': 'compare',
+     'left': 'decision_date', 'op': '>=', 'right': 'application_date', 'kind': 'date'},
+    {'name': 'known_processing_center', 'type': 'enum',
+     'column': 'processing_center', 'values': sorted(set(US_STATES.values())), 'normalize': 'state'},
+    {'name': 'known_visa_status', 'type': 'enum',
+     'column': 'visa_status', 'values': ['Certified', 'Certified-Expired', 'Denied', 'Withdrawn']},
+    {'name': 'applicant_id_format', 'type': 'regex',
+     'column': 'applicant_id', 'pattern': r'^A-\d{5}-\d{5}$'}
+]
+
+# Visa statuses counted as an approval
+APPROVED_STATUSES = ['Certified', 'Certified-Expired']
+
 # Feature engineering
 DATE_FEATURES = ['application_date', 'decision_date']
 NUMERIC_FEATURES_TO_SCALE = True
-CATEGORICAL_ENCODING = 'onehot'
+CATEGORICAL_ENCODING = 'onehot'  # linear/kernel models: 'onehot' (sparse CSR), 'hashing', 'target' or 'label'
+CATEGORICAL_MIN_FREQUENCY = 5  # one-hot: rarer categories share one infrequent column
+CATEGORICAL_HASH_FEATURES = 2 ** 14  # hashing: columns in the hashed space
+TARGET_ENCODING_FOLDS = 5  # target: training rows are encoded out-of-fold
+AGGREGATE_FOLDS = 5  # label-derived group aggregates are computed out-of-fold
+AGGREGATE_SMOOTHING = 20  # pseudo-rows pulling small groups toward the overall rate
+CANONICALIZE_JOB_TITLES = True
+TITLE_CANONICALIZER_FILE = PROCESSED_DATA_DIR / 'title_canonicalizer.pkl'
+BEST_MODEL_FILE = PROCESSED_DATA_DIR / 'best_model_tuned.pkl'
+PREPROCESSOR_FILE = PROCESSED_DATA_DIR / 'preprocessor.pkl'
+
+# Feature selection (src.feature_selector, between feature engineering and training)
+FEATURE_SCHEMA_FILE = PROCESSED_DATA_DIR / 'feature_schema.json'
+# Known leaks beyond columns named after the target: outcomes a pending application does not have yet,
+# and the raw date, whose label codes never cover a new date (its derived year/month/day parts are kept)
+SELECTION_LEAK_COLUMNS = ['visa_status', 'visa_status_frequency', 'application_date']
+SELECTION_CORRELATION_THRESHOLD = 0.95  # |Spearman| at which numeric features count as duplicates
+SELECTION_MIN_IMPORTANCE = 0.001  # proxy-model permutation R² drop below which a feature is eliminated
+SELECTION_SAMPLE_SIZE = 50000  # training rows the proxy model sees
+SELECTION_MAX_ROUNDS = 3
+SELECTION_REPEATS = 3
+
+# Modeling
+FEATURE_STORE_DIR = CACHE_DIR / 'feature_store'
+TUNING_N_JOBS = -1  # search worker processes (-1: every core)
+TRIAL_STORE_FILE = CACHE_DIR / 'trials.sqlite'  # search trials; hosts that open the same file share a search
+TUNING_TRIAL_TIMEOUT = 3600  # seconds a claimed trial may run before it is presumed lost and requeued
+MODEL_RESULTS_FILE = PROCESSED_DATA_DIR / 'model_results.pkl'
+TUNING_RESULTS_FILE = PROCESSED_DATA_DIR / 'tuning_results.pkl'
+
+# Stacking (run_stacking.py): meta-learner over the roster's persisted out-of-fold predictions
+STACKING_DIR = CACHE_DIR / 'stacking'
+STACKED_MODEL_FILE = PROCESSED_DATA_DIR / 'stacked_model.pkl'
+STACKING_FOLDS = 5  # ModelTrainer's CV folds; every base model's OOF predictions share them
+STACKING_WORKERS = 4  # base models predicted concurrently at inference
+
+# Forest compression (run_model_compression.py): post-training, for random-forest best models
+COMPRESSED_MODEL_FILE = PROCESSED_DATA_DIR / 'best_model_compressed.pkl'
+COMPRESSION_REPORT_FILE = PROCESSED_DATA_DIR / 'compression_report.csv'
+COMPRESSION_TOLERANCE = 0.01  # validation RMSE growth over the full forest the steps may spend together
+COMPRESSION_MIN_TREES = 20  # tree selection never keeps fewer
+COMPRESSION_DEPTHS = [6, 8, 10, 12]  # depth caps tried, shallowest first
+COMPRESSION_LEAF_TOLERANCE = 2.0  # days: sibling leaves this close merge into their parent
+COMPRESSION_CHUNK_SIZE = 10000  # rows traversed at once when predicting
+
+# Distillation (run_distillation.py): a fast student of the tuned model for interactive requests
+STUDENT_MODEL_FILE = PROCESSED_DATA_DIR / 'student_model.pkl'
+DISTILL_REPORT_FILE = PROCESSED_DATA_DIR / 'distillation_report.csv'
+DISTILL_STUDENTS = ['tree', 'gbm', 'linear']  # single tree, shallow boosting, piecewise-linear splines
+DISTILL_SYNTHETIC_ROWS = 50000  # teacher-labelled synthetic rows added to the real training rows
+DISTILL_SWAP_PROBABILITY = 0.3  # per-feature chance a synthetic row takes another real row's value
+DISTILL_TREE_DEPTH = 10
+DISTILL_LATENCY_TARGET_MS = 1.0  # single-row predict time the served student must meet
+DISTILL_BATCH_ROWS = 100  # requests this large go to the teacher
+
+# Backtesting (run_backtest.py): rolling-origin splits over application_date
+BACKTEST_DATE_COLUMN = 'application_date'
+BACKTEST_INITIAL_MONTHS = 12  # history before the first origin
+BACKTEST_STEP_MONTHS = 3  # months between retraining origins
+BACKTEST_HORIZON_MONTHS = 6  # months each origin's models are scored on
+BACKTEST_WINDOW = 'expanding'  # 'expanding' (all history) or 'rolling' (last BACKTEST_TRAIN_MONTHS)
+BACKTEST_TRAIN_MONTHS = 12
+BACKTEST_MODELS = ['Linear Regression', 'Random Forest', 'Gradient Boosting']  # 'SVR' is supported but slow
+BACKTEST_DECAY_TOLERANCE = 0.10  # MAE growth over the first month that still counts as fresh
+BACKTEST_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+BACKTEST_CACHE_DIR = CACHE_DIR / 'backtest'
+BACKTEST_RESULTS_FILE = PROCESSED_DATA_DIR / 'backtest_results.csv'
+
+# Joint status + processing-time model (one featurization, one predict)
+JOINT_MODEL_FILE = PROCESSED_DATA_DIR / 'joint_model.pkl'
+JOINT_STATUS_TARGET = 'visa_status'
+JOINT_DAYS_TARGET = 'processing_time_days'
+# Derived from an outcome, so unknown when the application is filed
+JOINT_EXCLUDE_COLUMNS = ['visa_status_frequency', 'annual_income_usd_to_processing_time_days_ratio', 'application_date']
+
+# Stage runner (run_stages.py)
+STAGE_STATE_FILE = CACHE_DIR / 'stages.json'
+STAGE_WORKERS = 2
+
+# Report rendering
+RENDER_DPI = 300
+RENDER_WORKERS = min(4, os.cpu_count() or 1)
+EVALUATION_DPI = 150  # per-model evaluation grids: 2100px wide at 14in
+SCATTER_POINT_THRESHOLD = 1000  # above this, scatter panels are drawn as hexbins
+
+# Analytics aggregates (served statically by the web app)
+ANALYTICS_EXPORT_DIR = PROJECT_ROOT.parent / 'public' / 'data' / 'analytics'
+CUBE_DIR = CACHE_DIR / 'cube'
+CUBE_DIMENSIONS = ['nationality', 'processing_center', 'month', 'naics_title']
+CUBE_BIN_DAYS = 5
+CUBE_MAX_DAYS = 730
+ANALYTICS_TOP_N = 10
+EDA_CUBE_DIMENSIONS = ['nationality', 'naics_title', 'application_date_month', 'visa_status']
+
+# Batch scoring (run_batch_scoring.py)
+BATCH_CHUNK_SIZE = 50000
+BATCH_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+BATCH_ID_COLUMNS = ['applicant_id']  # copied through to the output when present
+
+# Prediction cache (src.prediction_cache.CachedPredictor)
+PREDICTION_CACHE_SIZE = 10000  # entries kept before least-recently-used eviction
+PREDICTION_CACHE_TTL = 3600  # seconds an entry stays valid; None never expires
+PREDICTION_CACHE_SALARY_BUCKET = None  # e.g. 1000: round annual_income_usd to the nearest $1,000
+PREDICTION_CACHE_DATE_BUCKET = None  # 'week' or 'month': snap application_date to the period start
+
+# Prediction intervals (split-conformal, calibrated at train time)
+CONFORMAL_LEVELS = [0.8, 0.9, 0.95]
+CONFORMAL_COVERAGE = 0.95  # level served with each prediction
+CONFORMAL_BINS = 5  # predicted-days bins with their own residual quantiles
+CONFORMAL_MIN_BIN_SIZE = 30  # smaller bins fall back to the pooled quantile
+INTERVALS_EXPORT_FILE = ANALYTICS_EXPORT_DIR / 'intervals.json'
+
+# Feature importance (permutation on the test split, optional TreeSHAP)
+IMPORTANCE_SAMPLE_SIZE = 20000  # test rows scored per permutation; None uses them all
+IMPORTANCE_REPEATS = 5
+IMPORTANCE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+IMPORTANCE_SHAP = False  # also compute TreeSHAP contributions (needs the optional shap package)
+IMPORTANCE_SHAP_ROWS = 2000
+IMPORTANCE_CACHE_DIR = CACHE_DIR / 'importance'
+IMPORTANCE_EXPORT_FILE = ANALYTICS_EXPORT_DIR / 'feature_importance.json'
+# Chart colour groups, first matching prefix wins
+IMPORTANCE_CATEGORIES = [
+    ('processing_center', 'location'),
+    ('nationality', 'demographic'),
+    ('visa_status', 'application'),
+    ('annual_income', 'financial'),
+    ('job_info_education', 'qualification'),
+    ('application_date', 'temporal'),
+    ('job_title', 'employment'),
+    ('naics', 'employment')
+]
+
+# Correlation analysis (streaming Pearson, reservoir-sampled Spearman)
+CORRELATION_TARGET = 'processing_time_days'
+CORRELATION_SAMPLE_SIZE = 50000
+CORRELATION_TOP_K = 15
 
 # Logging
 LOG_LEVEL = 'INFO'
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 CONSOLE_OUTPUT = True
 FILE_OUTPUT = True
+LOG_FILE_FORMAT = 'json'  # 'json' (one structured record per line, LOG_FILE with a .jsonl suffix) or 'text' (LOG_FILE)
+LOG_MODULE_LEVELS = {}  # per-module overrides, e.g. {'advanced_feature_engineer': 'WARNING'}
+LOG_RATE_LIMIT = 0  # records per second from a single call site; 0 (default) disables
+TUNING_VERBOSE = 0  # 1 logs every finished search trial
+
+# Import-time budgets (ms, cumulative -X importtime) checked by run_import_benchmark.py
+IMPORT_TIME_BUDGET_MS = {
+    'src.config': 20,
+    'src.logger': 40,
+    'src.predictor': 50,
+    'src.prediction_cache': 50,
+    'src.model_trainer': 250,
+    'src.model_evaluator': 250,
+    'src.eda': 250,
+    'src.visualizations': 250,
+    'src.hyperparameter_tuning': 250
+}
 
-# Ensure directories exist
-for directory in [RAW_DATA_DIR, PROCESSED_DATA_DIR, REPORTS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+def ensure_directories():
+    """Create the data directories; called by entry points rather than on import"""
+    for directory in [RAW_DATA_DIR, PROCESSED_DATA_DIR, REPORTS_DIR, CACHE_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
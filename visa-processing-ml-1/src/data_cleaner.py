@@ -2,7 +2,8 @@ import pandas as pd
 import numpy as np
 import re
 from src.logger import logger
-from src.config import MISSING_VALUE_THRESHOLD, OUTLIER_METHOD
+from src.config import MISSING_VALUE_THRESHOLD, OUTLIER_METHOD, US_STATES, STATE_COLUMNS
+from src.state_normalizer import StateNormalizer
 
 class DataCleaner:
     """Advanced data cleaning with data quality fixes"""
@@ -12,21 +13,8 @@ class DataCleaner:
         self.cleaning_log = {}
         
         # State abbreviation to full name mapping
-        self.state_mapping = {
-            'AL': 'ALABAMA', 'AK': 'ALASKA', 'AZ': 'ARIZONA', 'AR': 'ARKANSAS',
-            'CA': 'CALIFORNIA', 'CO': 'COLORADO', 'CT': 'CONNECTICUT', 'DE': 'DELAWARE',
-            'FL': 'FLORIDA', 'GA': 'GEORGIA', 'HI': 'HAWAII', 'ID': 'IDAHO',
-            'IL': 'ILLINOIS', 'IN': 'INDIANA', 'IA': 'IOWA', 'KS': 'KANSAS',
-            'KY': 'KENTUCKY', 'LA': 'LOUISIANA', 'ME': 'MAINE', 'MD': 'MARYLAND',
-            'MA': 'MASSACHUSETTS', 'MI': 'MICHIGAN', 'MN': 'MINNESOTA', 'MS': 'MISSISSIPPI',
-            'MO': 'MISSOURI', 'MT': 'MONTANA', 'NE': 'NEBRASKA', 'NV': 'NEVADA',
-            'NH': 'NEW HAMPSHIRE', 'NJ': 'NEW JERSEY', 'NM': 'NEW MEXICO', 'NY': 'NEW YORK',
-            'NC': 'NORTH CAROLINA', 'ND': 'NORTH DAKOTA', 'OH': 'OHIO', 'OK': 'OKLAHOMA',
-            'OR': 'OREGON', 'PA': 'PENNSYLVANIA', 'RI': 'RHODE ISLAND', 'SC': 'SOUTH CAROLINA',
-            'SD': 'SOUTH DAKOTA', 'TN': 'TENNESSEE', 'TX': 'TEXAS', 'UT': 'UTAH',
-            'VT': 'VERMONT', 'VA': 'VIRGINIA', 'WA': 'WASHINGTON', 'WV': 'WEST VIRGINIA',
-            'WI': 'WISCONSIN', 'WY': 'WYOMING'
-        }
+        self.state_mapping = US_STATES
+        self.state_normalizer = None
     
     def clean_salary(self):
         """Clean salary column - handle format issues and unrealistic values"""
@@ -95,20 +83,21 @@ class DataCleaner:
         """Standardize state abbreviations to full names"""
         logger.info("\n[STEP 2C] Standardizing state names...")
         
-        state_cols = [col for col in self.df.columns if 'state' in col.lower()]
+        state_cols = [col for col in self.df.columns
+                      if 'state' in col.lower() or col in STATE_COLUMNS]
+        
+        if self.state_normalizer is None:
+            self.state_normalizer = StateNormalizer(states=self.state_mapping)
         
         for col in state_cols:
             if col not in self.df.columns:
                 continue
             
-            # Convert to uppercase for matching
-            self.df[col] = self.df[col].str.upper()
-            
-            # Replace abbreviations with full names
-            self.df[col] = self.df[col].map(lambda x: self.state_mapping.get(x, x) if pd.notna(x) else x)
-            
-            converted = sum(self.df[col].isin(self.state_mapping.values()))
-            logger.info(f"  ✓ Converted state abbreviations in '{col}'")
+            # Resolve distinct spellings once and broadcast back to every row
+            self.df[col] = self.state_normalizer.normalize(self.df[col])
+            logger.info(f"  ✓ Standardized state names in '{col}'")
+        
+        self.state_normalizer.save()
     
     def clean_missing_values(self):
         """Handle missing values intelligently"""
@@ -1,7 +1,8 @@
 import pandas as pd
 import json
-from src.config import RAW_DATA_FILE, REPORTS_DIR
+from src.config import RAW_DATA_FILE, REPORTS_DIR, CHUNK_SIZE
 from src.logger import logger
+from src.data_profiler import DataProfile
 
 class DataLoader:
     """Load and analyze data quality"""
@@ -10,13 +11,24 @@ class DataLoader:
         self.file_path = file_path
         self.df = None
         self.metadata = {}
+        self.profile = None
     
-    def load_data(self):
+    def iter_chunks(self, chunk_size=CHUNK_SIZE, rule_engine=None):
+        """Stream the CSV in chunks, profiling each one and applying rules inline"""
+        self.profile = DataProfile()
+        for chunk in pd.read_csv(self.file_path, chunksize=chunk_size):
+            self.profile.update(chunk)
+            if rule_engine is not None:
+                chunk = rule_engine.split(chunk)
+            yield chunk
+    
+    def load_data(self, rule_engine=None):
         """Load CSV data"""
         logger.info(f"Loading data from {self.file_path}...")
         
         try:
-            self.df = pd.read_csv(self.file_path)
+            chunks = list(self.iter_chunks(rule_engine=rule_engine))
+            self.df = pd.concat(chunks) if len(chunks) > 1 else chunks[0]
             logger.info(f"✓ Data loaded successfully!")
             logger.info(f"  Shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns")
             return self.df
@@ -35,35 +47,40 @@ class DataLoader:
             logger.error("No data loaded")
             return
         
-        missing_data = self.df.isnull().sum()
-        missing_pct = (missing_data / len(self.df)) * 100
+        profile = self.get_profile()
+        missing_data = profile.null_counts
+        missing_pct = profile.missing_pct
         
         logger.info("\n  Missing Values:")
-        total_missing = 0
-        for col in self.df.columns:
+        for col in profile.columns:
             if missing_data[col] > 0:
                 logger.info(f"    {col}: {missing_data[col]} ({missing_pct[col]:.2f}%)")
-                total_missing += missing_data[col]
         
-        logger.info(f"  Total missing: {total_missing}")
+        logger.info(f"  Total missing: {profile.total_missing}")
         
         logger.info("\n  Data Types:")
-        for col, dtype in self.df.dtypes.items():
+        for col, dtype in profile.dtypes.items():
             logger.info(f"    {col}: {dtype}")
         
-        duplicates = self.df.duplicated().sum()
+        duplicates = profile.duplicate_rows
         logger.info(f"\n  Duplicate rows: {duplicates}")
         
         self.metadata = {
-            'total_rows': len(self.df),
-            'total_columns': len(self.df.columns),
-            'missing_values': missing_data.to_dict(),
+            'total_rows': profile.total_rows,
+            'total_columns': len(profile.columns),
+            'missing_values': dict(missing_data),
             'duplicate_rows': duplicates,
-            'data_types': self.df.dtypes.astype(str).to_dict()
+            'data_types': dict(profile.dtypes)
         }
         
         return self.df
     
+    def get_profile(self):
+        """Return the cached data quality profile, building it on first use"""
+        if self.profile is None and self.df is not None:
+            self.profile = DataProfile.from_dataframe(self.df)
+        return self.profile
+    
     def get_df(self):
         """Return dataframe"""
         return self.df
\ No newline at end of file
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+from src.config import PROFILE_SKETCH_SIZE, PROFILE_MAX_HISTOGRAM_VALUES, PROFILE_MAX_TRACKED_ROWS
+
+_HASH_SPACE = float(2 ** 64)
+
+
+class DataProfile:
+    """Single-pass, chunk-capable data quality profile"""
+
+    def __init__(self, sketch_size=PROFILE_SKETCH_SIZE, max_histogram_values=PROFILE_MAX_HISTOGRAM_VALUES,
+                 max_tracked_rows=PROFILE_MAX_TRACKED_ROWS):
+        self.sketch_size = sketch_size
+        self.max_histogram_values = max_histogram_values
+        self.max_tracked_rows = max_tracked_rows
+        self.total_rows = 0
+        self.columns = []
+        self.null_counts = {}
+        self.dtypes = {}
+        self.min_values = {}
+        self.max_values = {}
+        self.histograms = {}
+        self._duplicate_count = 0
+        self._sketches = {}
+        self._row_hashes = set()
+        self._row_sketch = np.empty(0, dtype=np.uint64)
+
+    @classmethod
+    def from_dataframe(cls, df, chunk_size=None, **kwargs):
+        """Profile a dataframe, optionally walking it in row chunks"""
+        profile = cls(**kwargs)
+        if not chunk_size or len(df) <= chunk_size:
+            profile.update(df)
+            return profile
+
+        for start in range(0, len(df), chunk_size):
+            profile.update(df.iloc[start:start + chunk_size])
+        return profile
+
+    def update(self, chunk):
+        """Fold one chunk of rows into the profile"""
+        if not self.columns:
+            self.columns = list(chunk.columns)
+
+        self.total_rows += len(chunk)
+
+        nulls = chunk.isna().sum()
+        for col in chunk.columns:
+            self.null_counts[col] = self.null_counts.get(col, 0) + int(nulls[col])
+            self._update_dtype(col, chunk[col].dtype)
+            self._update_range(col, chunk[col])
+            self._update_values(col, chunk[col])
+
+        self._update_duplicates(chunk)
+        return self
+
+    def _update_dtype(self, col, dtype):
+        """Merge the dtype seen in this chunk with earlier chunks"""
+        previous = self.dtypes.get(col)
+        current = str(dtype)
+        if previous is None or previous == current:
+            self.dtypes[col] = current
+        elif pd.api.types.is_numeric_dtype(previous) and pd.api.types.is_numeric_dtype(dtype):
+            self.dtypes[col] = str(np.result_type(previous, dtype))
+        else:
+            self.dtypes[col] = 'object'
+
+    def _update_range(self, col, values):
+        """Track running min/max for numeric and datetime columns"""
+        if not (pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values)):
+            return
+        if pd.api.types.is_bool_dtype(values) or values.notna().sum() == 0:
+            return
+
+        chunk_min, chunk_max = values.min(), values.max()
+        self.min_values[col] = chunk_min if col not in self.min_values else min(self.min_values[col], chunk_min)
+        self.max_values[col] = chunk_max if col not in self.max_values else max(self.max_values[col], chunk_max)
+
+    def _update_values(self, col, values):
+        """Update the value histogram and distinct-count sketch from the chunk's unique values"""
+        if col in self.histograms and self.histograms[col] is None:
+            uniques = pd.Series(values.dropna().unique())
+        else:
+            counts = values.value_counts(dropna=True)
+            merged = counts if col not in self.histograms else self.histograms[col].add(counts, fill_value=0)
+            self.histograms[col] = merged if len(merged) <= self.max_histogram_values else None
+            uniques = counts.index.to_series()
+
+        if len(uniques) == 0:
+            self._sketches.setdefault(col, np.empty(0, dtype=np.uint64))
+            return
+
+        # K-minimum-values sketch over 64-bit hashes of the distinct values
+        hashes = pd.util.hash_pandas_object(uniques, index=False).to_numpy()
+        previous = self._sketches.get(col, np.empty(0, dtype=np.uint64))
+        self._sketches[col] = np.union1d(previous, hashes)[:self.sketch_size]
+
+    def _update_duplicates(self, chunk):
+        """Count rows whose content hash was already seen in this or an earlier chunk"""
+        if len(chunk) == 0:
+            return
+
+        hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+        smallest = np.unique(hashes)[:self.sketch_size]
+        self._row_sketch = np.union1d(self._row_sketch, smallest)[:self.sketch_size]
+        if self._row_hashes is None:
+            return
+
+        # Every row that adds no new hash to the set is a duplicate
+        seen = self._row_hashes
+        before = len(seen)
+        seen.update(hashes.tolist())
+        self._duplicate_count += len(hashes) - (len(seen) - before)
+        if len(seen) > self.max_tracked_rows:
+            self._row_hashes = None
+
+    def _estimate_distinct(self, sketch):
+        """Distinct count from a KMV sketch (exact below the sketch size)"""
+        if len(sketch) < self.sketch_size:
+            return len(sketch)
+        kth = float(sketch[-1]) / _HASH_SPACE
+        return int(round((self.sketch_size - 1) / kth))
+
+    @property
+    def duplicate_rows(self):
+        """Duplicate rows (exact up to max_tracked_rows distinct rows, estimated above)"""
+        if self._row_hashes is not None:
+            return self._duplicate_count
+        estimate = self.total_rows - self._estimate_distinct(self._row_sketch)
+        return max(self._duplicate_count, estimate)
+
+    @property
+    def total_missing(self):
+        """Total number of missing cells"""
+        return int(sum(self.null_counts.values()))
+
+    @property
+    def missing_pct(self):
+        """Missing cells per column as a percentage of rows"""
+        if self.total_rows == 0:
+            return {col: 0.0 for col in self.columns}
+        return {col: (count / self.total_rows) * 100 for col, count in self.null_counts.items()}
+
+    @property
+    def distinct_counts(self):
+        """Distinct non-null values per column (exact below the sketch size, estimated above)"""
+        return {col: self._estimate_distinct(self._sketches.get(col, np.empty(0, dtype=np.uint64)))
+                for col in self.columns}
+
+    def to_dict(self):
+        """Return a JSON-friendly summary of the profile"""
+        return {
+            'total_rows': self.total_rows,
+            'total_columns': len(self.columns),
+            'missing_values': {col: int(count) for col, count in self.null_counts.items()},
+            'duplicate_rows': self.duplicate_rows,
+            'data_types': dict(self.dtypes),
+            'distinct_counts': self.distinct_counts,
+            'min_values': {col: str(val) for col, val in self.min_values.items()},
+            'max_values': {col: str(val) for col, val in self.max_values.items()}
+        }
\ No newline at end of file
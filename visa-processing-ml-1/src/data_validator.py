@@ -1,6 +1,8 @@
 import pandas as pd
 import json
 from src.logger import logger
+from src.data_profiler import DataProfile
+from src.rule_engine import RuleEngine
 
 class DataValidator:
     """Validate data quality"""
@@ -8,12 +10,48 @@ class DataValidator:
     def __init__(self, df):
         self.df = df.copy()
         self.validation_report = {}
+        self._profile = None
+    
+    @property
+    def profile(self):
+        """Profile the dataframe once and share it across all checks"""
+        if self._profile is None:
+            self._profile = DataProfile.from_dataframe(self.df)
+        return self._profile
+    
+    def validate_rules(self, engine=None):
+        """Check business rules and quarantine violating rows"""
+        logger.info("\n[STEP 9] Validating business rules...")
+        
+        engine = engine or RuleEngine()
+        initial_rows = len(self.df)
+        self.df = engine.split(self.df)
+        engine.log_summary()
+        
+        if len(self.df) != initial_rows:
+            # Rows were quarantined, so the cached profile no longer describes the frame
+            self._profile = None
+            logger.info(f"  Quarantined rows written to: {engine.quarantine_file}")
+        else:
+            logger.info("  ✓ All rows satisfy the validation rules!")
+        
+        self.validation_report['rules'] = engine.summary()
+        return engine.rows_rejected == 0
+    
+    def record_rules(self, engine):
+        """Report rules the loader already applied at ingest (DataLoader.load_data(rule_engine=...))"""
+        logger.info("\n[STEP 9] Business rules (applied at ingest)...")
+        engine.log_summary()
+        if engine.rows_rejected:
+            logger.info(f"  Quarantined rows written to: {engine.quarantine_file}")
+        self.validation_report['rules'] = engine.summary()
+        return engine.rows_rejected == 0
     
     def validate_completeness(self):
         """Check data completeness"""
-        logger.info("\n[STEP 9] Validating data completeness...")
+        logger.info("\n[STEP 10] Validating data completeness...")
         
-        missing_count = self.df.isnull().sum().sum()
+        missing_count = self.profile.total_missing
         logger.info(f"  Missing values: {missing_count}")
         
         if missing_count == 0:
@@ -24,9 +62,9 @@ class DataValidator:
     
     def validate_consistency(self):
         """Check data consistency"""
-        logger.info("\n[STEP 10] Validating data consistency...")
+        logger.info("\n[STEP 11] Validating data consistency...")
         
-        duplicates = self.df.duplicated().sum()
+        duplicates = self.profile.duplicate_rows
         logger.info(f"  Duplicate rows: {duplicates}")
         
         if duplicates == 0:
@@ -37,23 +75,25 @@ class DataValidator:
     
     def validate_schema(self):
         """Check schema consistency"""
-        logger.info("\n[STEP 11] Validating schema:")
+        logger.info("\n[STEP 12] Validating schema:")
         
-        for col in self.df.columns:
-            logger.info(f"    {col}: {self.df[col].dtype}")
+        for col, dtype in self.profile.dtypes.items():
+            logger.info(f"    {col}: {dtype}")
         
-        self.validation_report['schema'] = self.df.dtypes.astype(str).to_dict()
+        self.validation_report['schema'] = dict(self.profile.dtypes)
         return True
     
     def generate_report(self):
         """Generate final validation report"""
+        profile = self.profile
         report = {
-            'total_rows': len(self.df),
-            'total_columns': len(self.df.columns),
-            'missing_values': self.validation_report.get('missing_values', 0),
-            'duplicate_rows': self.validation_report.get('duplicate_rows', 0),
-            'schema': self.validation_report.get('schema', {}),
-            'status': 'PASSED' if self.df.isnull().sum().sum() == 0 else 'FAILED'
+            'total_rows': profile.total_rows,
+            'total_columns': len(profile.columns),
+            'missing_values': self.validation_report.get('missing_values', profile.total_missing),
+            'duplicate_rows': self.validation_report.get('duplicate_rows', profile.duplicate_rows),
+            'schema': self.validation_report.get('schema', dict(profile.dtypes)),
+            'rules': self.validation_report.get('rules', {}),
+            'status': 'PASSED' if profile.total_missing == 0 else 'FAILED'
         }
         
         logger.info("\n" + "="*60)
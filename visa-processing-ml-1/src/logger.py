@@ -1,11 +1,20 @@
+import atexit
+import copy
+import json
 import logging
+import os
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from src.config import LOG_FILE, LOG_LEVEL, LOG_FORMAT
+from queue import SimpleQueue
+from src.config import (
+    LOG_FILE, LOG_LEVEL, LOG_FORMAT, CONSOLE_OUTPUT, FILE_OUTPUT,
+    LOG_FILE_FORMAT, LOG_MODULE_LEVELS, LOG_RATE_LIMIT
+)
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
-    
+
     COLORS = {
         'DEBUG': '\033[36m',
         'INFO': '\033[92m',
@@ -14,33 +23,150 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[95m',
         'RESET': '\033[0m'
     }
-    
+
     def format(self, record):
+        # Color a copy: the same record is formatted again by the file handler
         log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
+        record = logging.makeLogRecord(record.__dict__)
         record.msg = f"{log_color}{record.msg}{self.COLORS['RESET']}"
         return super().format(record)
 
+class JsonFormatter(logging.Formatter):
+    """One structured JSON object per line for the log file"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'line': record.lineno,
+            'process': record.process,
+            'message': record.getMessage().strip()
+        }
+        if getattr(record, 'suppressed', 0):
+            entry['suppressed'] = record.suppressed
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        elif record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class RecordQueueHandler(QueueHandler):
+    """Enqueue records with the traceback kept in exc_text for the formatters to place"""
+
+    def prepare(self, record):
+        # The stock prepare() folds the traceback into the message and drops exc_info and exc_text
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+class LazyFileHandler(logging.FileHandler):
+    """File handler that opens (and creates the log directory) on the first record"""
+
+    def __init__(self, filename, encoding='utf-8'):
+        super().__init__(filename, encoding=encoding, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+class ModuleLevelFilter(logging.Filter):
+    """Apply LOG_MODULE_LEVELS overrides, keyed by the emitting module's file name"""
+
+    def __init__(self, levels, default):
+        super().__init__()
+        self.levels = levels
+        self.default = default
+
+    def filter(self, record):
+        return record.levelno >= self.levels.get(record.module, self.default)
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket per call site; warnings and errors always pass"""
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+        self.sites = {}
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.pathname, record.lineno)
+        tokens, last, suppressed = self.sites.get(key, (self.rate, record.created, 0))
+        tokens = min(self.rate, tokens + (record.created - last) * self.rate)
+        if tokens < 1:
+            self.sites[key] = (tokens, record.created, suppressed + 1)
+            return False
+
+        if suppressed:
+            record.suppressed = suppressed
+            record.msg = f"{record.msg} [{suppressed} similar messages suppressed]"
+        self.sites[key] = (tokens - 1, record.created, 0)
+        return True
+
+def _level(value):
+    return value if isinstance(value, int) else logging.getLevelName(value.upper())
+
+def _start_listener(queue_handler, handlers):
+    """Drain the queue on a background thread; stopping it flushes what is left"""
+    queue_handler.queue = SimpleQueue()
+    listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+def _restart_in_child(queue_handler, handlers):
+    """A forked worker inherits the queue but not the writer thread"""
+    listener = _start_listener(queue_handler, handlers)
+    # Pool workers leave through multiprocessing's exit path, which skips atexit
+    util = sys.modules.get('multiprocessing.util')
+    if util is not None:
+        util.Finalize(None, listener.stop, exitpriority=0)
+
 def setup_logger(name, log_file=None, log_level=LOG_LEVEL):
-    """Setup logger with console and file handlers"""
-    
+    """Setup logger: callers enqueue records, a listener thread writes console and file output"""
+
     logger = logging.getLogger(name)
-    logger.setLevel(log_level)
-    
+    default = _level(log_level)
+    module_levels = {module: _level(level) for module, level in LOG_MODULE_LEVELS.items()}
+    logger.setLevel(min([default, *module_levels.values()]))
+
+    handlers = []
+
     # Console handler with UTF-8 encoding
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
-    console_formatter = ColoredFormatter(LOG_FORMAT)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
+    if CONSOLE_OUTPUT:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(ColoredFormatter(LOG_FORMAT))
+        handlers.append(console_handler)
+
     # File handler with UTF-8 encoding
-    if log_file:
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(log_level)
-        file_formatter = logging.Formatter(LOG_FORMAT)
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-    
+    if log_file and FILE_OUTPUT:
+        # JSON lines go to their own file so parsers never meet text records from earlier runs
+        if LOG_FILE_FORMAT == 'json':
+            file_handler = LazyFileHandler(Path(log_file).with_suffix('.jsonl'), encoding='utf-8')
+            file_handler.setFormatter(JsonFormatter())
+        else:
+            file_handler = LazyFileHandler(log_file, encoding='utf-8')
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(file_handler)
+
+    # Filtering happens on the caller's side so dropped records never reach the queue
+    queue_handler = RecordQueueHandler(SimpleQueue())
+    queue_handler.addFilter(ModuleLevelFilter(module_levels, default))
+    if LOG_RATE_LIMIT:
+        queue_handler.addFilter(RateLimitFilter(LOG_RATE_LIMIT))
+    logger.addHandler(queue_handler)
+
+    _start_listener(queue_handler, handlers)
+    os.register_at_fork(after_in_child=lambda: _restart_in_child(queue_handler, handlers))
+
     return logger
 
-logger = setup_logger('VisaProcessing', log_file=LOG_FILE)
+logger = setup_logger('VisaProcessing', log_file=LOG_FILE)
\ No newline at end of file
@@ -1,10 +1,11 @@
 import json
 from src.logger import logger
-from src.config import PROCESSED_DATA_FILE, REPORT_FILE
+from src.config import PROCESSED_DATA_FILE, REPORT_FILE, ensure_directories
 from src.data_loader import DataLoader
 from src.data_cleaner import DataCleaner
 from src.feature_engineer import FeatureEngineer
 from src.data_validator import DataValidator
+from src.rule_engine import RuleEngine
 
 class DataPipeline:
     """Main data processing pipeline"""
@@ -18,12 +19,15 @@ class DataPipeline:
         logger.info("\n" + "="*70)
         logger.info("MILESTONE 1: ADVANCED DATA PREPROCESSING PIPELINE")
         logger.info("="*70)
+        ensure_directories()
         
         try:
             # Stage 1: Load
             logger.info("\n📥 STAGE 1: LOAD")
+            # Rule violations are quarantined chunk by chunk, before any cleaning or feature work
+            rule_engine = RuleEngine()
             loader = DataLoader()
-            self.df = loader.load_data()
+            self.df = loader.load_data(rule_engine=rule_engine)
             loader.analyze_quality()
             
             # Stage 2: Advanced Clean
@@ -46,10 +50,12 @@ class DataPipeline:
             # Stage 4: Validate
             logger.info("\n✅ STAGE 4: VALIDATE")
             validator = DataValidator(self.df)
+            validator.record_rules(rule_engine)
             validator.validate_completeness()
             validator.validate_consistency()
             validator.validate_schema()
             self.report = validator.generate_report()
+            self.df = validator.get_validated_df()
             
             # Stage 5: Export
             logger.info("\n💾 STAGE 5: EXPORT")
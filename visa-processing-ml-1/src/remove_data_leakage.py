@@ -1,6 +1,6 @@
 import pandas as pd
 from src.logger import logger
-from src.config import PROCESSED_DATA_FILE, PROCESSED_DATA_DIR
+from src.config import PROCESSED_DATA_FILE, ML_READY_FILE, ensure_directories
 
 class DataLeakageRemover:
     """Remove data leakage from processed dataset"""
@@ -80,7 +80,7 @@ class DataLeakageRemover:
     
     def export_ml_ready_data(self):
         """Export ML-ready dataset"""
-        output_file = PROCESSED_DATA_DIR / 'visa_applications_ml_ready.csv'
+        output_file = ML_READY_FILE
         
         logger.info(f"\n" + "-"*70)
         logger.info("EXPORTING ML-READY DATASET")
@@ -97,6 +97,7 @@ class DataLeakageRemover:
         logger.info("\n" + "="*70)
         logger.info("MILESTONE 1.5: DATA LEAKAGE REMOVAL")
         logger.info("="*70)
+        ensure_directories()
         
         self.load_processed_data()
         self.remove_data_leakage()
@@ -0,0 +1,170 @@
+import operator
+import re
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import VALIDATION_RULES, QUARANTINE_FILE
+from src.state_normalizer import StateNormalizer
+
+_COMPARISONS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne
+}
+
+
+def _as_numeric(values):
+    """Coerce a column to numbers as DataCleaner reads them ("1,09,600.00" -> 109600.0), unparseable -> NaN"""
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    return pd.to_numeric(values.astype(str).str.replace(',', '', regex=False), errors='coerce')
+
+
+def _as_datetime(values):
+    """Coerce a column to datetimes, leaving unparseable values as NaT"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors='coerce', dayfirst=True)
+
+
+class ValidationRule:
+    """A declarative column constraint compiled into a vectorized failure mask"""
+
+    def __init__(self, spec):
+        self.spec = dict(spec)
+        self.name = spec['name']
+        self.kind = spec['type']
+        self.columns = self._required_columns()
+        self._check = self._compile()
+
+    def _required_columns(self):
+        if self.kind == 'compare':
+            return [self.spec['left'], self.spec['right']]
+        return [self.spec['column']]
+
+    def _compile(self):
+        """Build the mask function once so evaluation is a single vectorized call"""
+        spec = self.spec
+
+        if self.kind == 'range':
+            low, high = spec.get('min'), spec.get('max')
+
+            def check(df):
+                values = _as_numeric(df[spec['column']])
+                failed = pd.Series(False, index=df.index)
+                if low is not None:
+                    failed |= values < low
+                if high is not None:
+                    failed |= values > high
+                return failed
+
+        elif self.kind == 'enum':
+            allowed = pd.Index(spec['values'])
+            normalizer = StateNormalizer() if spec.get('normalize') == 'state' else None
+
+            def check(df):
+                values = df[spec['column']]
+                matched = values if normalizer is None else normalizer.normalize(values, verbose=False)
+                return values.notna() & ~matched.isin(allowed)
+
+        elif self.kind == 'regex':
+            pattern = re.compile(spec['pattern'])
+
+            def check(df):
+                values = df[spec['column']]
+                matched = values.astype(str).str.match(pattern)
+                return values.notna() & ~matched.fillna(False).astype(bool)
+
+        elif self.kind == 'compare':
+            compare = _COMPARISONS[spec['op']]
+            coerce = _as_datetime if spec.get('kind') == 'date' else _as_numeric
+
+            def check(df):
+                left, right = coerce(df[spec['left']]), coerce(df[spec['right']])
+                return left.notna() & right.notna() & ~compare(left, right)
+
+        else:
+            raise ValueError(f"Unknown rule type '{self.kind}' for rule '{self.name}'")
+
+        return check
+
+    def applies_to(self, df):
+        """Rules whose columns are absent from the frame are skipped"""
+        return all(col in df.columns for col in self.columns)
+
+    def evaluate(self, df):
+        """Return a boolean mask of rows that violate the rule"""
+        return self._check(df).to_numpy(dtype=bool)
+
+
+class RuleEngine:
+    """Evaluate compiled validation rules chunk by chunk and quarantine rejected rows"""
+
+    def __init__(self, rules=VALIDATION_RULES, quarantine_file=QUARANTINE_FILE):
+        self.rules = [ValidationRule(spec) for spec in rules]
+        self.quarantine_file = quarantine_file
+        self.rows_checked = 0
+        self.rows_rejected = 0
+        self.rule_counts = {rule.name: 0 for rule in self.rules}
+        self.failing_rows = {rule.name: [] for rule in self.rules}
+        self._quarantine_started = False
+
+    def evaluate(self, chunk):
+        """Evaluate every applicable rule in one pass and return a rows x rules failure frame"""
+        active = [rule for rule in self.rules if rule.applies_to(chunk)]
+        masks = np.zeros((len(chunk), len(active)), dtype=bool)
+        for i, rule in enumerate(active):
+            masks[:, i] = rule.evaluate(chunk)
+
+        failures = pd.DataFrame(masks, index=chunk.index, columns=[rule.name for rule in active])
+
+        self.rows_checked += len(chunk)
+        for i, rule in enumerate(active):
+            if masks[:, i].any():
+                self.rule_counts[rule.name] += int(masks[:, i].sum())
+                self.failing_rows[rule.name].extend(chunk.index[masks[:, i]].tolist())
+
+        return failures
+
+    def split(self, chunk):
+        """Return the rows that pass every rule, writing the rest to the quarantine file"""
+        failures = self.evaluate(chunk)
+        rejected = failures.any(axis=1).to_numpy()
+
+        if rejected.any():
+            self.rows_rejected += int(rejected.sum())
+            self._quarantine(chunk[rejected], failures[rejected])
+
+        return chunk[~rejected]
+
+    def _quarantine(self, rows, failures):
+        """Append rejected rows, tagged with the rules they broke"""
+        if self.quarantine_file is None:
+            return
+
+        rows = rows.copy()
+        labels = pd.Series([f"{name};" for name in failures.columns], index=failures.columns)
+        rows['failed_rules'] = failures.dot(labels).str.rstrip(';')
+
+        mode = 'a' if self._quarantine_started else 'w'
+        rows.to_csv(self.quarantine_file, mode=mode, header=not self._quarantine_started, index_label='row_index')
+        self._quarantine_started = True
+
+    def summary(self):
+        """Return per-rule failure counts and the rejected row total"""
+        return {
+            'rows_checked': self.rows_checked,
+            'rows_rejected': self.rows_rejected,
+            'rule_failures': dict(self.rule_counts),
+            'quarantine_file': str(self.quarantine_file) if self._quarantine_started else None
+        }
+
+    def log_summary(self):
+        """Log per-rule failure counts"""
+        for name, count in self.rule_counts.items():
+            status = '✓' if count == 0 else '✗'
+            logger.info(f"  {status} {name}: {count} failing rows")
+        logger.info(f"  Rows rejected: {self.rows_rejected} of {self.rows_checked}")
\ No newline at end of file
@@ -0,0 +1,94 @@
+import difflib
+import hashlib
+import json
+import re
+import numpy as np
+import pandas as pd
+from src.logger import logger
+from src.config import US_STATES, STATE_ALIASES, STATE_CACHE_FILE, STATE_FUZZY_CUTOFF
+
+# Bump when resolve() changes so memos written by the old rules are discarded
+_RESOLVER_VERSION = 2
+
+
+class StateNormalizer:
+    """Normalize state spellings on distinct values only, memoized across runs"""
+
+    def __init__(self, states=US_STATES, aliases=STATE_ALIASES, cache_file=STATE_CACHE_FILE,
+                 fuzzy_cutoff=STATE_FUZZY_CUTOFF):
+        self.states = states
+        self.aliases = aliases
+        self.cache_file = cache_file
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.state_names = sorted(set(states.values()))
+        self._name_set = set(self.state_names)
+        self._version = self._table_version()
+        self.memo = self._load_memo()
+        self._dirty = False
+
+    def _table_version(self):
+        """Fingerprint the lookup tables so a stale memo is discarded"""
+        payload = json.dumps([self.states, self.aliases, self.fuzzy_cutoff, _RESOLVER_VERSION], sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _load_memo(self):
+        """Load the persisted normalization dictionary if it matches the current tables"""
+        if self.cache_file is None or not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cached.get('version') != self._version:
+            return {}
+        return cached.get('mapping', {})
+
+    def save(self):
+        """Persist newly resolved spellings"""
+        if not self._dirty or self.cache_file is None:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': self._version, 'mapping': self.memo}, f, indent=2, sort_keys=True)
+        self._dirty = False
+
+    def resolve(self, raw):
+        """Map one raw spelling to a full state name (unknown values are returned trimmed, otherwise unchanged)"""
+        original = str(raw).strip()
+        cleaned = re.sub(r'[^A-Z ]+', ' ', original.upper())
+        cleaned = ' '.join(cleaned.split())
+        compact = cleaned.replace(' ', '')
+
+        if cleaned in self._name_set:
+            return cleaned
+        if compact in self.states:
+            return self.states[compact]
+        if compact in self.aliases:
+            return self.states[self.aliases[compact]]
+
+        match = difflib.get_close_matches(cleaned, self.state_names, n=1, cutoff=self.fuzzy_cutoff)
+        return match[0] if match else original
+
+    def lookup(self, raw):
+        """Resolve a spelling through the memo"""
+        if raw not in self.memo:
+            self.memo[raw] = self.resolve(raw)
+            self._dirty = True
+        return self.memo[raw]
+
+    def normalize(self, values, verbose=True):
+        """Normalize a column by resolving its distinct values and broadcasting through the codes"""
+        codes, uniques = pd.factorize(values)
+        resolved = np.array([self.lookup(str(u)) for u in uniques] + [np.nan], dtype=object)
+
+        # factorize marks missing values with -1, which indexes the trailing NaN
+        normalized = pd.Series(resolved[codes], index=values.index, name=values.name)
+
+        if not verbose:
+            return normalized
+        changed = np.flatnonzero(resolved[:-1] != np.asarray(uniques, dtype=object))
+        rows_changed = int(np.isin(codes, changed).sum())
+        logger.info(f"    {len(uniques)} distinct spellings -> {normalized.nunique()} states "
+                    f"({rows_changed} rows rewritten)")
+        return normalized
\ No newline at end of file
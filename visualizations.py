@@ -1,212 +1,318 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from src.logger import logger
-from src.config import PROCESSED_DATA_DIR
+from src.config import PROCESSED_DATA_DIR, EDA_CUBE_DIMENSIONS, CHUNK_SIZE, CORRELATION_TARGET, CORRELATION_TOP_K
+from src.chart_renderer import ChartRenderer, RenderJob
+from src.aggregation_cube import AggregationCube
+from src.correlation_engine import CorrelationEngine
+
+MONTHS = ["Jan","Feb","Mar","Apr","May","Jun",
+          "Jul","Aug","Sep","Oct","Nov","Dec"]
+
+
+# -------------------------------------------------------
+# Draw functions: build a Figure from precomputed aggregates.
+# matplotlib/seaborn are imported here, in the render worker,
+# so importing this module does not pay for them.
+# -------------------------------------------------------
+def draw_target_distribution(status_counts, total, time_hist):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(14, 5))
+    axes = fig.subplots(1, 2)
+
+    if status_counts is not None:
+        axes[0].bar(status_counts.index, status_counts.values)
+        axes[0].set_title("Visa Status Distribution", fontweight="bold")
+        axes[0].set_ylabel("Count")
+
+        for i, (status, count) in enumerate(status_counts.items()):
+            pct = (count / total) * 100
+            axes[0].text(i, count, f"{pct:.1f}%", ha="center", va="bottom")
+
+    if time_hist is not None:
+        counts, edges = time_hist
+        axes[1].stairs(counts, edges, fill=True)
+        axes[1].set_title("Processing Time Distribution", fontweight="bold")
+        axes[1].set_xlabel("Days")
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_nationality_analysis(top_nat, approval_by_nat):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(15, 6))
+    axes = fig.subplots(1, 2)
+
+    axes[0].barh(top_nat.index, top_nat.values)
+    axes[0].set_title("Top 10 Nationalities by Application Count", fontweight="bold")
+    axes[0].invert_yaxis()
+
+    axes[1].barh(approval_by_nat.index, approval_by_nat.values)
+    axes[1].set_xlim(0, 100)
+    axes[1].set_title("Top 10 Nationalities by Approval Rate", fontweight="bold")
+    axes[1].invert_yaxis()
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_industry_analysis(top_ind, approval_by_ind):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(16, 6))
+    axes = fig.subplots(1, 2)
+
+    axes[0].barh(top_ind.index, top_ind.values)
+    axes[0].set_title("Top 10 Industries by Application Count", fontweight="bold")
+    axes[0].invert_yaxis()
+
+    axes[1].barh(approval_by_ind.index, approval_by_ind.values)
+    axes[1].set_xlim(0, 100)
+    axes[1].set_title("Top 10 Industries by Approval Rate", fontweight="bold")
+    axes[1].invert_yaxis()
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_salary_analysis(salary_hist, salary_by_status):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(14, 5))
+    axes = fig.subplots(1, 2)
+
+    counts, edges = salary_hist
+    axes[0].stairs(counts, edges, fill=True)
+    axes[0].set_title("Salary Distribution", fontweight="bold")
+
+    axes[1].bar(salary_by_status.index, salary_by_status.values)
+    axes[1].set_title("Average Salary by Visa Status", fontweight="bold")
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_temporal_patterns(month_counts, approval_by_month):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(14, 5))
+    axes = fig.subplots(1, 2)
+
+    axes[0].bar(month_counts.index, month_counts.values)
+    axes[0].set_xticks(month_counts.index)
+    axes[0].set_xticklabels([MONTHS[m-1] for m in month_counts.index])
+    axes[0].set_title("Applications by Month", fontweight="bold")
+
+    axes[1].plot(approval_by_month.index, approval_by_month.values, marker="o")
+    axes[1].set_xticks(approval_by_month.index)
+    axes[1].set_xticklabels([MONTHS[m-1] for m in approval_by_month.index])
+    axes[1].set_ylim(0, 100)
+    axes[1].set_title("Approval Rate by Month", fontweight="bold")
+    axes[1].set_ylabel("Approval Rate (%)")
+
+    fig.tight_layout()
+    return fig
+
+
+def draw_correlation_heatmap(corr_matrix):
+    from matplotlib.figure import Figure
+    import seaborn as sns
+
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    annotate = len(corr_matrix) <= 20
+    sns.heatmap(corr_matrix, annot=annotate, fmt=".2f", cmap="coolwarm", center=0, ax=ax)
+    ax.set_title("Feature Correlation Heatmap", fontweight="bold")
+    fig.tight_layout()
+    return fig
 
 
 class Visualizations:
     """Create visualizations for EDA"""
 
-    def __init__(self, df):
-        self.df = df.copy()
-        sns.set_style("whitegrid")
+    def __init__(self, df, cube=None, correlations=None):
+        self.df = df
         self.output_dir = PROCESSED_DATA_DIR
+        self.renderer = ChartRenderer(self.output_dir)
 
-        # Create approved flag
-        if "visa_status" in self.df.columns:
-            self.df["is_approved"] = self.df["visa_status"].str.contains(
-                "Certified", case=False, na=False
-            )
+        # Grouped aggregates shared with ExploratoryDataAnalysis (pass eda.cube to reuse them)
+        self._cube = cube
+        self.correlations = correlations
+
+    @property
+    def cube(self):
+        """Built on first use, so plots that need no aggregates never pay for it"""
+        if self._cube is None:
+            dims = [dim for dim in EDA_CUBE_DIMENSIONS if dim in self.df.columns]
+            self._cube = AggregationCube.from_dataframe(self.df, dimensions=dims)
+        return self._cube
+
+    def _job(self, draw, filename, inputs):
+        return RenderJob(draw, self.output_dir / filename, inputs)
+
+    @staticmethod
+    def _histogram(values, bins=30):
+        counts, edges = np.histogram(values.dropna(), bins=bins)
+        return counts, edges
 
     # -------------------------------------------------------
     # 1. Target Distribution
     # -------------------------------------------------------
-    def plot_target_distribution(self):
-        logger.info("Generating: Target variable distribution...")
-
-        fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    def target_distribution_job(self):
+        status_counts = None
+        time_hist = None
 
         if "visa_status" in self.df.columns:
-            status_counts = self.df["visa_status"].value_counts()
-
-            axes[0].bar(status_counts.index, status_counts.values)
-            axes[0].set_title("Visa Status Distribution", fontweight="bold")
-            axes[0].set_ylabel("Count")
-
-            for i, (status, count) in enumerate(status_counts.items()):
-                pct = (count / len(self.df)) * 100
-                axes[0].text(i, count, f"{pct:.1f}%", ha="center", va="bottom")
+            status_counts = self.cube.rollup(["visa_status"])["applications"]
 
         if "processing_time_days" in self.df.columns:
-            axes[1].hist(self.df["processing_time_days"], bins=30)
-            axes[1].set_title("Processing Time Distribution", fontweight="bold")
-            axes[1].set_xlabel("Days")
+            time_hist = self.cube.time_histogram()
 
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "viz_01_target_distribution.png", dpi=300)
-        plt.close()
+        return self._job(draw_target_distribution, "viz_01_target_distribution.png", {
+            "status_counts": status_counts,
+            "total": len(self.df),
+            "time_hist": time_hist
+        })
+
+    def plot_target_distribution(self):
+        logger.info("Generating: Target variable distribution...")
+        self.renderer.render([self.target_distribution_job()])
 
     # -------------------------------------------------------
     # 2. Nationality Analysis
     # -------------------------------------------------------
-    def plot_nationality_analysis(self):
-        logger.info("Generating: Nationality analysis...")
-
-        if "nationality" not in self.df.columns:
-            return
-
-        fig, axes = plt.subplots(1, 2, figsize=(15, 6))
+    def nationality_analysis_job(self):
+        if "nationality" not in self.df.columns or "visa_status" not in self.df.columns:
+            return None
 
-        top_nat = self.df["nationality"].value_counts().head(10)
-        axes[0].barh(top_nat.index, top_nat.values)
-        axes[0].set_title("Top 10 Nationalities by Application Count", fontweight="bold")
-        axes[0].invert_yaxis()
-
-        approval_by_nat = (
-            self.df.groupby("nationality")["is_approved"]
-            .mean() * 100
-        )
+        by_nat = self.cube.rollup(["nationality"])
+        top_nat = by_nat["applications"].head(10)
 
         # Only include nationalities with enough applications
-        counts = self.df["nationality"].value_counts()
-        valid = counts[counts >= 50].index
-        approval_by_nat = approval_by_nat.loc[valid].sort_values(ascending=False).head(10)
+        valid = by_nat[by_nat["applications"] >= 50]
+        approval_by_nat = valid["approval_rate"].sort_values(ascending=False).head(10)
 
-        axes[1].barh(approval_by_nat.index, approval_by_nat.values)
-        axes[1].set_xlim(0, 100)
-        axes[1].set_title("Top 10 Nationalities by Approval Rate", fontweight="bold")
-        axes[1].invert_yaxis()
+        return self._job(draw_nationality_analysis, "viz_02_nationality_analysis.png", {
+            "top_nat": top_nat,
+            "approval_by_nat": approval_by_nat
+        })
 
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "viz_02_nationality_analysis.png", dpi=300)
-        plt.close()
+    def plot_nationality_analysis(self):
+        logger.info("Generating: Nationality analysis...")
+        self._render_optional(self.nationality_analysis_job())
 
     # -------------------------------------------------------
     # 3. Industry Analysis (FIXED)
     # -------------------------------------------------------
-    def plot_industry_analysis(self):
-        logger.info("Generating: Industry analysis...")
-
-        if "naics_title" not in self.df.columns:
-            return
-
-        fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+    def industry_analysis_job(self):
+        if "naics_title" not in self.df.columns or "visa_status" not in self.df.columns:
+            return None
 
         # Top industries by count
-        top_ind = self.df["naics_title"].value_counts().head(10)
-        axes[0].barh(top_ind.index, top_ind.values)
-        axes[0].set_title("Top 10 Industries by Application Count", fontweight="bold")
-        axes[0].invert_yaxis()
+        by_ind = self.cube.rollup(["naics_title"])
+        top_ind = by_ind["applications"].head(10)
 
         # Filter industries with enough applications
-        industry_counts = self.df["naics_title"].value_counts()
-        valid_industries = industry_counts[industry_counts >= 100].index
-
-        filtered_df = self.df[self.df["naics_title"].isin(valid_industries)]
+        valid = by_ind[by_ind["applications"] >= 100]
+        approval_by_ind = valid["approval_rate"].sort_values(ascending=False).head(10)
 
-        approval_by_ind = (
-            filtered_df.groupby("naics_title")["is_approved"]
-            .mean() * 100
-        ).sort_values(ascending=False).head(10)
+        return self._job(draw_industry_analysis, "viz_03_industry_analysis.png", {
+            "top_ind": top_ind,
+            "approval_by_ind": approval_by_ind
+        })
 
-        axes[1].barh(approval_by_ind.index, approval_by_ind.values)
-        axes[1].set_xlim(0, 100)
-        axes[1].set_title("Top 10 Industries by Approval Rate", fontweight="bold")
-        axes[1].invert_yaxis()
-
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "viz_03_industry_analysis.png", dpi=300)
-        plt.close()
+    def plot_industry_analysis(self):
+        logger.info("Generating: Industry analysis...")
+        self._render_optional(self.industry_analysis_job())
 
     # -------------------------------------------------------
     # 4. Salary Analysis
     # -------------------------------------------------------
-    def plot_salary_analysis(self):
-        logger.info("Generating: Salary analysis...")
-
-        if "annual_income_usd" not in self.df.columns:
-            return
-
-        fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    def salary_analysis_job(self):
+        if "annual_income_usd" not in self.df.columns or "visa_status" not in self.df.columns:
+            return None
 
-        axes[0].hist(self.df["annual_income_usd"], bins=30)
-        axes[0].set_title("Salary Distribution", fontweight="bold")
+        salary_by_status = self.cube.rollup(["visa_status"])["avg_salary"].sort_index()
 
-        salary_by_status = self.df.groupby("visa_status")["annual_income_usd"].mean()
-        axes[1].bar(salary_by_status.index, salary_by_status.values)
-        axes[1].set_title("Average Salary by Visa Status", fontweight="bold")
+        return self._job(draw_salary_analysis, "viz_04_salary_analysis.png", {
+            "salary_hist": self._histogram(self.df["annual_income_usd"]),
+            "salary_by_status": salary_by_status
+        })
 
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "viz_04_salary_analysis.png", dpi=300)
-        plt.close()
+    def plot_salary_analysis(self):
+        logger.info("Generating: Salary analysis...")
+        self._render_optional(self.salary_analysis_job())
 
     # -------------------------------------------------------
     # 5. Temporal Patterns
     # -------------------------------------------------------
-    def plot_temporal_patterns(self):
-        logger.info("Generating: Temporal patterns...")
-
-        if "application_date_month" not in self.df.columns:
-            return
+    def temporal_patterns_job(self):
+        if "application_date_month" not in self.df.columns or "visa_status" not in self.df.columns:
+            return None
 
-        fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+        by_month = self.cube.rollup(["application_date_month"]).sort_index()
+        by_month = by_month[by_month.index.notna()]
+        by_month.index = by_month.index.astype(int)
 
-        month_counts = self.df["application_date_month"].value_counts().sort_index()
-        months = ["Jan","Feb","Mar","Apr","May","Jun",
-                  "Jul","Aug","Sep","Oct","Nov","Dec"]
+        month_counts = by_month["applications"]
+        approval_by_month = by_month["approval_rate"]
 
-        axes[0].bar(month_counts.index, month_counts.values)
-        axes[0].set_xticks(month_counts.index)
-        axes[0].set_xticklabels([months[m-1] for m in month_counts.index])
-        axes[0].set_title("Applications by Month", fontweight="bold")
+        return self._job(draw_temporal_patterns, "viz_05_temporal_patterns.png", {
+            "month_counts": month_counts,
+            "approval_by_month": approval_by_month
+        })
 
-        approval_by_month = (
-            self.df.groupby("application_date_month")["is_approved"]
-            .mean() * 100
-        ).sort_index()
-
-        axes[1].plot(approval_by_month.index, approval_by_month.values, marker="o")
-        axes[1].set_xticks(approval_by_month.index)
-        axes[1].set_xticklabels([months[m-1] for m in approval_by_month.index])
-        axes[1].set_ylim(0, 100)
-        axes[1].set_title("Approval Rate by Month", fontweight="bold")
-        axes[1].set_ylabel("Approval Rate (%)")
-
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "viz_05_temporal_patterns.png", dpi=300)
-        plt.close()
+    def plot_temporal_patterns(self):
+        logger.info("Generating: Temporal patterns...")
+        self._render_optional(self.temporal_patterns_job())
 
     # -------------------------------------------------------
     # 6. Correlation Heatmap
     # -------------------------------------------------------
-    def plot_correlation_heatmap(self):
-        logger.info("Generating: Correlation heatmap...")
+    def correlation_heatmap_job(self):
+        if self.correlations is None:
+            self.correlations = CorrelationEngine.from_dataframe(
+                self.df, chunk_size=CHUNK_SIZE, target=CORRELATION_TARGET)
 
-        numeric_df = self.df.select_dtypes(include=[np.number])
+        corr_matrix = self.correlations.pearson()
+        if len(corr_matrix.columns) <= 1:
+            return None
 
-        if len(numeric_df.columns) > 1:
-            corr_matrix = numeric_df.corr()
+        # Target plus its strongest correlates rather than every numeric column
+        if CORRELATION_TARGET in corr_matrix.columns:
+            top = self.correlations.top_k(CORRELATION_TOP_K).index
+            keep = [CORRELATION_TARGET] + list(top)
+            corr_matrix = corr_matrix.loc[keep, keep]
 
-            plt.figure(figsize=(10, 8))
-            sns.heatmap(corr_matrix, annot=True, fmt=".2f", cmap="coolwarm", center=0)
-            plt.title("Feature Correlation Heatmap", fontweight="bold")
-            plt.tight_layout()
-            plt.savefig(self.output_dir / "viz_06_correlation_heatmap.png", dpi=300)
-            plt.close()
+        return self._job(draw_correlation_heatmap, "viz_06_correlation_heatmap.png", {
+            "corr_matrix": corr_matrix
+        })
+
+    def plot_correlation_heatmap(self):
+        logger.info("Generating: Correlation heatmap...")
+        self._render_optional(self.correlation_heatmap_job())
 
     # -------------------------------------------------------
+    def _render_optional(self, job):
+        if job is not None:
+            self.renderer.render([job])
+
     def generate_all_visualizations(self):
         logger.info("=" * 70)
         logger.info("GENERATING VISUALIZATIONS")
         logger.info("=" * 70)
 
-        self.plot_target_distribution()
-        self.plot_nationality_analysis()
-        self.plot_industry_analysis()
-        self.plot_salary_analysis()
-        self.plot_temporal_patterns()
-        self.plot_correlation_heatmap()
+        jobs = [
+            self.target_distribution_job(),
+            self.nationality_analysis_job(),
+            self.industry_analysis_job(),
+            self.salary_analysis_job(),
+            self.temporal_patterns_job(),
+            self.correlation_heatmap_job()
+        ]
+        self.renderer.render([job for job in jobs if job is not None])
 
         logger.info("✓ ALL VISUALIZATIONS GENERATED")
\ No newline at end of file